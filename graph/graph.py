@@ -103,7 +103,7 @@ class AccessPoint(object):
 class AccessGraph(object):
     __slots__ = ( 'log', 'accessPoints', 'InterAreaTransitions',
                   'EscapeAttributes', 'apCache', '_useCache',
-                  'availAccessPoints' )
+                  'availAccessPoints', 'comeBackCache', 'reverseTransitions' )
 
     def __init__(self, accessPointList, transitions, dotFile=None):
         self.log = utils.log.get('Graph')
@@ -113,6 +113,7 @@ class AccessGraph(object):
             'Timer': None,
             'Animals': None
         }
+        self.reverseTransitions = None
         for ap in accessPointList:
             self.addAccessPoint(ap)
         for srcName, dstName in transitions:
@@ -120,6 +121,7 @@ class AccessGraph(object):
         if dotFile is not None:
             self.toDot(dotFile)
         self.apCache = {}
+        self.comeBackCache = {}
         self._useCache = False
         # store the avail access points to display in vcr
         self.availAccessPoints = {}
@@ -131,6 +133,7 @@ class AccessGraph(object):
 
     def resetCache(self):
         self.apCache = {}
+        self.comeBackCache = {}
 
     def printGraph(self):
         if self.log.getEffectiveLevel() == logging.DEBUG:
@@ -172,6 +175,7 @@ class AccessGraph(object):
         dst = self.accessPoints[dstName]
         src.connect(dstName)
         self.InterAreaTransitions.append((src, dst))
+        self.reverseTransitions = None
         if both is True:
             self.addTransition(dstName, srcName, False)
 
@@ -183,6 +187,7 @@ class AccessGraph(object):
             self.InterAreaTransitions.remove(t)
             src.disconnect()
             dst.disconnect()
+        self.reverseTransitions = None
 
     # availNodes: all already available nodes
     # nodesToCheck: nodes we have to check transitions for
@@ -242,12 +247,12 @@ class AccessGraph(object):
 
         return path
 
-    def getAvailAPPaths(self, availAccessPoints, locsAPs):
+    def getAvailAPPaths(self, availAccessPoints, locsAPs, smbm):
         paths = {}
         for ap in availAccessPoints:
             if ap.Name in locsAPs:
                 path = self.getPath(ap, availAccessPoints)
-                pdiff = SMBool.wandmax(*(availAccessPoints[ap]['difficulty'] for ap in path))
+                pdiff = smbm.wandmax(*(availAccessPoints[ap]['difficulty'] for ap in path))
                 paths[ap.Name] = Path(path, pdiff, len(path))
         return paths
 
@@ -281,7 +286,7 @@ class AccessGraph(object):
                 locsAPs.add(ap)
 
         # sort availAccessPoints based on difficulty to take easier paths first
-        availAPPaths = self.getAvailAPPaths(self.availAccessPoints, locsAPs)
+        availAPPaths = self.getAvailAPPaths(self.availAccessPoints, locsAPs, smbm)
 
         for loc in locations:
             if loc.GraphArea not in availAreas:
@@ -319,7 +324,7 @@ class AccessGraph(object):
                         #if loc.Name == "Kraid":
                         #    print("{} path: {}".format(loc.Name, [a.Name for a in path]))
                         pdiff = availAPPaths[apName].pdiff
-                        (allDiff, locDiff) = self.computeLocDiff(tdiff, diff, pdiff)
+                        (allDiff, locDiff) = self.computeLocDiff(tdiff, diff, pdiff, smbm)
                         if allDiff.bool == True and allDiff.difficulty <= maxDiff:
                             loc.distance = ap.distance + 1
                             loc.accessPoint = apName
@@ -376,6 +381,65 @@ class AccessGraph(object):
         #print("canAccess: {}".format(can))
         return can
 
+    # same result as canAccess, but uses the set of access points from which
+    # destAccessPointName can be reached, which is computed with a single
+    # backward traversal and kept in cache while the cache is used, so
+    # checking the come back from several access points to the same one
+    # only costs one traversal.
+    def canComeBack(self, smbm, srcAccessPointName, destAccessPointName, maxDiff, item=None):
+        if item is not None:
+            smbm.addItem(item)
+        can = srcAccessPointName in self.getComeBackAccessPoints(smbm, destAccessPointName, maxDiff, item)
+        if item is not None:
+            smbm.removeItem(item)
+        return can
+
+    # return the set of access points names from which destAccessPointName can be reached.
+    # the items are part of the cache key and not the item itself, so that adding
+    # an item which doesn't change the items (like Nothing) reuses the result without it.
+    def getComeBackAccessPoints(self, smbm, destAccessPointName, maxDiff, item=None):
+        key = (destAccessPointName, maxDiff, smbm.cacheKey)
+        if self._useCache == True:
+            comeBackNodes = self.comeBackCache.get(key)
+            if comeBackNodes is not None:
+                return comeBackNodes
+        reverseTransitions = self.getReverseTransitions()
+        comeBackNodes = {destAccessPointName}
+        nodesToCheck = [self.accessPoints[destAccessPointName]]
+        while len(nodesToCheck) > 0:
+            newNodes = []
+            for dst in nodesToCheck:
+                for src in reverseTransitions[dst.Name]:
+                    if src.Name in comeBackNodes:
+                        continue
+                    diff = self.getTransitionDifficulty(src, dst, smbm, item)
+                    if diff.bool and diff.difficulty <= maxDiff:
+                        comeBackNodes.add(src.Name)
+                        newNodes.append(src)
+            nodesToCheck = newNodes
+        if self._useCache == True:
+            self.comeBackCache[key] = comeBackNodes
+        return comeBackNodes
+
+    # difficulty of the transition from src to dst, from apCache if it's used
+    def getTransitionDifficulty(self, src, dst, smbm, item=None):
+        if self._useCache == True:
+            diff = self.apCache.get((src, dst, item))
+            if diff is None:
+                diff = src.transitions[dst.Name](smbm)
+                self.apCache[(src, dst, item)] = diff
+            return diff
+        return src.transitions[dst.Name](smbm)
+
+    # for each access point name, the access points which have a transition to it
+    def getReverseTransitions(self):
+        if self.reverseTransitions is None:
+            self.reverseTransitions = {apName: [] for apName in self.accessPoints}
+            for src in self.accessPoints.values():
+                for dstName in src.transitions:
+                    self.reverseTransitions[dstName].append(src)
+        return self.reverseTransitions
+
     # returns a list of AccessPoint instances from srcAccessPointName to destAccessPointName
     # (not including source ap)
     # or None if no possible path
@@ -405,7 +469,7 @@ class AccessGraph(object):
         return [loc for loc in locations if any(ap.Name in loc.AccessFrom for ap in availAccessPoints)]
 
 class AccessGraphSolver(AccessGraph):
-    def computeLocDiff(self, tdiff, diff, pdiff):
+    def computeLocDiff(self, tdiff, diff, pdiff, smbm):
         # tdiff: difficulty from the location's access point to the location's room
         # diff: difficulty to reach the item in the location's room
         # pdiff: difficulty of the path from the current access point to the location's access point
@@ -417,6 +481,6 @@ class AccessGraphSolver(AccessGraph):
         return (allDiff, locDiff)
 
 class AccessGraphRando(AccessGraph):
-    def computeLocDiff(self, tdiff, diff, pdiff):
-        allDiff = SMBool.wandmax(tdiff, diff, pdiff)
+    def computeLocDiff(self, tdiff, diff, pdiff, smbm):
+        allDiff = smbm.wandmax(tdiff, diff, pdiff)
         return (allDiff, None)
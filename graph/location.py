@@ -70,7 +70,7 @@ class Location:
     def evalComeBack(self, smbm, areaGraph, ap):
         if self.difficulty.bool == True:
             # check if we can come back to given ap from the location
-            self.comeBack = areaGraph.canAccess(smbm, self.accessPoint, ap, infinity, self.itemName)
+            self.comeBack = areaGraph.canComeBack(smbm, self.accessPoint, ap, infinity, self.itemName)
 
     def json(self):
         # to return after plando rando
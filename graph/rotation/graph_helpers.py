@@ -9,7 +9,7 @@ from utils.parameters import Settings
 
 class HelpersGraph(Helpers):
     def __init__(self, smbm):
-        self.smbm = smbm
+        super(HelpersGraph, self).__init__(smbm)
 
 #    def canEnterAndLeaveGauntletQty(self, nPB, nTanksSpark):
 #        sm = self.smbm
@@ -9,7 +9,7 @@ from utils.parameters import Settings
 
 class HelpersGraph(Helpers):
     def __init__(self, smbm):
-        self.smbm = smbm
+        super(HelpersGraph, self).__init__(smbm)
 
     def canEnterAndLeaveGauntletQty(self, nPB, nTanksSpark):
         sm = self.smbm
@@ -272,25 +272,33 @@ class HelpersGraph(Helpers):
     @Cache.decorator
     def canGrappleEscape(self):
         sm = self.smbm
-        access = sm.wor(sm.wor(sm.haveItem('SpaceJump'),
-                               sm.wand(sm.canInfiniteBombJump(), # IBJ from lava...either have grav or freeze the enemy there if hellrunning (otherwise single DBJ at the end)
-                                       sm.wor(sm.heatProof(),
-                                              sm.haveItem('Gravity'),
-                                              sm.haveItem('Ice')))),
-                        sm.haveItem('Grapple'),
-                        sm.wand(sm.haveItem('SpeedBooster'),
-                                sm.wor(sm.haveItem('HiJump'), # jump from the blocks below
-                                       sm.knowsShortCharge())), # spark from across the grapple blocks
-                        sm.wand(sm.haveItem('HiJump'), sm.canSpringBallJump())) # jump from the blocks below
+        speedAccess = [sm.haveItem('HiJump'), # jump from the blocks below
+                       sm.knowsShortCharge()] # spark from across the grapple blocks
+        accesses = [sm.haveItem('SpaceJump'),
+                    sm.wand(sm.canInfiniteBombJump(), # IBJ from lava...either have grav or freeze the enemy there if hellrunning (otherwise single DBJ at the end)
+                            sm.wor(sm.heatProof(),
+                                   sm.haveItem('Gravity'),
+                                   sm.haveItem('Ice'))),
+                    sm.haveItem('Grapple'),
+                    sm.wand(sm.haveItem('SpeedBooster'),
+                            sm.wor(*speedAccess)),
+                    sm.wand(sm.haveItem('HiJump'), sm.canSpringBallJump())] # jump from the blocks below
+        access = sm.wor(*accesses)
         hellrun = 'MainUpperNorfair'
         tbl = Settings.hellRunsTable[hellrun]['Croc -> Norfair Entrance']
         mult = tbl['mult']
         minE = tbl['minE']
-        if 'InfiniteBombJump' in access.knows or 'ShortCharge' in access.knows:
+        # get the used access from the wor instead of the smbool knows/items,
+        # as they're not available in the smbm without provenance
+        used = SMBool.worIndex(*accesses)
+        if used == 1 or (used == 3 and SMBool.worIndex(*speedAccess) == 1):
+            # IBJ or short charge
             mult *= 0.7
-        elif 'SpaceJump' in access.items:
+        elif used == 0:
+            # space jump
             mult *= 1.5
-        elif 'Grapple' in access.items:
+        elif used == 2:
+            # grapple
             mult *= 1.25
         return sm.wand(access,
                        sm.canHellRun(hellrun, mult, minE))
@@ -568,19 +576,24 @@ class HelpersGraph(Helpers):
         return sm.wor(sm.haveItem('Gravity'),
                       sm.canDoSuitlessOuterMaridia())
 
+    def getBotwoonHallwayAccesses(self):
+        sm = self.smbm
+        return [sm.wand(sm.haveItem('SpeedBooster'),
+                        sm.haveItem('Gravity')),
+                sm.wand(sm.knowsMochtroidClip(), sm.haveItem('Ice')),
+                sm.canCrystalFlashClip()]
+
     @Cache.decorator
     def canPassBotwoonHallway(self):
-        sm = self.smbm
-        return sm.wor(sm.wand(sm.haveItem('SpeedBooster'),
-                              sm.haveItem('Gravity')),
-                      sm.wand(sm.knowsMochtroidClip(), sm.haveItem('Ice')),
-                      sm.canCrystalFlashClip())
+        return self.smbm.wor(*self.getBotwoonHallwayAccesses())
 
     @Cache.decorator
     def canDefeatBotwoon(self):
         sm = self.smbm
-        hallway = sm.canPassBotwoonHallway()
-        cfClip = 'CrystalFlashClip' in hallway.knows or 'SuitlessCrystalFlashClip' in hallway.knows
+        accesses = self.getBotwoonHallwayAccesses()
+        hallway = sm.wor(*accesses)
+        # crystal flash clip is the last access
+        cfClip = SMBool.worIndex(*accesses) == 2
         return sm.wand(hallway,
                        sm.enoughStuffBotwoon(cfClip))
 
@@ -1,31 +1,109 @@
-# the caching decorator for helpers functions
+import os, weakref
+from collections import OrderedDict
+
+# cached results of the helpers functions for each items combination.
+# each SMBoolManager owns its instance, the slots are allocated by the
+# global decorators registry (Cache).
+# the cached results also depend on the global logic state (active rom
+# patches, doors colors, objectives...), its owners reset all the caches
+# when it changes (resetAll).
 class VersionedCache(object):
-    __slots__ = ( 'cache', 'masterCache', 'nextSlot', 'size')
+    __slots__ = ( 'cache', 'masterCache', 'maxVersions', 'generation',
+                  'hits', 'misses', 'evictions', 'stats', '__weakref__' )
 
-    def __init__(self):
+    # all the living caches
+    instances = weakref.WeakSet()
+
+    # maxVersions: max number of items combinations kept in the cache (None for no limit),
+    #              the least recently used one is dropped when the limit is reached.
+    def __init__(self, maxVersions=1024):
         self.cache = []
-        self.masterCache = {}
-        self.nextSlot = 0
-        self.size = 0
+        self.masterCache = OrderedDict()
+        self.maxVersions = maxVersions
+        # incremented at each reset, for the users of the cached results
+        self.generation = 0
+        self.hits = []
+        self.misses = []
+        self.evictions = 0
+        self.stats = False
+        VersionedCache.instances.add(self)
+
+    @staticmethod
+    def resetAll():
+        for cache in list(VersionedCache.instances):
+            cache.reset()
 
     def reset(self):
         # reinit the whole cache
-        self.masterCache = {}
+        self.masterCache = OrderedDict()
+        self.generation += 1
         self.update(0)
 
     def update(self, newKey):
         cache = self.masterCache.get(newKey, None)
         if cache is None:
-            cache = [ None ] * self.size
+            cache = [ None ] * Cache.size
             self.masterCache[newKey] = cache
+            if self.maxVersions is not None and len(self.masterCache) > self.maxVersions:
+                self.masterCache.popitem(last=False)
+                self.evictions += 1
+        elif self.maxVersions is not None:
+            self.masterCache.move_to_end(newKey)
         self.cache = cache
 
+    def setMaxVersions(self, maxVersions):
+        self.maxVersions = maxVersions
+        if maxVersions is not None:
+            while len(self.masterCache) > maxVersions:
+                self.masterCache.popitem(last=False)
+                self.evictions += 1
+
+    # hits/misses counting is disabled by default as it slows down the cache
+    def enableStats(self, enable=True):
+        self.stats = enable
+        self.resetStats()
+
+    def resetStats(self):
+        self.hits = [ 0 ] * Cache.size
+        self.misses = [ 0 ] * Cache.size
+        self.evictions = 0
+
+    # return a list of (function name, hits, misses) sorted by number of calls
+    def getStats(self):
+        stats = [(Cache.names[slot], self.hits[slot], self.misses[slot]) for slot in range(len(self.hits))]
+        stats.sort(key=lambda s: s[1]+s[2], reverse=True)
+        return stats
+
+    def dumpStats(self):
+        lines = ["versions: {}/{} evictions: {}".format(len(self.masterCache), self.maxVersions, self.evictions)]
+        for (name, hits, misses) in self.getStats():
+            calls = hits + misses
+            if calls == 0:
+                continue
+            lines.append("{:>60}: calls: {:>9} hits: {:>9} misses: {:>9} hit ratio: {:6.2f}%".format(name, calls, hits, misses, 100*hits/calls))
+        return '\n'.join(lines)
+
+# the caching decorator for helpers functions.
+# the decorated functions take either a SMBoolManager (lambdas) or a Helpers
+# (methods) as argument, both having a 'cache' attribute with the
+# VersionedCache of the SMBoolManager.
+class CacheDecorators(object):
+    __slots__ = ( 'nextSlot', 'size', 'names' )
+
+    def __init__(self):
+        self.nextSlot = 0
+        self.size = 0
+        # name of the decorated function for each slot, for the stats
+        self.names = []
+
     def decorator(self, func):
         return self._decorate(func.__name__, self._new_slot(), func)
 
     # for lambdas
     def ldeco(self, func):
-        return self._decorate(func.__code__, self._new_slot(), func)
+        code = func.__code__
+        name = "{}:{}".format(os.path.basename(code.co_filename), code.co_firstlineno)
+        return self._decorate(name, self._new_slot(), func)
 
     def _new_slot(self):
         slot = self.nextSlot
@@ -34,30 +112,81 @@ class VersionedCache(object):
         return slot
 
     def _decorate(self, name, slot, func):
+        self.names.append(name)
         def _decorator(arg):
-            ret = self.cache[slot]
+            cache = arg.cache
+            ret = cache.cache[slot]
             if ret is not None:
+                if cache.stats:
+                    cache.hits[slot] += 1
                 return ret
             else:
+                if cache.stats:
+                    cache.misses[slot] += 1
                 ret = func(arg)
-                self.cache[slot] = ret
+                cache.cache[slot] = ret
                 return ret
         return _decorator
 
-Cache = VersionedCache()
+Cache = CacheDecorators()
 
+# cached results of the rando services requests.
+# the requests are keyed by the state of the container they're computed with:
+# its version (see ItemLocContainer) and the items of its smbm, so that the
+# results are kept across the filler steps and rollbacks.
+#
+# some requests have side effects used by the fillers (the graph stores the
+# difficulty and access point in the available locations). a result can be
+# stored with a function replaying them, and with the entries of the requests
+# it depends on. they're replayed the first time the result is used after a
+# refresh, like if it was computed again.
 class RequestCache(object):
-    def __init__(self):
-        self.results = {}
+    # maxResults: the least recently used results are dropped above it, each
+    #             result can keep the state of all the locations for its replay.
+    def __init__(self, maxResults=4096):
+        self.results = OrderedDict()
+        self.maxResults = maxResults
+        self.generation = 0
+        # entry of the last result stored or returned by get
+        self.last = None
 
-    def request(self, request, *args):
-        return ''.join([request] + [str(arg) for arg in args])
+    def request(self, request, ap, container, *args):
+        return (request, ap, container.version, container.sm.cacheKey) + args
 
-    def store(self, request, result):
-        self.results[request] = result
+    # entry: [result, generation, replay function, entries dependencies]
+    def store(self, request, result, replay=None, dependencies=None):
+        entry = [result, self.generation, replay, dependencies if dependencies is not None else ()]
+        self.results[request] = entry
+        if len(self.results) > self.maxResults:
+            self.results.popitem(last=False)
+        self.last = entry
 
     def get(self, request):
-        return self.results[request] if request in self.results else None
+        entry = self.results.get(request)
+        if entry is None:
+            return None
+        self.results.move_to_end(request)
+        self.use(entry)
+        self.last = entry
+        return entry[0]
+
+    def use(self, entry):
+        if entry[1] == self.generation:
+            return
+        entry[1] = self.generation
+        for dependency in entry[3]:
+            self.use(dependency)
+        if entry[2] is not None:
+            entry[2]()
+
+    # keep the results, replay their side effects when they're used again.
+    # to call when the locations may have been changed by other walks since
+    # the results were computed.
+    def refresh(self):
+        self.generation += 1
 
+    # drop the results, when the state they depend on changes outside of the keys
     def reset(self):
         self.results.clear()
+        self.generation += 1
+        self.last = None
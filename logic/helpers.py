@@ -11,6 +11,8 @@ from utils.utils import normalizeRounding
 class Helpers(object):
     def __init__(self, smbm):
         self.smbm = smbm
+        # used by the cache decorator
+        self.cache = smbm.cache
 
     # return bool
     def haveItemCount(self, item, count):
@@ -142,13 +144,12 @@ class Helpers(object):
                 nCF = self.getLNRequiredCFs(mult)
                 ret = sm.wand(self.energyReserveCountOkHellRun(hellRun, mult),
                               self.canCrystalFlash(nCF))
+                # create a new smbool as the wand result can be shared in a smbm without provenance
                 if ret.bool == True:
                     if sm.haveItem('Gravity') == True:
-                        ret.difficulty *= 0.7
-                        ret._items.append('Gravity')
+                        ret = SMBool(True, ret.difficulty * 0.7, ret._knows, [ret._items, 'Gravity'])
                     elif sm.haveItem('ScrewAttack') == True:
-                        ret.difficulty *= 0.7
-                        ret._items.append('ScrewAttack')
+                        ret = SMBool(True, ret.difficulty * 0.7, ret._knows, [ret._items, 'ScrewAttack'])
                 #nPB = self.smbm.itemCount('PowerBomb')
                 #print("canHellRun LN. tanks=" + str(tanks) + ", nCF=" + str(nCF) + ", nPB=" + str(nPB) + ", mult=" + str(mult) + ", heatProof=" + str(isHeatProof.bool) + ", ret=" + str(ret))
                 return ret
@@ -0,0 +1,162 @@
+import sys
+
+from logic.logic import Logic
+from logic.cache import VersionedCache
+from rom.rom_patches import RomPatches
+from utils.doorsmanager import DoorsManager, Door
+from utils.objectives import Objectives, Synonyms
+from utils.parameters import Knows, Settings, Controller, isKnows, isButton
+from solver.conf import Conf
+from graph.location import Location, locationsDict
+
+# snapshot of the process global logic state, set by the rando and the solver
+# in class attributes and in the shared locations and access points instances:
+# - active rom patches
+# - doors colors
+# - objectives goals and graph
+# - logic implementation, locations and access points
+# - knows/settings/controller of the skill preset
+# - solver configuration
+#
+# restore() puts back the state as it was when the snapshot was taken, so
+# several jobs can be run in the same process one after another:
+#
+#   state = LogicState()
+#   ... randomize/solve ...
+#   state.restore()
+#
+# or as a context manager which restores the state at exit:
+#
+#   with LogicState():
+#       ... randomize/solve ...
+#
+# the smbm cache is owned by each SMBoolManager and does not need to be saved.
+class LogicState(object):
+    logicAttributes = ['implementation', 'patches', 'locations', 'accessPoints', 'HelpersGraph', 'LocationsHelper']
+    objectivesAttributes = ['nbActiveGoals', 'maxActiveGoals', 'totalItemsCount', 'graph', 'maxDiff', '_tourianRequired']
+
+    def __init__(self):
+        self.snapshot()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.restore()
+        return False
+
+    def snapshot(self):
+        self.activePatches = RomPatches.ActivePatches[:]
+
+        self.doors = {name: tuple(getattr(door, slot) for slot in Door.__slots__) for name, door in DoorsManager.doors.items()}
+
+        self.objectives = {attr: getattr(Objectives, attr) for attr in LogicState.objectivesAttributes if hasattr(Objectives, attr)}
+        self.activeGoals = Objectives.activeGoals[:]
+        self.goals = {name: (goal.clearFunc, goal.rank, goal.escapeAccessPoints[0], goal.escapeAccessPoints[1][:])
+                      for name, goal in Objectives.goals.items()}
+        self.synonyms = Synonyms.alreadyUsed[:]
+
+        self.logic = {attr: getattr(Logic, attr) for attr in LogicState.logicAttributes if hasattr(Logic, attr)}
+        self.logicModules = [name for name in sys.modules if LogicState.isLogicModule(name)]
+        # the locations and access points are shared between all the users of the logic
+        # implementation, get the ones of all the implementations already loaded
+        self.locationsLists = {}
+        self.locations = {}
+        self.accessPointsLists = {}
+        self.accessPoints = {}
+        for locations, accessPoints in self.getLogicLists():
+            self.locationsLists[id(locations)] = (locations, locations[:])
+            for loc in locations:
+                self.locations[id(loc)] = (loc, tuple(getattr(loc, slot, None) for slot in Location.__slots__), loc.__dict__.copy())
+            self.accessPointsLists[id(accessPoints)] = (accessPoints, accessPoints[:])
+            for ap in accessPoints:
+                self.accessPoints[id(ap)] = (ap, ap.__dict__.copy(), ap.transitions.copy())
+        # the locations instances are defined once for all the implementations, also
+        # get the ones of the implementations not loaded yet
+        for loc in locationsDict.values():
+            if id(loc) not in self.locations:
+                self.locations[id(loc)] = (loc, tuple(getattr(loc, slot, None) for slot in Location.__slots__), loc.__dict__.copy())
+
+        self.knows = {knows: value for knows, value in Knows.__dict__.items() if isKnows(knows)}
+        self.settings = (Settings.hardRooms.copy(), Settings.bossesDifficulty.copy(), Settings.hellRuns.copy())
+        self.controller = {button: value for button, value in Controller.__dict__.items() if isButton(button)}
+
+        self.conf = {attr: getattr(Conf, attr) for attr in ['difficultyTarget', 'displayGeneratedPath', 'itemsPickup']}
+        self.conf['itemsForbidden'] = Conf.itemsForbidden[:]
+
+    @staticmethod
+    def isLogicModule(name):
+        return name.startswith('graph.vanilla.') or name.startswith('graph.rotation.')
+
+    def getLogicLists(self):
+        ret = []
+        if hasattr(Logic, 'locations'):
+            ret.append((Logic.locations, Logic.accessPoints))
+        # the other implementation may have been used and then replaced in Logic
+        for implementation in ['vanilla', 'rotation']:
+            locationsModule = sys.modules.get('graph.{}.graph_locations'.format(implementation))
+            accessModule = sys.modules.get('graph.{}.graph_access'.format(implementation))
+            if locationsModule is not None and accessModule is not None:
+                lists = (locationsModule.locations, accessModule.accessPoints)
+                if not any(lists[0] is l[0] for l in ret):
+                    ret.append(lists)
+        return ret
+
+    # restore the class attributes, remove the ones which were not set in the snapshot
+    @staticmethod
+    def restoreAttributes(cls, attributes, values):
+        for attr in attributes:
+            if attr in values:
+                setattr(cls, attr, values[attr])
+            elif attr in cls.__dict__:
+                delattr(cls, attr)
+
+    def restore(self):
+        RomPatches.ActivePatches = self.activePatches[:]
+
+        for name, values in self.doors.items():
+            door = DoorsManager.doors[name]
+            for slot, value in zip(Door.__slots__, values):
+                setattr(door, slot, value)
+
+        LogicState.restoreAttributes(Objectives, LogicState.objectivesAttributes, self.objectives)
+        Objectives.activeGoals = self.activeGoals[:]
+        for name, (clearFunc, rank, nbAps, aps) in self.goals.items():
+            goal = Objectives.goals[name]
+            goal.clearFunc = clearFunc
+            goal.rank = rank
+            goal.escapeAccessPoints = (nbAps, aps[:])
+        Synonyms.alreadyUsed = self.synonyms[:]
+
+        LogicState.restoreAttributes(Logic, LogicState.logicAttributes, self.logic)
+        # the logic implementations loaded after the snapshot can't be restored,
+        # unload them to get a fresh import at the next Logic.factory
+        for name in [name for name in sys.modules if LogicState.isLogicModule(name) and name not in self.logicModules]:
+            del sys.modules[name]
+        for locations, values in self.locationsLists.values():
+            locations[:] = values
+        for loc, slots, attrs in self.locations.values():
+            for slot, value in zip(Location.__slots__, slots):
+                setattr(loc, slot, value)
+            loc.__dict__.clear()
+            loc.__dict__.update(attrs)
+        for accessPoints, values in self.accessPointsLists.values():
+            accessPoints[:] = values
+        for ap, attrs, transitions in self.accessPoints.values():
+            ap.__dict__.clear()
+            ap.__dict__.update(attrs)
+            ap.transitions = transitions.copy()
+
+        for knows, value in self.knows.items():
+            setattr(Knows, knows, value)
+        for settings, values in zip([Settings.hardRooms, Settings.bossesDifficulty, Settings.hellRuns], self.settings):
+            settings.clear()
+            settings.update(values)
+        for button, value in self.controller.items():
+            setattr(Controller, button, value)
+
+        for attr, value in self.conf.items():
+            setattr(Conf, attr, value)
+
+        # the cached logic results depend on the restored state
+        VersionedCache.resetAll()
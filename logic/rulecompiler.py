@@ -0,0 +1,214 @@
+from logic.cache import Cache
+from logic.smbool import SMBool, smboolFalse
+
+# compiled version of the logic functions (access points transitions and
+# traverse, locations AccessFrom/Available/PostAvailable).
+#
+# a logic function is a function of the collected items once the preset
+# (knows, settings), the rom patches and the doors colors are loaded.
+# a rule is compiled by tracing the reference function: while it's evaluated
+# the items it reads (haveItem/itemCount) are recorded, giving the bits of the
+# items cache key its result depends on. the result is stored as a clause
+# (mask, key & mask) -> (bool, difficulty, knows, items).
+# the compiled rule is the disjunction of its clauses, evaluated with a dict
+# lookup for each mask on the integer items state (the SMBoolManager cache key).
+# clauses are added when an items state is not covered yet, the reference
+# functions are still the ones giving the results.
+class CompiledRule(object):
+    __slots__ = ('func', 'masks', 'clauses', 'compilable')
+
+    def __init__(self, func):
+        self.func = func
+        # masks in the order they were discovered
+        self.masks = []
+        # mask: {key & mask: result}
+        self.clauses = {}
+        # false if the function reads an item which is not in the cache key
+        self.compilable = True
+
+    def reset(self):
+        self.masks = []
+        self.clauses = {}
+        self.compilable = True
+
+    def lookup(self, key):
+        for mask in self.masks:
+            result = self.clauses[mask].get(key & mask)
+            if result is not None:
+                return result
+        return None
+
+    def addClause(self, mask, value, result):
+        clauses = self.clauses.get(mask)
+        if clauses is None:
+            clauses = self.clauses[mask] = {}
+            self.masks.append(mask)
+        clauses[value] = result
+
+    def getClausesCount(self):
+        return sum([len(clauses) for clauses in self.clauses.values()])
+
+# cache of the helpers results used while tracing, for one items state.
+# the cache decorators read and write the results in its 'cache' slots,
+# the items read by a helper are stored with its result, so that they're
+# added to the items read by the rules using the cached result.
+class TraceCache(object):
+    __slots__ = ('compiler', 'cache', 'stats', 'key', 'results', 'masks', 'oks', 'stack')
+
+    def __init__(self, compiler):
+        self.compiler = compiler
+        # for the decorators
+        self.cache = self
+        self.stats = False
+        self.key = None
+        self.results = []
+        self.masks = []
+        self.oks = []
+        # (readMask, readOk) of the callers of the helpers being evaluated
+        self.stack = []
+
+    def reset(self):
+        self.key = None
+
+    def update(self, key):
+        if key != self.key:
+            self.key = key
+            self.results = [None] * Cache.size
+            self.masks = [0] * Cache.size
+            self.oks = [True] * Cache.size
+        self.stack = []
+
+    def __getitem__(self, slot):
+        compiler = self.compiler
+        ret = self.results[slot]
+        if ret is None:
+            # the decorator evaluates the helper then stores its result
+            self.stack.append((compiler.readMask, compiler.readOk))
+            compiler.readMask = 0
+            compiler.readOk = True
+        else:
+            compiler.readMask |= self.masks[slot]
+            compiler.readOk = compiler.readOk and self.oks[slot]
+        return ret
+
+    def __setitem__(self, slot, ret):
+        compiler = self.compiler
+        self.results[slot] = ret
+        self.masks[slot] = compiler.readMask
+        self.oks[slot] = compiler.readOk
+        (readMask, readOk) = self.stack.pop()
+        compiler.readMask |= readMask
+        compiler.readOk = compiler.readOk and readOk
+
+class RuleCompiler(object):
+    def __init__(self, smbm):
+        self.smbm = smbm
+        self.rules = {}
+        # used while tracing to get the items read by the cached helpers
+        self.traceCache = TraceCache(self)
+        self.readMask = 0
+        self.readOk = True
+        self.itemsPositions = smbm.itemsPositions
+        # compiled results are valid for the knows of the smbm cache generation
+        self.generation = smbm.cache.generation
+        self.hits = 0
+        self.misses = 0
+
+    def compile(self, func):
+        rule = self.rules.get(func)
+        if rule is None:
+            rule = self.rules[func] = CompiledRule(func)
+        return rule
+
+    # to call when the patches or the doors colors change
+    def reset(self):
+        for rule in self.rules.values():
+            rule.reset()
+        self.traceCache.reset()
+        self.generation = self.smbm.cache.generation
+
+    # return (bool, difficulty) of the rule for the current items
+    def evaluate(self, rule):
+        result = self.getResult(rule)
+        return (result[0], result[1])
+
+    # return the same smbool as the reference function
+    def evaluateSMBool(self, rule):
+        (boolean, difficulty, knows, items) = self.getResult(rule)
+        if not boolean and difficulty == 0 and len(knows) == 0 and len(items) == 0:
+            return smboolFalse
+        return SMBool(boolean, difficulty, list(knows), list(items))
+
+    def getResult(self, rule):
+        if self.generation != self.smbm.cache.generation:
+            self.reset()
+        # rule.lookup inlined, it's called for each evaluation
+        key = self.smbm.cacheKey
+        for mask in rule.masks:
+            result = rule.clauses[mask].get(key & mask)
+            if result is not None:
+                self.hits += 1
+                return result
+        self.misses += 1
+        return self.trace(rule)
+
+    def trace(self, rule):
+        smbm = self.smbm
+        helpers = smbm.helpers
+        self.readMask = 0
+        self.readOk = True
+        cache = smbm.cache
+        self.traceCache.update(smbm.cacheKey)
+        smbm.cache = helpers.cache = self.traceCache
+        smbm.haveItem = self.traceHaveItem
+        smbm.itemCount = self.traceItemCount
+        try:
+            ret = rule.func(smbm)
+        finally:
+            del smbm.haveItem
+            del smbm.itemCount
+            smbm.cache = helpers.cache = cache
+        result = (ret.bool, ret.difficulty, tuple(sorted(ret.knows)), tuple(sorted(ret.items)))
+        if self.readOk and rule.compilable:
+            rule.addClause(self.readMask, smbm.cacheKey & self.readMask, result)
+        else:
+            rule.compilable = False
+        return result
+
+    def traceRead(self, item):
+        position = self.itemsPositions.get(item)
+        if position is None:
+            self.readOk = False
+        else:
+            self.readMask |= position[1]
+
+    def traceHaveItem(self, item):
+        self.traceRead(item)
+        return self.smbm._items[item]
+
+    def traceItemCount(self, item):
+        self.traceRead(item)
+        return self.smbm._counts[item]
+
+    # fill the clauses for a list of items states (list of items lists)
+    def precompile(self, funcs, itemsStates):
+        smbm = self.smbm
+        rules = [self.compile(func) for func in funcs]
+        for items in itemsStates:
+            smbm.resetItems()
+            smbm.addItems(items)
+            for rule in rules:
+                self.getResult(rule)
+        smbm.resetItems()
+        return rules
+
+    def getStats(self):
+        rules = self.rules.values()
+        return {
+            'rules': len(rules),
+            'notCompilable': len([rule for rule in rules if not rule.compilable]),
+            'clauses': sum([rule.getClausesCount() for rule in rules]),
+            'masks': sum([len(rule.masks) for rule in rules]),
+            'hits': self.hits,
+            'misses': self.misses
+        }
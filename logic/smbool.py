@@ -111,6 +111,15 @@ class SMBool:
 
         return smboolFalse
 
+    # index of the smbool returned by wor, -1 if they're all false.
+    # to know which alternative is used without reading the provenance.
+    def worIndex(*args):
+        index = -1
+        for (i, smb) in enumerate(args):
+            if smb.bool and (index == -1 or smb.difficulty < args[index].difficulty):
+                index = i
+        return index
+
     # negates boolean part of the SMBool
     def wnot(a):
         return smboolFalse if a.bool else SMBool(True, a.difficulty)
@@ -120,3 +129,73 @@ class SMBool:
     __not__ = wnot
 
 smboolFalse = SMBool(False)
+
+# provenance lists of the smbools without provenance, additions are ignored
+class NoProvenance(list):
+    __slots__ = ()
+
+    def append(self, item):
+        pass
+
+    def extend(self, items):
+        pass
+
+    def __iadd__(self, items):
+        return self
+
+noProvenance = NoProvenance()
+
+# smbool without knows/items, used by the SMBoolManagers without provenance
+# (randomizer) where they're never read.
+# instances are interned by (bool, difficulty) and shared, so they're never modified.
+class SMBoolNoProvenance(SMBool):
+    __slots__ = ()
+
+    def __init__(self, boolean, difficulty=0):
+        super(SMBoolNoProvenance, self).__init__(boolean, difficulty, noProvenance, noProvenance)
+
+    @property
+    def knows(self):
+        return noProvenance
+
+    @knows.setter
+    def knows(self, knows):
+        pass
+
+    @property
+    def items(self):
+        return noProvenance
+
+    @items.setter
+    def items(self, items):
+        pass
+
+internedSMBools = {}
+
+def getSMBoolNoProvenance(boolean, difficulty=0):
+    key = (boolean, difficulty)
+    smb = internedSMBools.get(key)
+    if smb is None:
+        smb = internedSMBools[key] = SMBoolNoProvenance(boolean, difficulty)
+    return smb
+
+# wand/wandmax/wnot computing only the bool and the difficulty
+def wandNoProvenance(*args):
+    difficulty = 0
+    for smb in args:
+        if not smb.bool:
+            return smboolFalse
+        difficulty += smb.difficulty
+    return getSMBoolNoProvenance(True, difficulty)
+
+def wandmaxNoProvenance(*args):
+    difficulty = 0
+    for smb in args:
+        if not smb.bool:
+            return smboolFalse
+        if smb.difficulty > difficulty:
+            difficulty = smb.difficulty
+    return getSMBoolNoProvenance(True, difficulty)
+
+def wnotNoProvenance(a):
+    return smboolFalse if a.bool else getSMBoolNoProvenance(True, a.difficulty)
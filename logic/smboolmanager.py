@@ -1,7 +1,9 @@
 # object to handle the smbools and optimize them
 
-from logic.cache import Cache
-from logic.smbool import SMBool, smboolFalse
+import operator
+
+from logic.cache import VersionedCache
+from logic.smbool import SMBool, smboolFalse, getSMBoolNoProvenance, wandNoProvenance, wandmaxNoProvenance, wnotNoProvenance
 from logic.helpers import Bosses
 from logic.logic import Logic
 from utils.doorsmanager import DoorsManager
@@ -12,14 +14,33 @@ class SMBoolManager(object):
     items = ['ETank', 'Missile', 'Super', 'PowerBomb', 'Bomb', 'Charge', 'Ice', 'HiJump', 'SpeedBooster', 'Wave', 'Spazer', 'SpringBall', 'Varia', 'Plasma', 'Grapple', 'Morph', 'Reserve', 'Gravity', 'XRayScope', 'SpaceJump', 'ScrewAttack', 'Nothing', 'NoEnergy', 'MotherBrain', 'Hyper'] + Bosses.Golden4() + Bosses.miniBosses()
     countItems = ['Missile', 'Super', 'PowerBomb', 'ETank', 'Reserve']
     percentItems = ['Bomb', 'Charge', 'Ice', 'HiJump', 'SpeedBooster', 'Wave', 'Spazer', 'SpringBall', 'Varia', 'Plasma', 'Grapple', 'Morph', 'Gravity', 'XRayScope', 'SpaceJump', 'ScrewAttack']
-    def __init__(self):
+    # the knows functions don't use the smbm, they're shared by the smbms
+    # created with the same Knows.
+    # provenance: (Knows names, Knows values, {'knowsXXX': function})
+    knowsFunctions = {}
+    # names of the functions of each helpers class, for the facade functions
+    helpersFunctions = {}
+    # (pos, bitMask) of the items in the cache key, the same for all the smbms
+    sharedItemsPositions = None
+    # provenance: if false, the smbools knows/items are not computed (when they're
+    #             never read, like in the randomizer), the smbools only have their
+    #             bool and difficulty and are shared.
+    def __init__(self, provenance=True):
         self._items = { }
         self._counts = { }
+        self.provenance = provenance
+        if not provenance:
+            self.wand = wandNoProvenance
+            self.wandmax = wandmaxNoProvenance
+            self.wnot = wnotNoProvenance
+            self.itemCountOk = self.itemCountOkNoProvenance
+            self.energyReserveCountOk = self.energyReserveCountOkNoProvenance
 
         # cache related
         self.cacheKey = 0
         self.computeItemsPositions()
-        Cache.reset()
+        self.cache = VersionedCache()
+        self.cache.reset()
 
         self.helpers = Logic.HelpersGraph(self)
         self.doorsManager = DoorsManager()
@@ -29,6 +50,9 @@ class SMBoolManager(object):
         self.resetItems()
 
     def computeItemsPositions(self):
+        if SMBoolManager.sharedItemsPositions is not None:
+            self.itemsPositions = SMBoolManager.sharedItemsPositions
+            return
         # compute index in cache key for each items
         self.itemsPositions = {}
         maxBitsForCountItem = 7 # 128 values with 7 bits
@@ -41,6 +65,7 @@ class SMBoolManager(object):
             if item in self.countItems:
                 continue
             self.itemsPositions[item] = (i, 1<<i)
+        SMBoolManager.sharedItemsPositions = self.itemsPositions
 
     def computeNewCacheKey(self, item, value):
         # generate an unique integer for each items combinations which is use as key in the cache.
@@ -92,7 +117,7 @@ class SMBoolManager(object):
         self._counts = { item : 0 for item in self.countItems }
 
         self.cacheKey = 0
-        Cache.update(self.cacheKey)
+        self.cache.update(self.cacheKey)
 
     def addItem(self, item):
         # a new item is available
@@ -104,7 +129,7 @@ class SMBoolManager(object):
         else:
             self.computeNewCacheKey(item, 1)
 
-        Cache.update(self.cacheKey)
+        self.cache.update(self.cacheKey)
 
     def addItems(self, items):
         if len(items) == 0:
@@ -118,7 +143,7 @@ class SMBoolManager(object):
             else:
                 self.computeNewCacheKey(item, 1)
 
-        Cache.update(self.cacheKey)
+        self.cache.update(self.cacheKey)
 
     def removeItem(self, item):
         # randomizer removed an item (or the item was added to test a post available)
@@ -132,12 +157,16 @@ class SMBoolManager(object):
             self._items[item] = smboolFalse
             self.computeNewCacheKey(item, 0)
 
-        Cache.update(self.cacheKey)
+        self.cache.update(self.cacheKey)
 
     def createFacadeFunctions(self):
-        for fun in dir(self.helpers):
-            if fun != 'smbm' and fun[0:2] != '__':
-                setattr(self, fun, getattr(self.helpers, fun))
+        helpersClass = type(self.helpers)
+        functions = SMBoolManager.helpersFunctions.get(helpersClass)
+        if functions is None:
+            functions = [fun for fun in dir(helpersClass) if fun != 'smbm' and fun[0:2] != '__']
+            SMBoolManager.helpersFunctions[helpersClass] = functions
+        helpers = self.helpers
+        self.__dict__.update({fun: getattr(helpers, fun) for fun in functions})
 
     def traverse(self, doorName):
         return self.doorsManager.traverse(self, doorName)
@@ -158,13 +187,25 @@ class SMBoolManager(object):
     def createKnowsFunctions(self):
         # for each knows we have a function knowsKnows (ex: knowsAlcatrazEscape()) which
         # take no parameter
-        for knows in Knows.__dict__:
-            if isKnows(knows):
-                self._createKnowsFunction(knows)
+        names = tuple(Knows.__dict__.keys())
+        values = tuple(Knows.__dict__.values())
+        cached = SMBoolManager.knowsFunctions.get(self.provenance)
+        # the knows smbools are replaced when a preset is loaded
+        if cached is None or cached[0] != names or not all(map(operator.is_, cached[1], values)):
+            functions = {'knows'+knows: self.newKnowsFunction(knows, k) for (knows, k) in zip(names, values) if isKnows(knows)}
+            cached = (names, values, functions)
+            SMBoolManager.knowsFunctions[self.provenance] = cached
+        self.__dict__.update(cached[2])
 
     def _setKnowsFunction(self, knows, k):
-        setattr(self, 'knows'+knows, lambda: SMBool(k.bool, k.difficulty,
-                                                    knows=[knows]))
+        setattr(self, 'knows'+knows, self.newKnowsFunction(knows, k))
+
+    def newKnowsFunction(self, knows, k):
+        if self.provenance:
+            return lambda: SMBool(k.bool, k.difficulty, knows=[knows])
+        else:
+            smb = getSMBoolNoProvenance(k.bool, k.difficulty)
+            return lambda: smb
 
     def _createKnowsFunction(self, knows):
         self._setKnowsFunction(knows, Knows.__dict__[knows])
@@ -172,14 +213,14 @@ class SMBoolManager(object):
     def changeKnows(self, knows, newVal):
         if isKnows(knows):
             self._setKnowsFunction(knows, newVal)
-            Cache.reset()
+            self.cache.reset()
         else:
             raise ValueError("Invalid knows "+str(knows))
 
     def restoreKnows(self, knows):
         if isKnows(knows):
             self._createKnowsFunction(knows)
-            Cache.reset()
+            self.cache.reset()
         else:
             raise ValueError("Invalid knows "+str(knows))
 
@@ -226,6 +267,18 @@ class SMBoolManager(object):
         else:
             return smboolFalse
 
+    def itemCountOkNoProvenance(self, item, count, difficulty=0):
+        if self.itemCount(item) >= count:
+            return getSMBoolNoProvenance(True, difficulty)
+        else:
+            return smboolFalse
+
+    def energyReserveCountOkNoProvenance(self, count, difficulty=0):
+        if self.energyReserveCount() >= count:
+            return getSMBoolNoProvenance(True, difficulty)
+        else:
+            return smboolFalse
+
 class SMBoolManagerPlando(SMBoolManager):
     def __init__(self):
         super(SMBoolManagerPlando, self).__init__()
@@ -246,7 +299,7 @@ class SMBoolManagerPlando(SMBoolManager):
         else:
             self.computeNewCacheKey(item, 1)
 
-        Cache.update(self.cacheKey)
+        self.cache.update(self.cacheKey)
 
     def removeItem(self, item):
         # randomizer removed an item (or the item was added to test a post available)
@@ -265,4 +318,4 @@ class SMBoolManagerPlando(SMBoolManager):
                 del self._items[dup]
                 self.computeNewCacheKey(item, 1)
 
-        Cache.update(self.cacheKey)
+        self.cache.update(self.cacheKey)
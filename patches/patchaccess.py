@@ -2,8 +2,13 @@ import os, importlib
 from logic.logic import Logic
 from patches.common.patches import patches, additional_PLMs
 from utils.parameters import appDir
+from rom.ips import IPS_Patch
 
 class PatchAccess(object):
+    # parsed patches by logic and name, the patches are not modified once parsed
+    # so they are shared by all the rom patchers of the process (and the forked workers)
+    patches = {}
+
     def __init__(self):
         # load all ips patches
         self.patchesPath = {}
@@ -35,6 +40,19 @@ class PatchAccess(object):
             else:
                 raise Exception("unknown patch: {}".format(patch))
 
+    # parsed dict or ips patch. only the patches shipped with VARIA are kept,
+    # the other ips files (user seeds, varia_repository) are loaded each time
+    def getPatch(self, patch):
+        if patch not in self.dictPatches and patch not in self.patchesPath:
+            return IPS_Patch.load(self.getPatchPath(patch))
+        key = (Logic.patches, patch)
+        if key not in PatchAccess.patches:
+            if patch in self.dictPatches:
+                PatchAccess.patches[key] = IPS_Patch(self.dictPatches[patch])
+            else:
+                PatchAccess.patches[key] = IPS_Patch.load(self.getPatchPath(patch))
+        return PatchAccess.patches[key]
+
     def getDictPatches(self):
         return self.dictPatches
 
@@ -34,7 +34,11 @@ class Filler(object):
         self.nSteps = 0
         self.errorMsg = ""
         self.settings.maxDiff = self.maxDiff
-        self.startDate = time.process_time()
+        self.startDate = self.getDate()
+
+    # date used for the runtime limit
+    def getDate(self):
+        return time.process_time()
 
     # sets up container initial state
     def initContainer(self):
@@ -63,7 +67,7 @@ class Filler(object):
             isStuck = not self.step()
             if not isStuck:
                 self.nSteps += 1
-            date = time.process_time()
+            date = self.getDate()
         if condition() or date > self.endDate:
             isStuck = True
             if date > self.endDate:
@@ -119,7 +123,7 @@ class FrontFiller(Filler):
 
     # one item/loc per step
     def step(self, onlyBossCheck=False):
-        self.cache.reset()
+        self.cache.refresh()
         if not self.services.can100percent(self.ap, self.container):
             comebackCheck = ComebackCheckType.ComebackWithoutItem if not self.isEarlyGame() else ComebackCheckType.NoCheck
             (itemLocDict, isProg) = self.services.getPossiblePlacements(self.ap, self.container, comebackCheck)
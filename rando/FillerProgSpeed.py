@@ -1,40 +1,80 @@
 
 import copy, random, sys
+from collections import OrderedDict
 
 from rando.Filler import Filler
 from rando.FillerRandom import FillerRandom, FillerRandomItems
 from rando.Choice import ItemThenLocChoiceProgSpeed, ItemThenLocChoice
 from rando.RandoServices import ComebackCheckType
 from rando.Items import ItemManager
-from rando.ItemLocContainer import ItemLocContainer, getLocListStr, getItemListStr, getItemLocationsStr, getItemLocStr
+from rando.ItemLocContainer import ItemLocContainer, ItemLocation, getLocListStr, getItemListStr, getItemLocationsStr, getItemLocStr
 from rando.RandoSettings import ProgSpeedParameters
 from utils.parameters import infinity
 from graph.graph_utils import GraphUtils, getAccessPoint
 
-# algo state used for rollbacks
+# algo state used for rollbacks. snapshot of the filler container stored in
+# tuples, restored in the filler container itself, so that its SMBoolManager
+# and the logic cache are kept instead of creating new ones for each state.
 class FillerState(object):
-    def __init__(self, filler):
-        self.container = copy.copy(filler.container)
+    def __init__(self, filler, previous=None):
+        container = filler.container
+        # we don't save restriction state on purpose, like container copy
+        self.itemPool = tuple(container.itemPoolBackup if container.itemPoolBackup is not None else container.itemPool)
+        self.unusedLocations = tuple(container.unusedLocations)
+        self.currentItems = tuple(container.currentItems)
+        self.unrestrictedItems = frozenset(container.unrestrictedItems)
+        self.version = container.version
+        self.itemLocations = self.freezeItemLocations(container.itemLocations, previous)
+        # item/locations of the container when the state was saved or restored
+        self.sourceItemLocations = tuple(container.itemLocations)
         self.ap = filler.ap
         self.states = filler.states[:]
         self.progressionItemLocs = filler.progressionItemLocs[:]
         self.progressionStatesIndices = filler.progressionStatesIndices[:]
 
+    # the locations of the collected item/locations are copied, as they're
+    # updated by the graph when they're available again after a rollback.
+    # the copies of the previous state are reused for its item/locations.
+    def freezeItemLocations(self, itemLocations, previous):
+        frozen = []
+        for (i, il) in enumerate(itemLocations):
+            if (previous is not None and i < len(previous.itemLocations)
+                and (il is previous.itemLocations[i] or il is previous.sourceItemLocations[i])):
+                frozen.append(previous.itemLocations[i])
+            else:
+                frozen.append(ItemLocation(il.Item, copy.copy(il.Location)))
+        return tuple(frozen)
+
     def apply(self, filler):
-        filler.container = copy.copy(self.container)
+        container = filler.container
+        container.itemPool = list(self.itemPool)
+        container.itemPoolBackup = None
+        container.unusedLocations = list(self.unusedLocations)
+        container.currentItems = list(self.currentItems)
+        # the container gets copies of the frozen item/locations, as they can be
+        # changed afterwards. the next state reuses the frozen ones for them.
+        itemLocations = [ItemLocation(il.Item, copy.copy(il.Location)) for il in self.itemLocations]
+        container.itemLocations = itemLocations
+        self.sourceItemLocations = tuple(itemLocations)
+        container.unrestrictedItems = set(self.unrestrictedItems)
+        container.version = self.version
+        container.sm.resetItems()
+        container.sm.addItems([item.Type for item in self.currentItems])
         filler.ap = self.ap
         filler.states = self.states[:]
         filler.progressionItemLocs = self.progressionItemLocs[:]
         filler.progressionStatesIndices = self.progressionStatesIndices[:]
-        filler.cache.reset()
+        filler.cache.refresh()
 
     def __eq__(self, rhs):
         if rhs is None:
             return False
-        eq = self.ap == rhs.ap
-        eq &= self.progressionStatesIndices == rhs.progressionStatesIndices
-        eq &= self.container == rhs.container
-        return eq
+        return (self.ap == rhs.ap
+                and self.progressionStatesIndices == rhs.progressionStatesIndices
+                and self.currentItems == rhs.currentItems
+                and getLocListStr(self.unusedLocations) == getLocListStr(rhs.unusedLocations)
+                and self.itemPool == rhs.itemPool
+                and getItemLocationsStr(self.itemLocations) == getItemLocationsStr(rhs.itemLocations))
 
 # complex filler based on progression speed settings.  will alternate
 # non progression phases and progression phases. can get stuck and
@@ -55,6 +95,10 @@ class FillerProgSpeed(Filler):
         self.progressionStatesIndices = []
         self.rollbackItemsTried = {}
         self.lastFallbackStates = []
+        # (ap, items cache key, max diff): accessible APs part of the situation id,
+        # the least recently used ones are dropped above maxSituationPositions
+        self.situationPositions = OrderedDict()
+        self.maxSituationPositions = 1024
         self.initState = FillerState(self)
 
     def determineParameters(self):
@@ -122,7 +166,7 @@ class FillerProgSpeed(Filler):
         return self.states[-1] if len(self.states) > 0 else self.initState
 
     def appendCurrentState(self):
-        curState = FillerState(self)
+        curState = FillerState(self, self.getCurrentState())
         self.states.append(curState)
         curState.states.append(curState)
 
@@ -136,7 +180,7 @@ class FillerProgSpeed(Filler):
             self.progressionStatesIndices.append(n)
             self.progressionItemLocs.append(itemLoc)
         self.appendCurrentState()
-        self.cache.reset()
+        self.cache.refresh()
 
     def isProgItem(self, item):
         if item.Type in self.progressionItemTypes:
@@ -280,7 +324,15 @@ class FillerProgSpeed(Filler):
 
     def getSituationId(self):
         progItems = str(sorted([il.Item.Type for il in self.progressionItemLocs]))
-        position = str(sorted([ap.Name for ap in self.services.currentAccessPoints(self.ap, self.container)]))
+        key = (self.ap, self.container.sm.cacheKey, self.settings.maxDiff)
+        position = self.situationPositions.get(key)
+        if position is None:
+            position = str(sorted([ap.Name for ap in self.services.currentAccessPoints(self.ap, self.container)]))
+            self.situationPositions[key] = position
+            if len(self.situationPositions) > self.maxSituationPositions:
+                self.situationPositions.popitem(last=False)
+        else:
+            self.situationPositions.move_to_end(key)
         return progItems+'/'+position
 
     def hasTried(self, itemLoc):
@@ -393,12 +445,13 @@ class FillerProgSpeed(Filler):
     #     return True
 
     def step(self, onlyBossCheck=False):
-        self.cache.reset()
+        self.cache.refresh()
         if self.services.can100percent(self.ap, self.container) and self.settings.progSpeed not in ['slowest', 'slow']:
             (itemLocDict, isProg) = self.services.getPossiblePlacementsNoLogic(self.container)
             itemLoc = self.chooseItemLocNoLogic(itemLocDict)
             if itemLoc is None:
                 self.restrictions.disable()
+                # the restrictions are not in the cache keys, drop the cached results
                 self.cache.reset()
                 self.errorMsg = "Restrictions disabled"
                 (itemLocDict, isProg) = self.services.getPossiblePlacementsNoLogic(self.container)
@@ -493,7 +546,7 @@ class FillerProgSpeedChozoSecondPhase(Filler):
             self.determineParameters()
             curLocs = []
             while self.firstPhaseIndex < len(self.firstPhaseItemLocs):
-                self.cache.reset()
+                self.cache.refresh()
                 newCurLocs = [loc for loc in self.currentLocations() if loc not in curLocs]
                 curLocs += newCurLocs
                 cond = self.nextMetCondition()
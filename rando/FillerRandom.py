@@ -1,5 +1,5 @@
 
-import random, sys, copy, logging, time
+import random, sys, copy, logging, time, multiprocessing
 
 from rando.Filler import Filler, FrontFiller
 from rando.Choice import ItemThenLocChoice
@@ -20,10 +20,22 @@ class FillerRandom(Filler):
         self.beatableBackup = None
         self.nFrontFillSteps = 0
         self.stepIncr = 1
+        # process time of the attempts run by the workers, minus the time the
+        # process spent waiting for them
+        self.parallelTime = 0
 
     def initFiller(self):
+        self.parallelTime = 0
         super(FillerRandom, self).initFiller()
         self.log.debug("initFiller. maxDiff="+str(self.settings.maxDiff))
+        # with fill workers, each fill attempt has its own random seed, drawn from
+        # a random generator of the fill (see parallelStep). without them, the fill
+        # attempts use the rando random state.
+        self.seededAttempts = self.settings.fillWorkers > 1
+        if self.seededAttempts:
+            self.attemptsRandom = random.Random(random.getrandbits(64))
+            # seeds drawn for attempts which were not used, to use first
+            self.attemptSeeds = []
         self.createBaseLists()
 
     def createBaseLists(self):
@@ -36,8 +48,10 @@ class FillerRandom(Filler):
     def resetContainer(self):
         self.baseContainer.restore(self.container, resetSM=True)
 
+    # a seeded fill attempt starts from the helping container, including its unrestricted
+    # items, so that its result only depends on its seed
     def resetHelpingContainer(self):
-        self.helpContainer.restore(self.container, resetSM=False)
+        self.helpContainer.restore(self.container, resetSM=False, resetUnrestricted=self.seededAttempts)
 
     def isBeatable(self, maxDiff=None):
         return self.miniSolver.isBeatable(self.container.itemLocations, maxDiff=maxDiff)
@@ -49,22 +63,32 @@ class FillerRandom(Filler):
     def getHelp(self):
         pass
 
-    def step(self):
-        # here a step is not an item collection but a whole fill attempt
-        date = time.process_time()
+    # the attempts run by the workers are counted like if they were run in the process
+    def getDate(self):
+        return time.process_time() + self.parallelTime
+
+    # a random fill of the container, return False if the runtime limit is reached
+    def fill(self):
+        date = self.getDate()
         while not self.container.isPoolEmpty() and date <= self.endDate:
             item = random.choice(self.container.itemPool)
             locs = self.getLocations(item)
             if not locs:
                 self.log.debug("FillerRandom: constraint collision during step {} for item {}/{}".format(self.nSteps, item.Type, item.Class))
                 self.resetHelpingContainer()
-                date = time.process_time()
+                date = self.getDate()
                 continue
             loc = random.choice(locs)
             itemLoc = ItemLocation(item, loc)
             self.container.collect(itemLoc, pickup=False)
-        date = time.process_time()
-        if date > self.endDate:
+        date = self.getDate()
+        return date <= self.endDate
+
+    def step(self):
+        if self.seededAttempts:
+            return self.parallelStep()
+        # here a step is not an item collection but a whole fill attempt
+        if not self.fill():
             return False
         # pool is exhausted, use mini solver to see if it is beatable
         if self.isBeatable():
@@ -98,6 +122,139 @@ class FillerRandom(Filler):
 
         return True
 
+    def getAttemptSeed(self):
+        if len(self.attemptSeeds) > 0:
+            return self.attemptSeeds.pop(0)
+        return self.attemptsRandom.getrandbits(64)
+
+    # check the attempts results in the attempts order.
+    # return (seed, use backup) of the attempt to use, None to try another one, False if stuck
+    def checkAttempt(self, seed, beatable, difficulty):
+        if beatable == True:
+            return (seed, False)
+        if self.diffSteps > 0 and self.settings.maxDiff < infinity:
+            if self.nSteps < self.diffSteps:
+                if difficulty is not None and (self.beatableBackup is None or difficulty < self.beatableBackup[1]):
+                    self.beatableBackup = (seed, difficulty)
+            elif self.beatableBackup is not None:
+                return (self.beatableBackup[0], True)
+            else:
+                return False
+        if (self.nSteps + 1) % 100 == 0:
+            sys.stdout.write('x')
+            sys.stdout.flush()
+        return None
+
+    # set up the container with the attempt to use, replay it with its seed if it was
+    # run in a worker or if it's the backup
+    def useAttempt(self, seed, useBackup, replay):
+        if replay == True:
+            self.seededFill(seed)
+            beatable = self.isBeatable()
+            if useBackup == True:
+                # set the locations difficulty like the attempt did
+                self.isBeatable(maxDiff=infinity)
+            elif beatable == False:
+                # the replayed attempt differs from the one of the worker
+                self.log.debug("FillerRandom: attempt with seed {} is not beatable when replayed".format(seed))
+                self.resetHelpingContainer()
+                return True
+        if useBackup == True:
+            self.errorMsg += "Could not find a solution compatible with max difficulty. Estimated seed difficulty: "+diffValue2txt(self.beatableBackup[1])
+            sys.stdout.write('O')
+        else:
+            sys.stdout.write('o')
+        sys.stdout.flush()
+        return True
+
+    # the fill attempts are run in a pool of workers forked from the current state of the
+    # filler, with the same seeds as in the process. the results are checked in the attempts
+    # order, and their process time is counted in the same order, so the runtime limit and
+    # the speedrun help happen after the same attempts whatever the number of workers, and
+    # the seed does not depend on it. the attempt to use is replayed in the process.
+    # the seed differs from the one of the fill without workers, which uses the rando random state.
+    def parallelStep(self):
+        global currentFiller
+        workers = self.settings.fillWorkers
+        forkDate = self.getDate()
+        # stop the pool when the speedrun needs help
+        roundEndDate = min(self.endDate, self.getHelpDate())
+        currentFiller = (self, forkDate)
+        startDate = time.process_time()
+        attemptsTime = 0
+        result = None
+        pending = []
+        # don't print the buffered output in the workers
+        sys.stdout.flush()
+        try:
+            with multiprocessing.get_context('fork').Pool(workers, initializer=initFillWorker) as pool:
+                firstAttempt = True
+                while result is None:
+                    # keep a few attempts in advance for each worker
+                    while len(pending) < workers*2:
+                        seed = self.getAttemptSeed()
+                        pending.append((seed, pool.apply_async(fillAttempt, (seed,))))
+                    (seed, job) = pending.pop(0)
+                    (beatable, difficulty, duration) = job.get()
+                    if beatable is None:
+                        # runtime limit reached in the worker
+                        if firstAttempt == True:
+                            return False
+                        # try it again with the next pool
+                        pending.insert(0, (seed, job))
+                        break
+                    # the last attempt is counted by generateItems
+                    if firstAttempt == False:
+                        self.nSteps += 1
+                    firstAttempt = False
+                    attemptsTime += duration
+                    result = self.checkAttempt(seed, beatable, difficulty)
+                    if result == False:
+                        return False
+                    elif result is None and forkDate + attemptsTime > roundEndDate:
+                        break
+        finally:
+            currentFiller = None
+            self.parallelTime += attemptsTime - (time.process_time() - startDate)
+            self.attemptSeeds[:0] = [seed for (seed, job) in pending]
+
+        if result is None:
+            if self.getDate() > self.endDate:
+                return False
+            # help speedrun filler and continue with new workers
+            self.getHelp()
+            return True
+
+        (seed, useBackup) = result
+        return self.useAttempt(seed, useBackup, replay=True)
+
+    # runs an attempt, returns (beatable, difficulty if beatable without max difficulty).
+    # beatable is None if the runtime limit is reached.
+    def fillAttempt(self, seed):
+        if not self.seededFill(seed):
+            return (None, None)
+        if self.isBeatable():
+            return (True, None)
+        difficulty = None
+        if self.diffSteps > 0 and self.settings.maxDiff < infinity and self.isBeatable(maxDiff=infinity):
+            difficulty = max([il.Location.difficulty.difficulty for il in self.container.itemLocations])
+        return (False, difficulty)
+
+    # fill the helping container with the attempt seed. the random state is restored
+    # afterwards, so that the attempts don't change the random state of the rando.
+    def seededFill(self, seed):
+        randomState = random.getstate()
+        random.seed(seed)
+        try:
+            self.resetHelpingContainer()
+            return self.fill()
+        finally:
+            random.setstate(randomState)
+
+    # date at which the speedrun filler will help the random fill
+    def getHelpDate(self):
+        return infinity
+
 # no logic random fill with one item placement per step. intended for incremental filling,
 # so does not copy initial container before filling.
 class FillerRandomItems(Filler):
@@ -139,13 +296,13 @@ class FrontFillerKickstart(FrontFiller):
 
     # if during a step no item is a progression item, check all two items pairs instead of just one item
     def step(self, onlyBossCheck=False):
-        self.cache.reset()
+        self.cache.refresh()
         (itemLocDict, isProg) = self.services.getPossiblePlacements(self.ap, self.container, ComebackCheckType.NoCheck)
         if isProg == True:
             self.log.debug("FrontFillerKickstart: found prog item")
             return super(FrontFillerKickstart, self).step(onlyBossCheck)
 
-        self.cache.reset()
+        self.cache.refresh()
         pair = self.services.findStartupProgItemPair(self.ap, self.container)
         if pair == None:
             # no pair found or prog item found
@@ -191,7 +348,10 @@ class FillerRandomSpeedrun(FillerRandom):
             super(FillerRandomSpeedrun, self).createHelpingBaseLists()
 
     def getLocations(self, item):
-        return [loc for loc in self.container.unusedLocations if self.restrictions.canPlaceAtLocationFast(item.Type, loc.Name, self.container)]
+        # same as canPlaceAtLocationFast, with the mask of the item looked up once
+        mask = self.restrictions.getPlacementMaskFast(item.Type, self.container)
+        locBits = self.restrictions.locBits
+        return [loc for loc in self.container.unusedLocations if locBits[loc.Name] & mask]
 
     def isBeatable(self, maxDiff=None):
         miniOk = self.miniSolver.isBeatable(self.container.itemLocations, maxDiff=maxDiff)
@@ -215,7 +375,7 @@ class FillerRandomSpeedrun(FillerRandom):
                 self.vcr.empty()
 
             return False
-        now = time.process_time()
+        now = self.getDate()
         sys.stdout.write('S({}/{}ms)'.format(self.nSteps+1, int((now-self.startDate)*1000)))
         sys.stdout.flush()
 
@@ -243,11 +403,29 @@ class FillerRandomSpeedrun(FillerRandom):
             orderedItemLocations.append(itemLoc)
         self.progressionItemLocs = orderedItemLocations
 
+    def getHelpDate(self):
+        return self.runtimeSteps[self.nFrontFillSteps]
+
     def getHelp(self):
-        if time.process_time() > self.runtimeSteps[self.nFrontFillSteps]:
+        if self.getDate() > self.runtimeSteps[self.nFrontFillSteps]:
             # store the step for debug purpose
             sys.stdout.write('n({})'.format(self.nSteps))
             sys.stdout.flush()
             # help the random fill with a bit of frontfill
             self.nFrontFillSteps += self.stepIncr
             self.createBaseLists(updateBase=False)
+
+currentFiller = None
+
+# pool initializer, the filler is inherited from the parent process
+def initFillWorker():
+    (filler, forkDate) = currentFiller
+    # continue from the parent date, the process time is reset in the worker
+    filler.parallelTime = forkDate - time.process_time()
+
+# pool job, returns the attempt result and its process time
+def fillAttempt(seed):
+    (filler, forkDate) = currentFiller
+    startDate = time.process_time()
+    (beatable, difficulty) = filler.fillAttempt(seed)
+    return (beatable, difficulty, time.process_time() - startDate)
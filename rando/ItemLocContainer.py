@@ -34,13 +34,23 @@ class ContainerSoftBackup(object):
         self.itemPool = container.itemPool[:]
         self.unusedLocations = container.unusedLocations[:]
         self.currentItems = container.currentItems[:]
+        self.unrestrictedItems = set(container.unrestrictedItems)
+        self.version = container.version
 
-    def restore(self, container, resetSM=True):
+    def restore(self, container, resetSM=True, resetUnrestricted=False):
         # avoid costly deep copies of locations
         container.itemLocations = self.itemLocations[:]
         container.itemPool = self.itemPool[:]
         container.unusedLocations = self.unusedLocations[:]
         container.currentItems = self.currentItems[:]
+        if resetUnrestricted:
+            container.unrestrictedItems = set(self.unrestrictedItems)
+        # unrestricted items are not restored by default, the container is back
+        # to the backup version only if they did not change since
+        if container.unrestrictedItems == self.unrestrictedItems:
+            container.version = self.version
+        else:
+            container.newVersion()
         if resetSM:
             container.sm.resetItems()
             container.sm.addItems([it.Type for it in container.currentItems])
@@ -49,7 +59,14 @@ class ContainerSoftBackup(object):
 # placed items/locations (itemLocations).
 # If logic is needed, also holds a SMBoolManager (sm) and collected items so far
 # (collectedItems)
+# The version identifies the state of unused locations, collected items and
+# unrestricted items, it is used in the keys of the rando services cache.
+# A new version is allocated each time this state changes, and restored along
+# with the state on rollbacks.
 class ItemLocContainer(object):
+    # versions are unique between all containers
+    nextVersion = 0
+
     def __init__(self, sm, itemPool, locations):
         self.sm = sm
         self.itemLocations = []
@@ -58,9 +75,14 @@ class ItemLocContainer(object):
         self.itemPool = itemPool
         self.itemPoolBackup = None
         self.unrestrictedItems = set()
+        self.newVersion()
         self.log = utils.log.get('ItemLocContainer')
         self.checkConsistency()
 
+    def newVersion(self):
+        self.version = ItemLocContainer.nextVersion
+        ItemLocContainer.nextVersion += 1
+
     def checkConsistency(self):
         assert len(self.unusedLocations) == len(self.itemPool), "Item({})/Locs({}) count mismatch".format(len(self.itemPool), len(self.unusedLocations))
 
@@ -72,11 +94,17 @@ class ItemLocContainer(object):
 
         return eq
 
+    # the copy is not copy-on-write: the lists are copied (pointers only), the
+    # unused locations and the items are shared, but the locations of the placed
+    # items are copied, as the escape graph and the Chozo second phase put them
+    # back in an unused locations pool where the graph updates them.
+    # the collected items are added to the new smbm instead of copying the
+    # source one, which is not always in sync with the container.
     def __copy__(self):
         locs = copy.copy(self.unusedLocations)
         # we don't copy restriction state on purpose: it depends on
         # outside context we don't want to bring to the copy
-        ret = ItemLocContainer(SMBoolManager(),
+        ret = ItemLocContainer(SMBoolManager(self.sm.provenance),
                                self.itemPoolBackup[:] if self.itemPoolBackup != None else self.itemPool[:],
                                locs)
         ret.currentItems = self.currentItems[:]
@@ -103,10 +131,11 @@ class ItemLocContainer(object):
     # transfer collected items/locations to another container
     def transferCollected(self, dest):
         dest.currentItems = self.currentItems[:]
-        dest.sm = SMBoolManager()
+        dest.sm = SMBoolManager(self.sm.provenance)
         dest.sm.addItems([item.Type for item in dest.currentItems])
         dest.itemLocations = copy.copy(self.itemLocations)
         dest.unrestrictedItems = copy.copy(self.unrestrictedItems)
+        dest.newVersion()
 
     # reset collected items/locations. if reassignItemLocs is True,
     # will re-fill itemPool and unusedLocations as they were before
@@ -122,6 +151,7 @@ class ItemLocContainer(object):
                 self.unusedLocations.append(il.Location)
         self.unrestrictedItems = set()
         self.sm.resetItems()
+        self.newVersion()
 
     def dump(self):
         return "ItemPool(%d): %s\nLocPool(%d): %s\nCollected: %s" % (len(self.itemPool), getItemListStr(self.itemPool), len(self.unusedLocations), getLocListStr(self.unusedLocations), getItemListStr(self.currentItems))
@@ -143,6 +173,7 @@ class ItemLocContainer(object):
     def removeLocation(self, location):
         if location in self.unusedLocations:
             self.unusedLocations.remove(location)
+            self.newVersion()
 
     def removeItem(self, item):
         self.itemPool.remove(item)
@@ -161,6 +192,7 @@ class ItemLocContainer(object):
         self.removeLocation(location)
         self.itemLocations.append(itemLocation)
         self.removeItem(item)
+        self.newVersion()
 
     def isPoolEmpty(self):
         return len(self.itemPool) == 0
@@ -1,16 +1,37 @@
 
 import utils.log, random
+from collections import OrderedDict
 
 from logic.smboolmanager import SMBoolManager
+from logic.smbool import smboolFalse, getSMBoolNoProvenance
+from logic.rulecompiler import RuleCompiler
 from utils.parameters import infinity
 
+# the logic functions are evaluated with their compiled rules on the items
+# cache key (see RuleCompiler), the rules which can't be compiled are
+# evaluated with their reference function.
+# the access points walk and the locations check are the same as the ones of
+# AccessGraph.getAvailableLocations, the locations get the same attributes.
+# as they only depend on the collected items, the walks and the locations
+# states are kept between the checks: the fill attempts all start with no
+# items and often share their first collected items.
 class MiniSolver(object):
-    def __init__(self, startAP, areaGraph, restrictions):
+    def __init__(self, startAP, areaGraph, restrictions, maxWalks=1024):
         self.startAP = startAP
         self.areaGraph = areaGraph
         self.restrictions = restrictions
         self.settings = restrictions.settings
-        self.smbm = SMBoolManager()
+        self.smbm = SMBoolManager(provenance=False)
+        self.compiler = RuleCompiler(self.smbm)
+        # access point: [(destination access point, transition rule)]
+        self.transitionsRules = {}
+        # location name: ([(access point, access from rule)], available rule, post available rule)
+        self.locationsRules = {}
+        # (items cache key, max diff): [available access points, available areas, {location name: location state}]
+        self.walks = OrderedDict()
+        self.maxWalks = maxWalks
+        # the walks are valid for a knows generation and graph transitions
+        self.walksState = None
         self.log = utils.log.get('MiniSolver')
 
     # if True, does not mean it is actually beatable, unless you're sure of it from another source of information
@@ -28,7 +49,26 @@ class MiniSolver(object):
             loc.difficulty = None
             locations.append(loc)
         self.smbm.resetItems()
-        ap = self.startAP
+        self.checkWalksState()
+        # location name: [difficulty, distance] in the last check
+        states = {}
+        # location name: (access point name, path, path difficulty, location difficulty)
+        # the last time the location was available, the graph keeps them afterwards
+        availStates = {}
+        try:
+            return self.checkLocations(locations, maxDiff, minDiff, states, availStates)
+        finally:
+            self.updateLocations(locations, states, availStates)
+
+    def checkWalksState(self):
+        walksState = (self.smbm.cache.generation, self.areaGraph.InterAreaTransitions[:])
+        if walksState != self.walksState:
+            self.walksState = walksState
+            self.walks.clear()
+            self.transitionsRules = {}
+
+    def checkLocations(self, locations, maxDiff, minDiff, states, availStates):
+        evaluate = self.compiler.evaluate
         onlyBossesLeft = -1
         hasOneLocAboveMinDiff = False
         while True:
@@ -39,14 +79,17 @@ class MiniSolver(object):
                 onlyBossesLeft += 1
                 if onlyBossesLeft > 2:
                     return False
-            self.areaGraph.getAvailableLocations(locations, self.smbm, maxDiff, ap)
-            post = [loc for loc in locations if loc.PostAvailable and loc.difficulty.bool == True]
-            for loc in post:
-                self.smbm.addItem(loc.itemName)
-                postAvailable = loc.PostAvailable(self.smbm)
-                self.smbm.removeItem(loc.itemName)
-                loc.difficulty = self.smbm.wand(loc.difficulty, postAvailable)
-            toCollect = [loc for loc in locations if loc.difficulty.bool == True and loc.difficulty.difficulty <= maxDiff]
+            self.getAvailableLocations(locations, maxDiff, states, availStates)
+            toCollect = []
+            for loc in locations:
+                state = states[loc.Name]
+                if state[0].bool == True and loc.PostAvailable:
+                    self.smbm.addItem(loc.itemName)
+                    (ok, postDifficulty) = evaluate(self.getLocationRules(loc)[2])
+                    self.smbm.removeItem(loc.itemName)
+                    state[0] = getSMBoolNoProvenance(True, state[0].difficulty + postDifficulty) if ok else smboolFalse
+                if state[0].bool == True and state[0].difficulty <= maxDiff:
+                    toCollect.append(loc)
             if not toCollect:
                 # mini onlyBossesLeft
                 if maxDiff < infinity:
@@ -55,9 +98,118 @@ class MiniSolver(object):
                     continue
                 return False
             if not hasOneLocAboveMinDiff:
-                hasOneLocAboveMinDiff = any(loc.difficulty.difficulty >= minDiff for loc in locations)
+                hasOneLocAboveMinDiff = any(states[loc.Name][0].difficulty >= minDiff for loc in locations)
             self.smbm.addItems([loc.itemName for loc in toCollect])
-            for loc in toCollect:
-                locations.remove(loc)
-            # if len(locations) > 0:
-            #     ap = random.choice([loc.accessPoint for loc in locations])
+            collected = set([id(loc) for loc in toCollect])
+            locations = [loc for loc in locations if id(loc) not in collected]
+
+    # the results are stored in states and availStates
+    def getAvailableLocations(self, locations, maxDiff, states, availStates):
+        walk = self.getWalk(maxDiff)
+        locStates = walk[2]
+        for loc in locations:
+            locState = locStates.get(loc.Name)
+            if locState is None:
+                locState = locStates[loc.Name] = self.getLocationState(loc, walk, maxDiff)
+            (difficulty, distance, availState) = locState
+            states[loc.Name] = [difficulty, distance]
+            if availState is not None:
+                availStates[loc.Name] = availState
+
+    def getWalk(self, maxDiff):
+        key = (self.smbm.cacheKey, maxDiff)
+        walk = self.walks.get(key)
+        if walk is None:
+            availAPs = self.getAvailableAccessPoints(maxDiff)
+            walk = self.walks[key] = [availAPs, set([ap.GraphArea for ap in availAPs]), {}]
+            if len(self.walks) > self.maxWalks:
+                self.walks.popitem(last=False)
+        else:
+            self.walks.move_to_end(key)
+        return walk
+
+    # same walk as AccessGraph.getAvailableAccessPoints from the start AP.
+    # return a dict access point: (path difficulty, path length, distance, previous access point)
+    def getAvailableAccessPoints(self, maxDiff):
+        evaluate = self.compiler.evaluate
+        rootAP = self.areaGraph.accessPoints[self.startAP]
+        availAPs = {rootAP: (0, 1, 0, None)}
+        newAPs = [rootAP]
+        while newAPs:
+            nodes = newAPs
+            newAPs = []
+            for src in nodes:
+                for (dst, rule) in self.getTransitionsRules(src):
+                    if dst in availAPs:
+                        continue
+                    (ok, difficulty) = evaluate(rule)
+                    if ok and difficulty <= maxDiff:
+                        (pathDiff, pathLength, distance, prev) = availAPs[src]
+                        distance += 0.01 if src.GraphArea == dst.GraphArea else 1
+                        availAPs[dst] = (max(pathDiff, difficulty), pathLength + 1, distance, src)
+                        newAPs.append(dst)
+        return availAPs
+
+    # same as the locations check of AccessGraph.getAvailableLocations for one location.
+    # return (difficulty, distance, available state), the available state is None
+    # if the location is not available
+    def getLocationState(self, loc, walk, maxDiff):
+        (availAPs, availAreas, locStates) = walk
+        if loc.GraphArea not in availAreas:
+            return (smboolFalse, 30000, None)
+        evaluate = self.compiler.evaluate
+        (accessFromRules, availableRule, postAvailableRule) = self.getLocationRules(loc)
+        # from the easiest access point first, like the graph
+        locAPs = sorted((availAPs[ap][:2] + (ap.Name, ap, rule)) for (ap, rule) in accessFromRules if ap in availAPs)
+        if not locAPs:
+            return (smboolFalse, 40000, None)
+        for (pathDiff, pathLength, apName, ap, rule) in locAPs:
+            (ok, accessDiff) = evaluate(rule)
+            if ok and accessDiff <= maxDiff:
+                (ok, difficulty) = evaluate(availableRule)
+                if ok:
+                    pdiff = getSMBoolNoProvenance(True, pathDiff)
+                    (allDiff, locDiff) = self.areaGraph.computeLocDiff(getSMBoolNoProvenance(True, accessDiff),
+                                                                       getSMBoolNoProvenance(True, difficulty), pdiff, self.smbm)
+                    if allDiff.difficulty <= maxDiff:
+                        return (allDiff, availAPs[ap][2] + 1, (apName, self.getPath(ap, availAPs), pdiff, locDiff))
+                locState = (smboolFalse, 1000 + accessDiff, None)
+            else:
+                locState = (smboolFalse, 10000 + accessDiff, None)
+        return locState
+
+    def getPath(self, ap, availAPs):
+        path = []
+        while ap is not None:
+            path.insert(0, ap)
+            ap = availAPs[ap][3]
+        return path
+
+    # set the locations attributes like the graph would have
+    def updateLocations(self, locations, states, availStates):
+        for loc in locations:
+            state = states.get(loc.Name)
+            if state is None:
+                continue
+            (loc.difficulty, loc.distance) = state
+            availState = availStates.get(loc.Name)
+            if availState is not None:
+                (loc.accessPoint, path, loc.pathDifficulty, loc.locDifficulty) = availState
+                # the path is shared between the checks
+                loc.path = path[:]
+
+    def getTransitionsRules(self, ap):
+        rules = self.transitionsRules.get(ap)
+        if rules is None:
+            rules = self.transitionsRules[ap] = [(self.areaGraph.accessPoints[dstName], self.compiler.compile(func))
+                                                 for (dstName, func) in ap.transitions.items()]
+        return rules
+
+    def getLocationRules(self, loc):
+        rules = self.locationsRules.get(loc.Name)
+        if rules is None:
+            accessFromRules = [(self.areaGraph.accessPoints[apName], self.compiler.compile(func))
+                               for (apName, func) in loc.AccessFrom.items() if apName in self.areaGraph.accessPoints]
+            postAvailableRule = self.compiler.compile(loc.PostAvailable) if loc.PostAvailable else None
+            rules = self.locationsRules[loc.Name] = (accessFromRules, self.compiler.compile(loc.Available), postAvailableRule)
+        return rules
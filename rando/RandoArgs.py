@@ -0,0 +1,567 @@
+import argparse, random, utils.log
+
+from graph.graph_utils import GraphUtils, getAccessPoint
+from rom.rom_patches import RomPatches
+from utils.parameters import easy, medium, hard, harder, hardcore, mania, infinity, text2diff
+from utils.utils import getDefaultMultiValues
+from utils.objectives import Objectives
+
+def restricted_float(x):
+    x = float(x)
+    if x < 0.0 or x > 9.0:
+        raise argparse.ArgumentTypeError("%r not in range [1.0, 9.0]"%(x,))
+    return x
+
+# the randomizer.py parameters, also used by the batch generator to get their
+# default values (parse_args([])), the logic has to be loaded.
+def getRandomizerArgParser():
+    defaultMultiValues = getDefaultMultiValues()
+    speeds = defaultMultiValues['progressionSpeed']
+    energyQties = defaultMultiValues['energyQty']
+    progDiffs = defaultMultiValues['progressionDifficulty']
+    morphPlacements = defaultMultiValues['morphPlacement']
+    majorsSplits = defaultMultiValues['majorsSplit']
+    gravityBehaviours = defaultMultiValues['gravityBehaviour']
+    parser = argparse.ArgumentParser(description="Random Metroid Randomizer")
+    parser.add_argument('--patchOnly',
+                        help="only apply patches, do not perform any randomization", action='store_true',
+                        dest='patchOnly', default=False)
+    parser.add_argument('--param', '-p', help="the input parameters",
+                        default=None, dest='paramsFileName')
+    parser.add_argument('--dir',
+                        help="output directory for ROM and dot files",
+                        dest='directory', nargs='?', default='.')
+    parser.add_argument('--dot',
+                        help="generate dot file with area graph",
+                        action='store_true',dest='dot', default=False)
+    parser.add_argument('--area', help="area mode",
+                        dest='area', nargs='?', const=True, default=False)
+    parser.add_argument('--areaLayoutBase',
+                        help="use simple layout patch for area mode", action='store_true',
+                        dest='areaLayoutBase', default=False)
+    parser.add_argument('--lightArea', help="keep number of transitions between vanilla areas", action='store_true',
+                        dest='lightArea', default=False)
+    parser.add_argument('--escapeRando',
+                        help="Randomize the escape sequence",
+                        dest='escapeRando', nargs='?', const=True, default=False)
+    parser.add_argument('--noRemoveEscapeEnemies',
+                        help="Do not remove enemies during escape sequence", action='store_true',
+                        dest='noRemoveEscapeEnemies', default=False)
+    parser.add_argument('--bosses', help="randomize bosses",
+                        dest='bosses', nargs='?', const=True, default=False)
+    parser.add_argument('--minimizer', help="minimizer mode: area and boss mixed together. arg is number of non boss locations",
+                        dest='minimizerN', nargs='?', const=35, default=None,
+                        choices=[str(i) for i in range(30,101)]+["random"])
+    parser.add_argument('--startLocation', help="Name of the Access Point to start from",
+                        dest='startLocation', nargs='?', default="Landing Site",
+                        choices=['random'] + GraphUtils.getStartAccessPointNames())
+    parser.add_argument('--startLocationList', help="list to choose from when random",
+                        dest='startLocationList', nargs='?', default=None)
+    parser.add_argument('--debug', '-d', help="activate debug logging", dest='debug',
+                        action='store_true')
+    parser.add_argument('--maxDifficulty', '-t',
+                        help="the maximum difficulty generated seed will be for given parameters",
+                        dest='maxDifficulty', nargs='?', default=None,
+                        choices=['easy', 'medium', 'hard', 'harder', 'hardcore', 'mania', 'random'])
+    parser.add_argument('--minDifficulty',
+                        help="the minimum difficulty generated seed will be for given parameters (speedrun prog speed required)",
+                        dest='minDifficulty', nargs='?', default=None,
+                        choices=['easy', 'medium', 'hard', 'harder', 'hardcore', 'mania'])
+    parser.add_argument('--seed', '-s', help="randomization seed to use", dest='seed',
+                        nargs='?', default=0, type=int)
+    parser.add_argument('--rom', '-r',
+                        help="the vanilla ROM",
+                        dest='rom', nargs='?', default=None)
+    parser.add_argument('--output',
+                        help="to choose the name of the generated json (for the webservice)",
+                        dest='output', nargs='?', default=None)
+    parser.add_argument('--preset',
+                        help="the name of the preset (for the webservice)",
+                        dest='preset', nargs='?', default=None)
+    parser.add_argument('--patch', '-c',
+                        help="optional patches to add",
+                        dest='patches', nargs='?', default=[], action='append',
+                        choices=['itemsounds.ips', 'random_music.ips',
+                                 'fast_doors.ips', 'elevators_speed.ips', 'elevators_doors_speed.ips',
+                                 'spinjumprestart.ips', 'rando_speed.ips', 'No_Music', 'AimAnyButton.ips',
+                                 'max_ammo_display.ips', 'supermetroid_msu1.ips', 'Infinite_Space_Jump',
+                                 'refill_before_save.ips', 'remove_elevators_speed.ips',
+                                 'remove_fast_doors.ips', 'remove_Infinite_Space_Jump.ips',
+                                 'remove_rando_speed.ips', 'remove_spinjumprestart.ips',
+                                 'remove_itemsounds.ips', 'vanilla_music.ips', 'custom_ship.ips',
+                                 'Ship_Takeoff_Disable_Hide_Samus', 'widescreen.ips',
+                                 'hell.ips', 'lava_acid_physics.ips'])
+    parser.add_argument('--missileQty', '-m',
+                        help="quantity of missiles",
+                        dest='missileQty', nargs='?', default=3,
+                        type=restricted_float)
+    parser.add_argument('--superQty', '-q',
+                        help="quantity of super missiles",
+                        dest='superQty', nargs='?', default=2,
+                        type=restricted_float)
+    parser.add_argument('--powerBombQty', '-w',
+                        help="quantity of power bombs",
+                        dest='powerBombQty', nargs='?', default=1,
+                        type=restricted_float)
+    parser.add_argument('--minorQty', '-n',
+                        help="quantity of minors",
+                        dest='minorQty', nargs='?', default=100,
+                        choices=[str(i) for i in range(0,101)])
+    parser.add_argument('--energyQty', '-g',
+                        help="quantity of ETanks/Reserve Tanks",
+                        dest='energyQty', nargs='?', default='vanilla',
+                        choices=energyQties + ['random'])
+    parser.add_argument('--energyQtyList', help="list to choose from when random",
+                        dest='energyQtyList', nargs='?', default=None)
+    parser.add_argument('--strictMinors',
+                        help="minors quantities values will be strictly followed instead of being probabilities",
+                        dest='strictMinors', nargs='?', const=True, default=False)
+    parser.add_argument('--majorsSplit',
+                        help="how to split majors/minors: Full, FullWithHUD, Major, Chozo, Scavenger",
+                        dest='majorsSplit', nargs='?', choices=majorsSplits + ['random'], default='Full')
+    parser.add_argument('--majorsSplitList', help="list to choose from when random",
+                        dest='majorsSplitList', nargs='?', default=None)
+    parser.add_argument('--scavNumLocs',
+                        help="For Scavenger split, number of major locations in the mandatory route",
+                        dest='scavNumLocs', nargs='?', default=10,
+                        choices=["0"]+[str(i) for i in range(4,18)])
+    parser.add_argument('--scavRandomized',
+                        help="For Scavenger split, decide whether mandatory major locs will have non-vanilla items",
+                        dest='scavRandomized', nargs='?', const=True, default=False)
+    parser.add_argument('--suitsRestriction',
+                        help="no suits in early game",
+                        dest='suitsRestriction', nargs='?', const=True, default=False)
+    parser.add_argument('--morphPlacement',
+                        help="morph placement",
+                        dest='morphPlacement', nargs='?', default='early',
+                        choices=morphPlacements + ['random'])
+    parser.add_argument('--morphPlacementList', help="list to choose from when random",
+                        dest='morphPlacementList', nargs='?', default=None)
+    parser.add_argument('--hideItems', help="Like in dessy's rando hide half of the items",
+                        dest="hideItems", nargs='?', const=True, default=False)
+    parser.add_argument('--progressionSpeed', '-i',
+                        help="progression speed, from " + str(speeds) + ". 'random' picks a random speed from these. Pick a random speed from a subset using comma-separated values, like 'slow,medium,fast'.",
+                        dest='progressionSpeed', nargs='?', default='medium', choices=speeds+['random'])
+    parser.add_argument('--progressionSpeedList', help="list to choose from when random",
+                        dest='progressionSpeedList', nargs='?', default=None)
+    parser.add_argument('--progressionDifficulty',
+                        help="",
+                        dest='progressionDifficulty', nargs='?', default='normal',
+                        choices=progDiffs + ['random'])
+    parser.add_argument('--progressionDifficultyList', help="list to choose from when random",
+                        dest='progressionDifficultyList', nargs='?', default=None)
+    parser.add_argument('--superFun',
+                        help="randomly remove major items from the pool for maximum enjoyment",
+                        dest='superFun', nargs='?', default=[], action='append',
+                        choices=['Movement', 'Combat', 'Suits', 'MovementRandom', 'CombatRandom', 'SuitsRandom'])
+    parser.add_argument('--animals',
+                        help="randomly change the save the animals room",
+                        dest='animals', action='store_true', default=False)
+    parser.add_argument('--nolayout',
+                        help="do not include total randomizer layout patches",
+                        dest='noLayout', action='store_true', default=False)
+    parser.add_argument('--gravityBehaviour',
+                        help="varia/gravity suits behaviour",
+                        dest='gravityBehaviour', nargs='?', default='Balanced', choices=gravityBehaviours+['random'])
+    parser.add_argument('--gravityBehaviourList', help="list to choose from when random",
+                        dest='gravityBehaviourList', nargs='?', default=None)
+    parser.add_argument('--nerfedCharge',
+                        help="apply nerfed charge patch",
+                        dest='nerfedCharge', action='store_true', default=False)
+    parser.add_argument('--novariatweaks',
+                        help="do not include VARIA randomizer tweaks",
+                        dest='noVariaTweaks', action='store_true', default=False)
+    parser.add_argument('--controls',
+                        help="specify controls, comma-separated, in that order: Shoot,Jump,Dash,ItemSelect,ItemCancel,AngleUp,AngleDown. Possible values: A,B,X,Y,L,R,Select,None",
+                        dest='controls')
+    parser.add_argument('--moonwalk',
+                        help="Enables moonwalk by default",
+                        dest='moonWalk', action='store_true', default=False)
+    parser.add_argument('--runtime',
+                        help="Maximum runtime limit in seconds. If 0 or negative, no runtime limit. Default is 30.",
+                        dest='runtimeLimit_s', nargs='?', default=30, type=int)
+    parser.add_argument('--fillWorkers',
+                        help="Number of processes running the random fill attempts of the speedrun progression speed. Default is 1.",
+                        dest='fillWorkers', nargs='?', default=1, type=int)
+    parser.add_argument('--race', help="Race mode magic number", dest='raceMagic',
+                        type=int)
+    parser.add_argument('--vcr', help="Generate VCR output file", dest='vcr', action='store_true')
+    parser.add_argument('--palette', help="Randomize the palettes", dest='palette', action='store_true')
+    parser.add_argument('--individual_suit_shift', help="palette param", action='store_true',
+                        dest='individual_suit_shift', default=False)
+    parser.add_argument('--individual_tileset_shift', help="palette param", action='store_true',
+                        dest='individual_tileset_shift', default=False)
+    parser.add_argument('--no_match_ship_and_power', help="palette param", action='store_false',
+                        dest='match_ship_and_power', default=True)
+    parser.add_argument('--seperate_enemy_palette_groups', help="palette param", action='store_true',
+                        dest='seperate_enemy_palette_groups', default=False)
+    parser.add_argument('--no_match_room_shift_with_boss', help="palette param", action='store_false',
+                        dest='match_room_shift_with_boss', default=True)
+    parser.add_argument('--no_shift_tileset_palette', help="palette param", action='store_false',
+                        dest='shift_tileset_palette', default=True)
+    parser.add_argument('--no_shift_boss_palettes', help="palette param", action='store_false',
+                        dest='shift_boss_palettes', default=True)
+    parser.add_argument('--no_shift_suit_palettes', help="palette param", action='store_false',
+                        dest='shift_suit_palettes', default=True)
+    parser.add_argument('--no_shift_enemy_palettes', help="palette param", action='store_false',
+                        dest='shift_enemy_palettes', default=True)
+    parser.add_argument('--no_shift_beam_palettes', help="palette param", action='store_false',
+                        dest='shift_beam_palettes', default=True)
+    parser.add_argument('--no_shift_ship_palette', help="palette param", action='store_false',
+                        dest='shift_ship_palette', default=True)
+    parser.add_argument('--min_degree', help="min hue shift", dest='min_degree', nargs='?', default=-180, type=int)
+    parser.add_argument('--max_degree', help="max hue shift", dest='max_degree', nargs='?', default=180, type=int)
+    parser.add_argument('--no_global_shift', help="", action='store_false', dest='global_shift', default=True)
+    parser.add_argument('--invert', help="invert color range", dest='invert', action='store_true', default=False)
+    parser.add_argument('--no_blue_door_palette', help="palette param", action='store_true',
+                        dest='no_blue_door_palette', default=False)
+    parser.add_argument('--ext_stats', help="dump extended stats SQL", nargs='?', default=None, dest='extStatsFilename')
+    parser.add_argument('--randoPreset', help="rando preset file", dest="randoPreset", nargs='?', default=None)
+    parser.add_argument('--fakeRandoPreset', help="for prog speed stats", dest="fakeRandoPreset", nargs='?', default=None)
+    parser.add_argument('--plandoRando', help="json string with already placed items/locs", dest="plandoRando",
+                        nargs='?', default=None)
+    parser.add_argument('--sprite', help='use a custom sprite for Samus', dest='sprite', default=None)
+    parser.add_argument('--no_spin_attack', help='when using a custom sprite, use the same animation for screw attack with or without Space Jump', dest='noSpinAttack', action='store_true', default=False)
+    parser.add_argument('--customItemNames', help='add custom item names for some of them, related to the custom sprite',
+                        dest='customItemNames', action='store_true', default=False)
+    parser.add_argument('--ship', help='use a custom sprite for Samus ship', dest='ship', default=None)
+    parser.add_argument('--seedIps', help='ips generated from previous seed', dest='seedIps', default=None)
+    parser.add_argument('--jm,', help="display data used by jm for its stats", dest='jm', action='store_true', default=False)
+    parser.add_argument('--doorsColorsRando', help='randomize color of colored doors', dest='doorsColorsRando',
+                        nargs='?', const=True, default=False)
+    parser.add_argument('--allowGreyDoors', help='add grey color in doors colors pool', dest='allowGreyDoors',
+                        nargs='?', const=True, default=False)
+    parser.add_argument('--logic', help='logic to use', dest='logic', nargs='?', default="varia", choices=["varia", "rotation"])
+    parser.add_argument('--hud', help='Enable VARIA hud', dest='hud',
+                        nargs='?', const=True, default=False)
+    parser.add_argument('--music',
+                        help="JSON file for music replacement mapping",
+                        dest='music', nargs='?', default=None)
+    parser.add_argument('--objective',
+                        help="objectives to open G4",
+                        dest='objective', nargs='?', default=[], action='append',
+                        choices=Objectives.getAllGoals()+["random"])
+    parser.add_argument('--objectiveList', help="list to choose from when random",
+                        dest='objectiveList', nargs='?', default=None)
+    parser.add_argument('--tourian', help="Tourian mode",
+                        dest='tourian', nargs='?', default='Vanilla',
+                        choices=['Vanilla', 'Fast', 'Disabled'])
+    parser.add_argument('--hellrun', help="Hellrun damage rate in %, between 0 and 400 (default 100)",
+                        dest='hellrunRate', default=100, type=int)
+    parser.add_argument('--etanks', help="Additional ETanks, between 0 (default) and 18",
+                        dest='additionalEtanks', default=0, type=int)
+    return parser
+
+# processing of the randomizer.py parameters used for the items placement,
+# shared by randomizer.py and the batch generator (RandoBatch).
+# the random parameters are drawn from the global random module in the
+# same order in both, so a seed gives the same items placement.
+# the results are set as attributes, the global logic state (objectives,
+# active patches) is set.
+class RandoArgs(object):
+    # args: the randomizer.py parameters, updated with the drawn values
+    # forceArg: function(arg, value, msg, altValue=None, webArg=None, webValue=None)
+    #           to force a parameter value and notify it, the value is just set if None
+    # errorMsgs: list where the messages for the user are added
+    def __init__(self, args, forceArg=None, errorMsgs=None):
+        self.args = args
+        self.forceArg = forceArg if forceArg is not None else self.setArg
+        self.errorMsgs = errorMsgs if errorMsgs is not None else []
+        self.defaultMultiValues = getDefaultMultiValues()
+        self.log = utils.log.get('Rando')
+
+    def setArg(self, arg, value, msg, altValue=None, webArg=None, webValue=None):
+        okValues = [value]
+        if altValue is not None:
+            okValues.append(altValue)
+        if getattr(self.args, arg) not in okValues:
+            setattr(self.args, arg, value)
+
+    def randomMulti(self, param):
+        value = getattr(self.args, param)
+        isRandom = False
+        if value == "random":
+            isRandom = True
+            if getattr(self.args, param+"List") != None:
+                # use provided list
+                choices = getattr(self.args, param+"List").split(',')
+                value = random.choice(choices)
+            else:
+                # use default list
+                value = random.choice(self.defaultMultiValues[param])
+        return (isRandom, value)
+
+    # raise ValueError if the start location is not valid, the reasons are in errorMsgs
+    def process(self):
+        args = self.args
+        forceArg = self.forceArg
+        # if no max diff, set it very high
+        if args.maxDifficulty:
+            if args.maxDifficulty == 'random':
+                diffs = ['easy', 'medium', 'hard', 'harder', 'hardcore', 'mania']
+                maxDifficulty = text2diff[random.choice(diffs)]
+            else:
+                maxDifficulty = text2diff[args.maxDifficulty]
+        else:
+            maxDifficulty = infinity
+        # same as solver, increase max difficulty
+        threshold = maxDifficulty
+        epsilon = 0.001
+        if maxDifficulty <= easy:
+            threshold = medium - epsilon
+        elif maxDifficulty <= medium:
+            threshold = hard - epsilon
+        elif maxDifficulty <= hard:
+            threshold = harder - epsilon
+        elif maxDifficulty <= harder:
+            threshold = hardcore - epsilon
+        elif maxDifficulty <= hardcore:
+            threshold = mania - epsilon
+        self.maxDifficulty = maxDifficulty = threshold
+        self.log.debug("maxDifficulty: {}".format(maxDifficulty))
+        # handle random parameters with dynamic pool of values
+        (_, progSpeed) = self.randomMulti("progressionSpeed")
+        (_, progDiff) = self.randomMulti("progressionDifficulty")
+        (self.majorsSplitRandom, args.majorsSplit) = self.randomMulti("majorsSplit")
+        (_, self.gravityBehaviour) = self.randomMulti("gravityBehaviour")
+        if args.minDifficulty:
+            self.minDifficulty = text2diff[args.minDifficulty]
+            if progSpeed != "speedrun":
+                self.errorMsgs.append("Minimum difficulty setting ignored, as prog speed is not speedrun")
+        else:
+            self.minDifficulty = 0
+
+        if args.area == True and args.bosses == True and args.minimizerN is not None:
+            if args.minimizerN == "random":
+                minimizerN = random.randint(30, 60)
+                self.log.debug("minimizerN: {}".format(minimizerN))
+            else:
+                minimizerN = int(args.minimizerN)
+            if minimizerN < 100:
+                forceArg('majorsSplit', 'Full', "'Majors Split' forced to Full. Use 100 locations on your minimizer to use a non-Full split.", altValue='FullWithHUD')
+        else:
+            minimizerN = None
+        self.minimizerN = minimizerN
+        self.areaRandom = False
+        if args.area == 'random':
+            self.areaRandom = True
+            args.area = bool(random.getrandbits(1))
+        self.log.debug("area: {}".format(args.area))
+
+        self.doorsColorsRandom = False
+        if args.doorsColorsRando == 'random':
+            self.doorsColorsRandom = True
+            args.doorsColorsRando = bool(random.getrandbits(1))
+        self.log.debug("doorsColorsRando: {}".format(args.doorsColorsRando))
+
+        self.bossesRandom = False
+        if args.bosses == 'random':
+            self.bossesRandom = True
+            args.bosses = bool(random.getrandbits(1))
+        self.log.debug("bosses: {}".format(args.bosses))
+
+        if args.escapeRando == 'random':
+            args.escapeRando = bool(random.getrandbits(1))
+        self.log.debug("escapeRando: {}".format(args.escapeRando))
+
+        if args.suitsRestriction != False and minimizerN is not None:
+            forceArg('suitsRestriction', False, "'Suits restriction' forced to off", webValue='off')
+
+        if args.suitsRestriction == 'random':
+            if args.morphPlacement == 'late' and args.area == True:
+                forceArg('suitsRestriction', False, "'Suits restriction' forced to off", webValue='off')
+            else:
+                args.suitsRestriction = bool(random.getrandbits(1))
+        self.log.debug("suitsRestriction: {}".format(args.suitsRestriction))
+
+        if args.hideItems == 'random':
+            args.hideItems = bool(random.getrandbits(1))
+
+        if args.morphPlacement == 'random':
+            if args.morphPlacementList != None:
+                morphPlacements = args.morphPlacementList.split(',')
+            else:
+                morphPlacements = self.defaultMultiValues['morphPlacement']
+            args.morphPlacement = random.choice(morphPlacements)
+        # Scavenger Hunt constraints
+        if args.majorsSplit == 'Scavenger':
+            forceArg('progressionSpeed', 'speedrun', "'Progression speed' forced to speedrun")
+            progSpeed = "speedrun"
+            forceArg('hud', True, "'VARIA HUD' forced to on", webValue='on')
+            if not GraphUtils.isStandardStart(args.startLocation):
+                forceArg('startLocation', "Landing Site", "Start Location forced to Landing Site because of Scavenger mode")
+            if args.morphPlacement == 'late':
+                forceArg('morphPlacement', 'normal', "'Morph Placement' forced to normal instead of late")
+        # use escape rando for auto escape trigger
+        if args.tourian == 'Disabled':
+            forceArg('escapeRando', True, "'Escape randomization' forced to on", webValue='on')
+            forceArg('noRemoveEscapeEnemies', True, "Enemies enabled during escape sequence", webArg='removeEscapeEnemies', webValue='off')
+        # random fill makes certain options unavailable
+        if (progSpeed == 'speedrun' or progSpeed == 'basic') and args.majorsSplit != 'Scavenger':
+            forceArg('progressionDifficulty', 'normal', "'Progression difficulty' forced to normal")
+            progDiff = args.progressionDifficulty
+        self.log.debug("progressionDifficulty: {}".format(progDiff))
+        self.progSpeed = progSpeed
+        self.progDiff = progDiff
+
+        if args.strictMinors == 'random':
+            args.strictMinors = bool(random.getrandbits(1))
+
+        # in plando rando we know that the start ap is ok
+        if not GraphUtils.isStandardStart(args.startLocation) and args.plandoRando is None:
+            if args.majorsSplit in ['Major', "Chozo"]:
+                forceArg('hud', True, "'VARIA HUD' forced to on", webValue='on')
+            forceArg('noVariaTweaks', False, "'VARIA tweaks' forced to on", webValue='on')
+            forceArg('noLayout', False, "'Anti-softlock layout patches' forced to on", webValue='on')
+            forceArg('suitsRestriction', False, "'Suits restriction' forced to off", webValue='off')
+            forceArg('areaLayoutBase', False, "'Additional layout patches for easier navigation' forced to on", webValue='on')
+            possibleStartAPs, reasons = GraphUtils.getPossibleStartAPs(args.area, maxDifficulty, args.morphPlacement)
+            if args.startLocation == 'random':
+                if args.startLocationList != None:
+                    # to be able to give the list in jm we had to replace ' ' with '_', do the opposite operation
+                    startLocationList = args.startLocationList.replace('_', ' ')
+                    startLocationList = startLocationList.split(',')
+                    # intersection between user whishes and reality
+                    possibleStartAPs = sorted(list(set(possibleStartAPs).intersection(set(startLocationList))))
+                    if len(possibleStartAPs) == 0:
+                        self.errorMsgs += ["%s : %s" % (apName, cause) for apName, cause in reasons.items() if apName in startLocationList]
+                        self.errorMsgs.append('Invalid start locations list with your settings.')
+                        raise ValueError('Invalid start locations list with your settings.')
+                args.startLocation = random.choice(possibleStartAPs)
+            elif args.startLocation not in possibleStartAPs:
+                self.errorMsgs.append('Invalid start location: {}.  {}'.format(args.startLocation, reasons[args.startLocation]))
+                self.errorMsgs.append('Possible start locations with these settings: {}'.format(possibleStartAPs))
+                raise ValueError('Invalid start location: {}.  {}'.format(args.startLocation, reasons[args.startLocation]))
+        ap = getAccessPoint(args.startLocation)
+        if 'forcedEarlyMorph' in ap.Start and ap.Start['forcedEarlyMorph'] == True:
+            forceArg('morphPlacement', 'early', "'Morph Placement' forced to early for custom start location")
+        else:
+            if progSpeed == 'speedrun':
+                if args.morphPlacement == 'late':
+                    forceArg('morphPlacement', 'normal', "'Morph Placement' forced to normal instead of late")
+                elif (not GraphUtils.isStandardStart(args.startLocation)) and args.morphPlacement != 'normal':
+                    forceArg('morphPlacement', 'normal', "'Morph Placement' forced to normal for custom start location")
+            if args.majorsSplit == 'Chozo' and args.morphPlacement == "late":
+                forceArg('morphPlacement', 'normal', "'Morph Placement' forced to normal for Chozo")
+
+        self.objectivesManager = None
+        if args.patchOnly == False:
+            self.setObjectives()
+
+        # fill restrictions dict
+        restrictions = { 'Suits' : args.suitsRestriction, 'Morph' : args.morphPlacement, "doors": "normal" if not args.doorsColorsRando else "late" }
+        restrictions['MajorMinor'] = 'Full' if args.majorsSplit == 'FullWithHUD' else args.majorsSplit
+        if restrictions["MajorMinor"] == "Scavenger":
+            scavNumLocs = int(args.scavNumLocs)
+            if scavNumLocs == 0:
+                scavNumLocs = random.randint(4,16)
+            restrictions["ScavengerParams"] = {'numLocs':scavNumLocs, 'vanillaItems':not args.scavRandomized}
+        restrictions["EscapeTrigger"] = args.tourian == 'Disabled'
+        self.restrictions = restrictions
+
+        self.setPatches()
+        self.setQuantities()
+
+        if len(args.superFun) > 0:
+            superFun = []
+            for fun in args.superFun:
+                if fun.find('Random') != -1:
+                    if bool(random.getrandbits(1)) == True:
+                        superFun.append(fun[0:fun.find('Random')])
+                else:
+                    superFun.append(fun)
+            args.superFun = superFun
+        self.log.debug("superFun: {}".format(args.superFun))
+
+    def setObjectives(self):
+        args = self.args
+        objectivesManager = self.objectivesManager = Objectives(args.tourian != 'Disabled')
+        addedObjectives = 0
+        if args.majorsSplit == "Scavenger":
+            objectivesManager.setScavengerHunt()
+            addedObjectives = 1
+
+        if args.objective:
+            maxActiveGoals = Objectives.maxActiveGoals - addedObjectives
+            if "random" in args.objective:
+                availableObjectives = args.objectiveList.replace('_', ' ').split(',') if args.objectiveList is not None else self.defaultMultiValues['objective']
+                nbObjectives = random.randint(1, min(maxActiveGoals, len(availableObjectives)))
+                objectivesManager.setRandom(nbObjectives, availableObjectives)
+            else:
+                if len(args.objective) > maxActiveGoals:
+                    args.objective = args.objective[0:maxActiveGoals]
+                for goal in args.objective:
+                    objectivesManager.addGoal(goal)
+            objectivesManager.expandGoals()
+        else:
+            objectivesManager.setVanilla()
+        if any(goal for goal in Objectives.activeGoals if goal.area is not None):
+            self.forceArg('hud', True, "'VARIA HUD' forced to on", webValue='on')
+
+    def setPatches(self):
+        args = self.args
+        if args.noLayout == True:
+            RomPatches.ActivePatches = RomPatches.TotalBase
+        else:
+            RomPatches.ActivePatches = RomPatches.Total
+        RomPatches.ActivePatches.remove(RomPatches.BlueBrinstarBlueDoor)
+        RomPatches.ActivePatches += GraphUtils.getGraphPatches(args.startLocation)
+        if self.gravityBehaviour != "Balanced":
+            RomPatches.ActivePatches.remove(RomPatches.NoGravityEnvProtection)
+        if self.gravityBehaviour == "Progressive":
+            RomPatches.ActivePatches.append(RomPatches.ProgressiveSuits)
+        if args.nerfedCharge == True:
+            RomPatches.ActivePatches.append(RomPatches.NerfedCharge)
+        if args.noVariaTweaks == False:
+            RomPatches.ActivePatches += RomPatches.VariaTweaks
+        if self.minimizerN is not None:
+            RomPatches.ActivePatches.append(RomPatches.NoGadoras)
+        if args.tourian == 'Fast':
+            RomPatches.ActivePatches += RomPatches.MinimizerTourian
+        elif args.tourian == 'Disabled':
+            RomPatches.ActivePatches.append(RomPatches.NoTourian)
+
+    def setQuantities(self):
+        args = self.args
+        missileQty = float(args.missileQty)
+        superQty = float(args.superQty)
+        powerBombQty = float(args.powerBombQty)
+        minorQty = int(args.minorQty)
+        energyQty = args.energyQty
+        if missileQty < 1:
+            missileQty = random.randint(1, 9)
+        if superQty < 1:
+            superQty = random.randint(1, 9)
+        if powerBombQty < 1:
+            powerBombQty = random.randint(1, 9)
+        if minorQty < 1:
+            minorQty = random.randint(25, 100)
+        if energyQty == 'random':
+            if args.energyQtyList != None:
+                # with jm can't have a list with space in it
+                energyQtyList = args.energyQtyList.replace('_', ' ')
+                energyQties = energyQtyList.split(',')
+            else:
+                energyQties = self.defaultMultiValues['energyQty']
+            energyQty = random.choice(energyQties)
+        if energyQty == 'ultra sparse':
+            # add nerfed rainbow beam patch
+            RomPatches.ActivePatches.append(RomPatches.NerfedRainbowBeam)
+        self.energyQty = energyQty
+        self.qty = {'energy': energyQty,
+                    'minors': minorQty,
+                    'ammo': { 'Missile': missileQty,
+                              'Super': superQty,
+                              'PowerBomb': powerBombQty },
+                    'strictMinors' : args.strictMinors }
+        self.log.debug("quantities: {}".format(self.qty))
+
+    # the area and doors colors patches, added after the plando patches
+    def addAreaPatches(self):
+        args = self.args
+        if args.area == True:
+            RomPatches.ActivePatches += RomPatches.AreaBaseSet
+            if args.areaLayoutBase == False:
+                RomPatches.ActivePatches += RomPatches.AreaComfortSet
+        if args.doorsColorsRando == True:
+            RomPatches.ActivePatches.append(RomPatches.RedDoorsMissileOnly)
@@ -0,0 +1,107 @@
+import sys, os, io, copy, random, time, contextlib, multiprocessing, utils.log
+
+from rando.RandoSettings import RandoSettings, GraphSettings
+from rando.RandoExec import RandoExec
+from rando.RandoArgs import RandoArgs, getRandomizerArgParser
+from utils.parameters import appDir
+from utils.utils import PresetLoader, loadRandoPreset, getPresetDir
+from utils.doorsmanager import DoorsManager
+
+# batch generation of seeds (items placement only, no rom) for a rando preset
+# and a skill preset, used to compute the extended stats.
+#
+# the logic state (patches, doors, objectives, knows) and the random module
+# used by the rando are global, so each seed is generated in its own worker,
+# freshly forked from the parent once the preset is loaded.
+# the seed of each job is drawn from the batch seed, and the settings are
+# processed like randomizer.py does (RandoArgs), so a seed of the batch gives
+# the same items placement as randomizer.py with the same presets and --seed.
+class RandoBatch(object):
+    def __init__(self, randoPreset, skillPreset=None, runtimeLimit_s=30, fakeRandoPreset=None):
+        self.log = utils.log.get('RandoBatch')
+        self.args = self.getDefaultArgs()
+        preset = loadRandoPreset(randoPreset, self.args)
+        # use the skill preset from the rando preset
+        if skillPreset is None:
+            skillPreset = '{}/{}/{}.json'.format(appDir, getPresetDir(preset), preset)
+        self.skillPreset = os.path.splitext(os.path.basename(skillPreset))[0]
+        if fakeRandoPreset is not None:
+            self.randoPreset = fakeRandoPreset
+        else:
+            self.randoPreset = os.path.splitext(os.path.basename(randoPreset))[0]
+        self.args.runtimeLimit_s = runtimeLimit_s
+        PresetLoader.factory(skillPreset).load()
+
+    # randomizer.py default values of the parameters
+    def getDefaultArgs(self):
+        return getRandomizerArgParser().parse_args([])
+
+    # same processing of the parameters as randomizer.py (RandoArgs), consuming the same random numbers.
+    # return (seedName, RandoSettings, GraphSettings), the global logic state is set.
+    def getSettings(self, seed):
+        args = copy.deepcopy(self.args)
+        # the global random module is seeded: each job relies on running in its
+        # own freshly forked worker (see run), where nothing else uses it.
+        random.seed(seed)
+        randoArgs = RandoArgs(args)
+        randoArgs.process()
+
+        seedName = 'VARIA_Randomizer_{}_{}_{}'.format(seed, self.skillPreset, self.randoPreset)
+        randoSettings = RandoSettings(randoArgs.maxDifficulty, randoArgs.progSpeed, randoArgs.progDiff, randoArgs.qty,
+                                      randoArgs.restrictions, args.superFun, args.runtimeLimit_s,
+                                      None, randoArgs.minDifficulty)
+        randoArgs.addAreaPatches()
+        graphSettings = GraphSettings(args.startLocation, args.area, args.lightArea, args.bosses,
+                                      args.escapeRando, randoArgs.minimizerN, None, args.doorsColorsRando, args.allowGreyDoors,
+                                      None)
+        DoorsManager.setDoorsColor()
+
+        return (seedName, randoSettings, graphSettings)
+
+    # generate one seed, return a dict with the items placement
+    def generate(self, seed):
+        start = time.process_time()
+        ret = {'seed': seed, 'skillPreset': self.skillPreset, 'randoPreset': self.randoPreset}
+        try:
+            # the rando prints its progress
+            with contextlib.redirect_stdout(io.StringIO()):
+                (seedName, randoSettings, graphSettings) = self.getSettings(seed)
+                randoExec = RandoExec(seedName, False, randoSettings, graphSettings)
+                (stuck, itemLocs, progItemLocs) = randoExec.randomize()
+            ret['stuck'] = stuck
+            ret['errorMsg'] = randoExec.errorMsg
+            ret['locsItems'] = {il.Location.Name: il.Item.Type for il in itemLocs}
+            ret['progItemLocs'] = [il.Location.Name for il in progItemLocs] if progItemLocs is not None else []
+        except Exception as e:
+            self.log.debug("seed {}: {}".format(seed, e))
+            ret['stuck'] = True
+            ret['errorMsg'] = "Error: {}".format(e)
+        ret['duration'] = time.process_time() - start
+        return ret
+
+    # seeds of the jobs of a batch
+    @staticmethod
+    def getSeeds(batchSeed, count):
+        rnd = random.Random(batchSeed)
+        return [rnd.randrange(sys.maxsize) for i in range(count)]
+
+    # generate the seeds in a pool of workers, yield the results in completion order
+    def run(self, seeds, workers):
+        global currentBatch
+        currentBatch = self
+        # a new worker for each seed to start from the global state of the parent
+        with multiprocessing.get_context('fork').Pool(workers, maxtasksperchild=1) as pool:
+            for ret in pool.imap_unordered(generateSeed, seeds):
+                yield ret
+
+    # add the seed to the extended stats, like randomizer.py does
+    def addExtStats(self, ret, extStats):
+        # exclude minors, they're added by the solver
+        locsItems = {loc: item for (loc, item) in ret['locsItems'].items() if item not in ['Missile', 'Super', 'PowerBomb']}
+        extStats.addItems(locsItems)
+
+currentBatch = None
+
+# pool job, the batch is inherited from the parent process
+def generateSeed(seed):
+    return currentBatch.generate(seed)
@@ -31,7 +31,7 @@ class RandoServices(object):
         if pickup == True:
             # walk the graph to update AP
             if self.cache:
-                self.cache.reset()
+                self.cache.refresh()
             self.currentLocations(ap, container)
         container.collect(itemLoc, pickup=pickup)
         self.log.debug("COLLECT "+itemLoc.Item.Type+" at "+itemLoc.Location.Name)
@@ -60,28 +60,60 @@ class RandoServices(object):
     # post: checks post available?
     # diff: max difficulty to use (None for max diff from settings)
     def currentLocations(self, ap, container, item=None, post=False, diff=None):
+        if diff is None:
+            diff = self.settings.maxDiff
         if self.cache is not None:
-            request = self.cache.request('currentLocations', ap, container, None if item is None else item.Type, post, diff)
+            # locPostAvailable reads the max diff from the settings
+            request = self.cache.request('currentLocations', ap, container, None if item is None else item.Type, post, diff, self.settings.maxDiff)
             ret = self.cache.get(request)
             if ret is not None:
                 return ret
         sm = container.sm
-        if diff is None:
-            diff = self.settings.maxDiff
         itemType = None
         if item is not None:
             itemType = item.Type
             sm.addItem(itemType)
         ret = sorted(self.getAvailLocs(container, ap, diff),
                      key=lambda loc: loc.Name)
+        if self.cache is not None:
+            replay = self.getLocationsReplay(container.unusedLocations, ret)
         if post is True:
             ret = [loc for loc in ret if self.locPostAvailable(sm, loc, itemType)]
         if item is not None:
             sm.removeItem(itemType)
         if self.cache is not None:
-            self.cache.store(request, ret)
+            self.cache.store(request, ret, replay)
         return ret
 
+    # the graph stores the difficulty and access point in the available locations,
+    # and sets the other ones as unavailable. return a function to set them again
+    # when a cached result is used.
+    # the state is kept in two flat tuples, as there's one for each cached result:
+    # (loc, distance, accessPoint, difficulty, path, pathDifficulty, locDifficulty) for
+    # each available location, (loc, distance, difficulty) for the other ones.
+    def getLocationsReplay(self, locations, availLocs):
+        availIds = set(id(loc) for loc in availLocs)
+        availState = tuple(value for loc in availLocs
+                           for value in (loc, loc.distance, loc.accessPoint, loc.difficulty, loc.path, loc.pathDifficulty, loc.locDifficulty))
+        unavailState = tuple(value for loc in locations if id(loc) not in availIds
+                             for value in (loc, loc.distance, loc.difficulty))
+        return lambda: RandoServices.replayLocations(availState, unavailState)
+
+    @staticmethod
+    def replayLocations(availState, unavailState):
+        it = iter(availState)
+        for (loc, distance, accessPoint, difficulty, path, pathDifficulty, locDifficulty) in zip(it, it, it, it, it, it, it):
+            loc.distance = distance
+            loc.accessPoint = accessPoint
+            loc.difficulty = difficulty
+            loc.path = path
+            loc.pathDifficulty = pathDifficulty
+            loc.locDifficulty = locDifficulty
+        it = iter(unavailState)
+        for (loc, distance, difficulty) in zip(it, it, it):
+            loc.distance = distance
+            loc.difficulty = difficulty
+
     def locPostAvailable(self, sm, loc, item):
         if loc.PostAvailable is None:
             return True
@@ -96,7 +128,7 @@ class RandoServices(object):
     # gives current accessible APs within a container from an AP, given an optional item.
     def currentAccessPoints(self, ap, container, item=None):
         if self.cache is not None:
-            request = self.cache.request('currentAccessPoints', ap, container, None if item is None else item.Type)
+            request = self.cache.request('currentAccessPoints', ap, container, None if item is None else item.Type, self.settings.maxDiff)
             ret = self.cache.get(request)
             if ret is not None:
                 return ret
@@ -167,14 +199,20 @@ class RandoServices(object):
         if item.Category == 'Nothing':
             return False
         if self.cache is not None:
-            request = self.cache.request('isProgression', item.Type, ap, container)
+            request = self.cache.request('isProgression', ap, container, item.Type, self.settings.maxDiff)
             ret = self.cache.get(request)
             if ret is not None:
                 return ret
+        # the locations requests done here, to replay them with the cached result
+        dependencies = []
         oldLocations = self.currentLocations(ap, container)
+        if self.cache is not None:
+            dependencies.append(self.cache.last)
         ret = any(self.restrictions.canPlaceAtLocation(item, loc, container) for loc in oldLocations)
         if ret == True:
             newLocations = [loc for loc in self.currentLocations(ap, container, item) if loc not in oldLocations]
+            if self.cache is not None:
+                dependencies.append(self.cache.last)
             ret = len(newLocations) > 0 and any(self.restrictions.isItemLocMatching(item, loc) for loc in newLocations)
             self.log.debug('isProgression. item=' + item.Type + ', newLocs=' + str([loc.Name for loc in newLocations]))
             if ret == False and len(newLocations) > 0 and self.restrictions.split == 'Major':
@@ -184,7 +222,7 @@ class RandoServices(object):
                       or not sm.haveItem('Super').bool \
                       or not sm.haveItem('PowerBomb').bool
         if self.cache is not None:
-            self.cache.store(request, ret)
+            self.cache.store(request, ret, dependencies=dependencies)
         return ret
 
     def getPlacementLocs(self, ap, container, comebackCheck, itemObj, locs):
@@ -340,7 +378,7 @@ class RandoServices(object):
         self.log.debug("onlyBossesLeft. prevLocs="+getLocListStr(prevLocs))
         # fake kill remaining bosses and see if we can access the rest of the game
         if self.cache is not None:
-            self.cache.reset()
+            self.cache.refresh()
         for boss in bossesLeft:
             self.log.debug('onlyBossesLeft. kill '+boss.Name)
             sm.addItem(boss.Type)
@@ -355,7 +393,7 @@ class RandoServices(object):
             self.log.debug('onlyBossesLeft. revive '+boss.Name)
             sm.removeItem(boss.Type)
         if self.cache is not None:
-            self.cache.reset()
+            self.cache.refresh()
         self.log.debug("onlyBossesLeft? " +str(ret))
         return ret
 
@@ -381,7 +419,7 @@ class RandoServices(object):
             self.log.debug("itemLoc1 attempt: "+getItemLocStr(itemLoc1))
             newAP = self.collect(ap, cont, itemLoc1)
             if self.cache is not None:
-                self.cache.reset()
+                self.cache.refresh()
             (ild, isProg) = self.getPossiblePlacements(newAP, cont, ComebackCheckType.NoCheck)
             if isProg:
                 item2 = random.choice(list(ild.keys()))
@@ -10,7 +10,7 @@ from rando.ItemLocContainer import ItemLocation
 # Holds settings not related to graph layout.
 class RandoSettings(object):
     def __init__(self, maxDiff, progSpeed, progDiff, qty, restrictions,
-                 superFun, runtimeLimit_s, plandoSettings, minDiff):
+                 superFun, runtimeLimit_s, plandoSettings, minDiff, fillWorkers=1):
         self.progSpeed = progSpeed.lower()
         self.progDiff = progDiff.lower()
         self.maxDiff = maxDiff
@@ -22,6 +22,8 @@ class RandoSettings(object):
             self.runtimeLimit_s = sys.maxsize
         self.plandoSettings = plandoSettings
         self.minDiff = minDiff
+        # number of processes running the random fill attempts
+        self.fillWorkers = fillWorkers
 
     def getSuperFun(self):
         return self.superFun[:]
@@ -18,7 +18,8 @@ from rom.rom_patches import RomPatches
 # the entry point is createItemLocContainer
 class RandoSetup(object):
     def __init__(self, graphSettings, locations, services):
-        self.sm = SMBoolManager()
+        # the smbools knows/items are not used in the randomizer
+        self.sm = SMBoolManager(provenance=False)
         self.settings = services.settings
         self.graphSettings = graphSettings
         self.startAP = graphSettings.startAP
@@ -277,7 +278,7 @@ class RandoSetup(object):
                 # we chose Golden Four because it is always there.
                 # Start APs might not have comeback transitions
                 # possible start AP issues are handled in checkStart
-                comeBack[ap] = self.areaGraph.canAccess(self.sm, ap, 'Golden Four', self.settings.maxDiff)
+                comeBack[ap] = self.areaGraph.canComeBack(self.sm, ap, 'Golden Four', self.settings.maxDiff)
             if comeBack[ap]:
                 totalAvailLocs.append(loc)
         self.areaGraph.useCache(False)
@@ -19,8 +19,9 @@ class Restrictions(object):
             self.scavIsVanilla = settings.restrictions['ScavengerParams']['vanillaItems']
         # checker function chain used by canPlaceAtLocation
         self.checkers = self.getCheckers()
-        self.static = {}
-        self.dynamic = {}
+        # location name: location bit in the placement matrix
+        self.locBits = {}
+        self.resetPlacement()
         # only useful in door color rando
         self.mandatoryBeams = []
 
@@ -28,9 +29,11 @@ class Restrictions(object):
         self.split = "Full"
         self.suitsRestrictions = False
         self.checkers = []
+        self.resetPlacement()
 
     def setScavengerLocs(self, scavLocs):
         self.scavLocs = scavLocs
+        self.resetPlacement()
         self.log.debug("scavLocs="+getLocListStr(scavLocs))
         self.scavItemTypes = [loc.VanillaItemType for loc in scavLocs]
 
@@ -74,6 +77,7 @@ class Restrictions(object):
         if self.restrictionDictChecker is not None:
             self.checkers.remove(self.restrictionDictChecker)
             self.restrictionDictChecker = None
+        self.resetPlacement()
         if restrictionDict is None:
             return
         self.restrictionDictChecker = lambda item, loc, cont: item.Category in Restrictions.NoCheckCat\
@@ -157,8 +161,36 @@ class Restrictions(object):
             checkers.append(lambda item, loc, cont: not self.isSuit(item) or loc.GraphArea != 'Crateria')
         return checkers
 
-    # return bool telling whether we can place a given item at a given location
-    def canPlaceAtLocation(self, item, location, container):
+    # the placement matrix caches the checkers results, for each (item type, item class)
+    # it has three bitsets of the locations (one bit per location name):
+    # - the locations already checked
+    # - the locations where the item can be placed
+    # - the locations where the item can be placed only if the container has an unrestricted
+    #   location with the item type (the only part of the checks depending on the container)
+    # it is reset when the checkers change.
+    def resetPlacement(self):
+        self.placement = {}
+
+    def getLocBit(self, location):
+        bit = self.locBits.get(location.Name)
+        if bit is None:
+            bit = self.locBits[location.Name] = 1 << len(self.locBits)
+        return bit
+
+    def getPlacement(self, item, bit, location):
+        key = (item.Type, item.Class)
+        placement = self.placement.get(key)
+        if placement is None:
+            placement = self.placement[key] = [0, 0, 0]
+        if not placement[0] & bit:
+            placement[0] |= bit
+            if self.checkPlacement(item, location, PlacementContainer(False)):
+                placement[1] |= bit
+            elif item.Category == 'Ammo' and self.restrictionDictChecker is not None and self.checkPlacement(item, location, PlacementContainer(True)):
+                placement[2] |= bit
+        return placement
+
+    def checkPlacement(self, item, location, container):
         ret = True
         for chk in self.checkers:
             ret = ret and chk(item, location, container)
@@ -167,26 +199,50 @@ class Restrictions(object):
 
         return ret
 
+    # return bool telling whether we can place a given item at a given location
+    def canPlaceAtLocation(self, item, location, container):
+        bit = self.locBits.get(location.Name)
+        if bit is None:
+            bit = self.getLocBit(location)
+        placement = self.getPlacement(item, bit, location)
+        if placement[1] & bit:
+            return True
+        return placement[2] & bit != 0 and container.hasUnrestrictedLocWithItemType(item.Type)
+
     ### Below : faster implementation tailored for random fill
 
     def precomputeRestrictions(self, container):
-        # precompute the values for canPlaceAtLocation. only for random filler.
-        # dict (loc name, item type) -> bool
-        items = container.getDistinctItems()
-        for item in items:
-            for location in container.unusedLocations:
-                self.static[(location.Name, item.Type)] = self.canPlaceAtLocation(item, location, container)
-
-        container.unrestrictedItems = set(['Super', 'PowerBomb'])
-        for item in items:
-            if item.Type not in ['Super', 'PowerBomb']:
-                continue
+        # precompute the placement masks for the container. only for random filler.
+        # the items unrestricted at this point are considered unrestricted during the whole fill,
+        # supers and power bombs use the container state.
+        # item type -> (locations mask, locations mask if the container has an unrestricted location with the item)
+        self.fastMasks = {}
+        for item in container.getDistinctItems():
             for location in container.unusedLocations:
-                self.dynamic[(location.Name, item.Type)] = self.canPlaceAtLocation(item, location, container)
-        container.unrestrictedItems = set()
-
-    def canPlaceAtLocationFast(self, itemType, locName, container):
-        if itemType in ['Super', 'PowerBomb'] and container.hasUnrestrictedLocWithItemType(itemType):
-            return self.dynamic.get((locName, itemType))
-        else:
-            return self.static.get((locName, itemType))
+                self.getPlacement(item, self.getLocBit(location), location)
+            placement = self.placement.get((item.Type, item.Class), [0, 0, 0])
+            mask = placement[1]
+            unrestrictedMask = placement[1] | placement[2]
+            if item.Type in container.unrestrictedItems:
+                mask = unrestrictedMask
+            elif item.Type not in ['Super', 'PowerBomb']:
+                unrestrictedMask = mask
+            self.fastMasks[item.Type] = (mask, unrestrictedMask)
+
+    # locations mask of the item type for canPlaceAtLocationFast
+    def getPlacementMaskFast(self, itemType, container):
+        (mask, unrestrictedMask) = self.fastMasks[itemType]
+        if mask != unrestrictedMask and container.hasUnrestrictedLocWithItemType(itemType):
+            return unrestrictedMask
+        return mask
+
+    def canPlaceAtLocationFast(self, itemType, location, container):
+        return self.getPlacementMaskFast(itemType, container) & self.locBits[location.Name] != 0
+
+# container used to fill the placement matrix, with or without unrestricted locations for all the item types
+class PlacementContainer(object):
+    def __init__(self, unrestricted):
+        self.unrestricted = unrestricted
+
+    def hasUnrestrictedLocWithItemType(self, itemType):
+        return self.unrestricted
@@ -0,0 +1,60 @@
+#!/usr/bin/python3
+# generate a batch of seeds (items placement only) with a pool of processes,
+# used to compute the extended stats without a randomizer process for each seed.
+
+import argparse, sys, json, time
+
+from logic.logic import Logic
+import utils.log
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Random Metroid Randomizer batch seeds generation")
+    parser.add_argument('--randoPreset', help="rando preset file", dest="randoPreset", nargs='?', required=True)
+    parser.add_argument('--param', '-p', help="the skill preset file, default to the one of the rando preset", dest='paramsFileName', nargs='?', default=None)
+    parser.add_argument('--fakeRandoPreset', help="rando preset name in the extended stats", dest="fakeRandoPreset", nargs='?', default=None)
+    parser.add_argument('--seeds', help="number of seeds to generate", dest='seeds', nargs='?', default=100, type=int)
+    parser.add_argument('--batchSeed', help="seed used to draw the seeds of the batch, random if 0", dest='batchSeed', nargs='?', default=0, type=int)
+    parser.add_argument('--workers', help="number of worker processes", dest='workers', nargs='?', default=2, type=int)
+    parser.add_argument('--runtime', help="maximum runtime limit in seconds for each seed", dest='runtimeLimit_s', nargs='?', default=30, type=int)
+    parser.add_argument('--output', help="json lines output file, stdout if not set", dest='output', nargs='?', default=None)
+    parser.add_argument('--ext_stats', help="extended stats output: aggregated SQL, or a local .sqlite database",
+                        nargs='?', default=None, dest='extStatsFilename')
+    parser.add_argument('--ext_stats_flush', help="number of seeds aggregated before writing the extended stats",
+                        dest='extStatsFlush', nargs='?', default=1000, type=int)
+    parser.add_argument('--logic', help='logic to use', dest='logic', nargs='?', default="vanilla", choices=["vanilla", "rotation"])
+    parser.add_argument('--debug', '-d', help="activate debug logging", dest='debug', action='store_true')
+    args = parser.parse_args()
+
+    utils.log.init(args.debug)
+    logger = utils.log.get('RandoBatch')
+
+    Logic.factory(args.logic)
+    from rando.RandoBatch import RandoBatch
+    from utils.extstats import ExtStatsAggregator
+
+    batch = RandoBatch(args.randoPreset, args.paramsFileName, args.runtimeLimit_s, args.fakeRandoPreset)
+    batchSeed = args.batchSeed
+    if batchSeed == 0:
+        batchSeed = int(time.time())
+    logger.debug("batch seed: {}".format(batchSeed))
+    seeds = RandoBatch.getSeeds(batchSeed, args.seeds)
+
+    output = open(args.output, 'a') if args.output is not None else sys.stdout
+    extStats = None
+    if args.extStatsFilename is not None:
+        extStats = ExtStatsAggregator(batch.skillPreset, batch.randoPreset, args.extStatsFilename, args.extStatsFlush)
+    stuck = 0
+    try:
+        for ret in batch.run(seeds, args.workers):
+            output.write(json.dumps(ret)+'\n')
+            output.flush()
+            if ret['stuck'] == True:
+                stuck += 1
+            elif extStats is not None:
+                batch.addExtStats(ret, extStats)
+    finally:
+        if output != sys.stdout:
+            output.close()
+        if extStats is not None:
+            extStats.close()
+    logger.debug("seeds: {} stuck: {}".format(len(seeds), stuck))
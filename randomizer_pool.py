@@ -0,0 +1,24 @@
+#!/usr/bin/python3
+# start a pool of warm randomizer processes, used by the web randomizer
+# instead of starting a new python interpreter for each seed.
+
+import argparse, os.path
+
+from utils.workerpool import WorkerPool, defaultSocketPath, defaultTimeoutMargin
+import utils.log
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Random Metroid Randomizer workers pool")
+    parser.add_argument('--socket', help="unix socket to listen on", dest='socket', nargs='?', default=defaultSocketPath)
+    parser.add_argument('--workers', help="number of workers", dest='workers', nargs='?', default=2, type=int)
+    parser.add_argument('--maxJobs', help="number of jobs after which a worker is recycled", dest='maxJobs', nargs='?', default=100, type=int)
+    parser.add_argument('--timeoutMargin', help="seconds added to the job --runtime before killing it", dest='timeoutMargin', nargs='?', default=defaultTimeoutMargin, type=int)
+    parser.add_argument('--baseDir', help="directory the jobs working directory must be in, the user home by default", dest='baseDir', nargs='?', default=None)
+    parser.add_argument('--debug', '-d', help="activate debug logging", dest='debug', action='store_true')
+    args = parser.parse_args()
+
+    utils.log.init(args.debug)
+
+    script = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'randomizer.py')
+    pool = WorkerPool(script, args.socket, args.workers, args.maxJobs, args.timeoutMargin, args.baseDir)
+    pool.serve()
@@ -1,7 +1,8 @@
-import colorsys, random
+import colorsys, random, struct
+from collections import ChainMap
 from rom.rom import pc_to_snes
 from rom.romloader import RomLoader
-from rando.palettes import palettes
+from rando.palettes import getPalettes
 from varia_custom_sprites.sprite_palettes import sprite_palettes
 import utils.log
 
@@ -106,8 +107,10 @@ class PaletteRando(object):
         self.logger = utils.log.get('Palette')
 
         self.romPatcher = romPatcher
+        palettes = getPalettes()
         if sprite is not None:
-            palettes.update(sprite_palettes[sprite])
+            # sprite palettes on top of the vanilla ones
+            palettes = ChainMap(sprite_palettes[sprite], palettes)
         self.romLoader = RomLoader.factory(palettes)
         self.palettesROM = self.romLoader.getROM()
         self.outFile = romPatcher.romFile
@@ -116,6 +119,11 @@ class PaletteRando(object):
         self.min_degree = settings["min_degree"]
         self.invert = settings["invert"]
 
+        #degree: {15bit color: shifted color}, the palettes share a lot of colors and
+        #are shifted by a few degrees, so each conversion is done once per rom.
+        #the degrees are random, so the cache is not kept for the next rom
+        self.hueShiftCache = {}
+
         #boss_tileset_palettes = [0x213510,0x213798,0x213A2C,0x213BC1]
         #boss_pointer_addresses = [0x7E792,0x7E79B,0x7E7A4,0x7E726]
         #gray doors + hud elements [0x28,0x2A,0x2C,0x2E]
@@ -314,9 +322,6 @@ class PaletteRando(object):
     def adjust_hue_degree(self, hsl_color, degree):
         hue = hsl_color[0] * 360
         hue_adj = (hue + degree) % 360
-        self.logger.debug("Original hue: {}".format(hue))
-        self.logger.debug("Adjusted hue: {}".format(hue_adj))
-        self.logger.debug("Degree: {}".format(degree))
 
         return hue_adj
 
@@ -362,6 +367,15 @@ class PaletteRando(object):
     def write_pointer(self, address, value):
         self.outFile.writeBytes(value, 3, address)
 
+    def read_words(self, address, count):
+        self.palettesROM.seek(address)
+        data = self.palettesROM.read(count*2)
+        return [data[i] + (data[i+1] << 8) for i in range(0, count*2, 2)]
+
+    def write_words(self, address, words):
+        self.outFile.seek(address)
+        self.outFile.write(struct.pack('<{}H'.format(len(words)), *words))
+
     def get_word(self, data, index):
         #print("pr@{}".format(index))
         return data[index] + (data[index+1] << 8)
@@ -371,6 +385,43 @@ class PaletteRando(object):
         data[index] = w0
         data[index+1] = w1
 
+    #Shift the hue of a 15bit color by degree
+    def hue_shift_color(self, color, degree):
+        #Convert 15bit RGB to 24bit RGB
+        rgb_value_24 = self.RGB_15_to_24(color)
+
+        #24bit RGB to HLS
+        hls_col = colorsys.rgb_to_hls(rgb_value_24[0]/255.0, rgb_value_24[1]/255.0, rgb_value_24[2]/255.0)
+
+        #Generate new hue based on degree
+        new_hue = self.adjust_hue_degree(hls_col, degree)/360.0
+
+        rgb_final = colorsys.hls_to_rgb(new_hue, hls_col[1], hls_col[2])
+
+        #Colorspace is in [0...1] format during conversion and needs to be multiplied by 255
+        rgb_final = (int(rgb_final[0]*255), int(rgb_final[1]*255), int(rgb_final[2]*255))
+
+        return self.RGB_24_to_15(rgb_final)
+
+    #Shift the hue of a list of 15bit colors by degree
+    def hue_shift_colors(self, colors, degree):
+        cache = self.hueShiftCache.get(degree)
+        if cache is None:
+            cache = self.hueShiftCache[degree] = {}
+        shifted = []
+        for color in colors:
+            new_color = cache.get(color)
+            if new_color is None:
+                new_color = cache[color] = self.hue_shift_color(color, degree)
+            shifted.append(new_color)
+        return shifted
+
+    #Shift the colors at the given offsets of a decompressed palette
+    def hue_shift_data(self, data, offset_list, degree):
+        colors = self.hue_shift_colors([self.get_word(data, offset) for offset in offset_list], degree)
+        for offset, color in zip(offset_list, colors):
+            self.set_word(data, offset, color)
+
     #Only used for individual tileset degrees (required to adjust fx1 effects accordingly)
     #Insert two entries for [0,1,2,4,5,6,7,8]
     #[0 0 1 1 2 2 3 4 4 5 5 6 6 7 7 8 8 9 10 11 12 13] 14 15 16
@@ -392,31 +443,8 @@ class PaletteRando(object):
 
     def hue_shift_palette_lists(self, degree, address_list, size_list):
         for count, address in enumerate(address_list):
-            for i in range(size_list[count]+1):
-                self.logger.debug("Fx1 address: {} at offset: {}".format(hex(address), hex(i*2)))
-
-                read_address = address + (i*2)
-                int_value_LE = self.read_word(read_address)
-
-                #Convert 15bit RGB to 24bit RGB
-                rgb_value_24 = self.RGB_15_to_24(int_value_LE)
-
-                #24bit RGB to HLS
-                hls_col = colorsys.rgb_to_hls(rgb_value_24[0]/255.0,
-                                              rgb_value_24[1]/255.0,
-                                              rgb_value_24[2]/255.0)
-
-                #Generate new hue based on degree
-                new_hue = self.adjust_hue_degree(hls_col, degree)/360.0
-
-                rgb_final = colorsys.hls_to_rgb(new_hue, hls_col[1], hls_col[2])
-
-                #Colorspace is in [0...1] format during conversion and needs to be multiplied by 255
-                rgb_final = (int(rgb_final[0]*255), int(rgb_final[1]*255), int(rgb_final[2]*255))
-
-                BE_hex_color = self.RGB_24_to_15(rgb_final)
-
-                self.write_word(read_address, BE_hex_color)
+            size = size_list[count]+1
+            self.write_words(address, self.hue_shift_colors(self.read_words(address, size), degree))
 
     def hue_shift_palette_single_offsets(self, data, offset_list, degree, address):
         #if green brinstar or crateria palette, shuffle blue door caps to also shuffle lower crateria color
@@ -426,67 +454,20 @@ class PaletteRando(object):
             copy_offset_list = offset_list
 
         copy_offset_list = offset_list
-        for offset in copy_offset_list:
-            #Convert from LE to BE
-            int_value_LE = self.get_word(data, offset)
-
-            #Convert 15bit RGB to 24bit RGB
-            rgb_value_24 = self.RGB_15_to_24(int_value_LE)
-
-            self.logger.debug("24RGB: {}".format(rgb_value_24))
-
-            #24bit RGB to HLS
-            hls_col = colorsys.rgb_to_hls(rgb_value_24[0]/255.0,rgb_value_24[1]/255.0,rgb_value_24[2]/255.0)
-
-            self.logger.debug("hls_col: {}".format(hls_col))
-
-            #Generate new hue based on degree
-            new_hue = self.adjust_hue_degree(hls_col, degree)/360.0
-
-            rgb_final = colorsys.hls_to_rgb(new_hue,hls_col[1],hls_col[2])
-
-            #Colorspace is in [0...1] format during conversion and needs to be multiplied by 255
-            rgb_final = (int(rgb_final[0]*255),int(rgb_final[1]*255),int(rgb_final[2]*255))
-
-            self.logger.debug("New 24RGB 1 {}".format(rgb_final))
-
-            BE_hex_color = self.RGB_24_to_15(rgb_final)
-
-            self.logger.debug("15bit BE_hex_color: {}".format(hex(BE_hex_color)))
-
-            self.set_word(data, offset, BE_hex_color)
-
-            self.logger.debug("write decomp palette offset: {} value: {}".format(hex(offset), BE_hex_color))
+        self.hue_shift_data(data, copy_offset_list, degree)
 
     #Function to shift palette hues by set degree for a palette with fixed size 0x0F
-    def hue_shift_fixed_size_palette(self, base_address, degree,size, exclude = [""]):
+    def hue_shift_fixed_size_palette(self, base_address, degree,size, exclude = []):
         self.logger.debug("Shifting suit palette at {} by degree {}".format(hex(base_address), degree))
-        
-        for i in range(0,size+1):
-		
-            if i in exclude:
-                continue
-                
-            read_address=base_address+(i*2)
-            int_value_LE = self.read_word(read_address)
-
-            #Convert 15bit RGB to 24bit RGB
-            rgb_value_24 = self.RGB_15_to_24(int_value_LE)
-
-            #24bit RGB to HLS
-            hls_col = colorsys.rgb_to_hls(rgb_value_24[0]/255.0, rgb_value_24[1]/255.0, rgb_value_24[2]/255.0)
-
-            #Generate new hue based on degree
-            new_hue = self.adjust_hue_degree(hls_col, degree)/360.0
-
-            rgb_final = colorsys.hls_to_rgb(new_hue,hls_col[1],hls_col[2])
-
-            #Colorspace is in [0...1] format during conversion and needs to be multiplied by 255
-            rgb_final = (int(rgb_final[0]*255), int(rgb_final[1]*255), int(rgb_final[2]*255))
 
-            BE_hex_color = self.RGB_24_to_15(rgb_final)
+        colors = self.hue_shift_colors(self.read_words(base_address, size+1), degree)
 
-            self.write_word(read_address, BE_hex_color)
+        #write the shifted colors around the excluded ones
+        start = 0
+        for end in [i for i in range(size+1) if i in exclude] + [size+1]:
+            if end > start:
+                self.write_words(base_address+(start*2), colors[start:end])
+            start = end+1
 
     def hue_shift_tileset_palette(self, degree):
         count=-1
@@ -512,36 +493,7 @@ class PaletteRando(object):
                 temp_TLS_palette_subsets = [0x80,0xA0,0xC0,0xE0]
 
             #skip 2-byte-pair at index 0 (this is the transparency color)
-            for subset in temp_TLS_palette_subsets:
-                for j in range(1,15):
-                    #Convert from LE to BE
-                    int_value_LE = self.get_word(data, subset+(j*2))
-
-                    #Convert 15bit RGB to 24bit RGB
-                    rgb_value_24 = self.RGB_15_to_24(int_value_LE)
-
-                    self.logger.debug("24RGB: {}".format(rgb_value_24))
-
-                    #24bit RGB to HLS
-                    hls_col = colorsys.rgb_to_hls(rgb_value_24[0]/255.0,rgb_value_24[1]/255.0,rgb_value_24[2]/255.0)
-
-                    #Generate new hue based on degree
-                    new_hue = self.adjust_hue_degree(hls_col, degree)/360.0
-
-                    rgb_final = colorsys.hls_to_rgb(new_hue,hls_col[1],hls_col[2])
-
-                    #Colorspace is in [0...1] format during conversion and needs to be multiplied by 255
-                    rgb_final = (int(rgb_final[0]*255),int(rgb_final[1]*255),int(rgb_final[2]*255))
-
-                    self.logger.debug("New 24RGB 2: {}".format(rgb_final))
-
-                    BE_hex_color = self.RGB_24_to_15(rgb_final)
-
-                    self.logger.debug("15bit BE_hex_color: {}".format(hex(BE_hex_color)))
-
-                    self.set_word(data, subset+(j*2), BE_hex_color)
-
-                    self.logger.debug("write decomp palette index: {} value: {}".format(hex(subset+(j*2)), BE_hex_color))
+            self.hue_shift_data(data, [subset+(j*2) for subset in temp_TLS_palette_subsets for j in range(1,15)], degree)
 
             insert_address = self.base_address + (count*0x100)
             assert insert_address <= 0x2FFE00, "Possible ROM corruption by palette rando"
@@ -624,36 +576,7 @@ class PaletteRando(object):
 
             data = self.decompress(address)
 
-            for subset in temp_TLS_palette_subsets:
-                for j in range(1,15):
-                    #Convert from LE to BE
-                    int_value_LE = self.get_word(data, subset+(j*2))
-
-                    #Convert 15bit RGB to 24bit RGB
-                    rgb_value_24 = self.RGB_15_to_24(int_value_LE)
-
-                    self.logger.debug("24RGB: {}".format(rgb_value_24))
-
-                    #24bit RGB to HLS
-                    hls_col = colorsys.rgb_to_hls(rgb_value_24[0]/255.0,rgb_value_24[1]/255.0,rgb_value_24[2]/255.0)
-
-                    #Generate new hue based on degree
-                    new_hue = self.adjust_hue_degree(hls_col, degree)/360.0
-
-                    rgb_final = colorsys.hls_to_rgb(new_hue,hls_col[1],hls_col[2])
-
-                    #Colorspace is in [0...1] format during conversion and needs to be multiplied by 255
-                    rgb_final = (int(rgb_final[0]*255),int(rgb_final[1]*255),int(rgb_final[2]*255))
-
-                    self.logger.debug("New 24RGB 3: {}".format(rgb_final))
-
-                    BE_hex_color = self.RGB_24_to_15(rgb_final)
-
-                    self.logger.debug("15bit BE_hex_color: {}".format(hex(BE_hex_color)))
-
-                    self.set_word(data, subset+(j*2), BE_hex_color)
-
-                    self.logger.debug("write decomp palette index: {} value: {}".format(hex(subset+(j*2)), BE_hex_color))
+            self.hue_shift_data(data, [subset+(j*2) for subset in temp_TLS_palette_subsets for j in range(1,15)], degree)
 
             #quick hack to re-insert, should work without issues
             insert_address = address
@@ -832,8 +755,8 @@ class PaletteRando(object):
 
         # cp new compressed data into vanilla palettes data (used for boss palettes rando)
         self.outFile.seek(address)
-        for i in range(length):
-            self.palettesROM.data[address+i] = self.outFile.readByte()
+        self.palettesROM.seek(address)
+        self.palettesROM.write(self.outFile.read(length))
 
     def decompress(self, address):
         (compressedLength, rawData) = self.romLoader.decompress(address)
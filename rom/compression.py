@@ -2,9 +2,12 @@
 import utils.log
 
 class Compressor:
-    def __init__(self, computeLimit=5):
+    def __init__(self, computeLimit=5, optimal=True):
         self.log = utils.log.get('Compressor')
+        # number of previous addresses checked for copies at each address
         self.computeLimit = computeLimit
+        # smallest compressed size, or faster with the chunk saving the most bytes at each address
+        self.optimal = optimal
 
     def _concatBytes(self, b0, b1):
         return b0 + (b1 << 8)
@@ -119,54 +122,32 @@ class Compressor:
         self.inputData = inputData
         self.output = []
 
-        # brute force all the cases for every byte in the input.
         # For every inputData address, these arrays save the max number of bytes that can be
         # compressed with a single chunk, starting at that address.
-        self._computeByteFill(inputData)
-        self._computeWordFill(inputData)
-        self._computeByteIncrement(inputData)
-        self._computeCopy(inputData)
+        data = bytes(inputData)
+        self._computeByteFill(data)
+        self._computeWordFill(data)
+        self._computeByteIncrement(data)
+        self._computeCopy(data)
+
+        if self.optimal == True:
+            chunks = self._optimalParse(len(data))
+        else:
+            chunks = self._greedyParse(len(data))
 
-        i = 0
-        while i < len(inputData):
-            length = max(self.byteFillLengths[i],
-                         self.wordFillLengths[i],
-                         self.byteIncrementLengths[i],
-                         self.copyLengths[i].length)
-
-            self.log.debug("i:{} bf: {} wf: {} bi: {} c: {}".format(i, self.byteFillLengths[i], self.wordFillLengths[i], self.byteIncrementLengths[i], self.copyLengths[i].length))
-
-            if length < 3:
-                j = i
-                while j < len(inputData) and length < 3:
-                    length = max(self.byteFillLengths[j],
-                                 self.wordFillLengths[j],
-                                 self.byteIncrementLengths[j],
-                                 self.copyLengths[j].length)
-                    j += 1
-                length = j - i if j == len(inputData) else j - i - 1
+        for (i, command, length) in chunks:
+            if command == Compressor.Uncompressed:
                 self._writeUncompressed(inputData, i, length)
-
-            elif length == self.byteFillLengths[i]:
-                length = min(length, 1024)
+            elif command == Compressor.ByteFill:
                 self._writeByteFill(inputData[i], length)
-
-            elif length == self.wordFillLengths[i]:
-                length = min(length, 1024)
+            elif command == Compressor.WordFill:
                 self._writeWordFill(inputData[i], inputData[i+1], length)
-
-            elif length == self.byteIncrementLengths[i]:
-                length = min(length, 1024)
+            elif command == Compressor.ByteIncrement:
                 self._writeByteIncrement(inputData[i], length)
-
-            elif length == self.copyLengths[i].length:
-                length = min(length, 1024)
-                if i - self.copyLengths[i].address < 0xFF:
-                    self._writeNegativeCopy(i, i - self.copyLengths[i].address, length)
-                else:
-                    self._writeCopy(self.copyLengths[i].address, length)
-
-            i += length
+            elif command == Compressor.Copy:
+                self._writeCopy(self.copyAddresses[i], length)
+            elif command == Compressor.NegativeCopy:
+                self._writeNegativeCopy(i, i - self.negativeCopyAddresses[i], length)
 
         # end of compressed data marker
         self.output.append(0xFF)
@@ -178,6 +159,133 @@ class Compressor:
 
         return self.output[:]
 
+    # chunk commands
+    Uncompressed = 0b000
+    ByteFill = 0b001
+    WordFill = 0b010
+    ByteIncrement = 0b011
+    Copy = 0b100
+    NegativeCopy = 0b110
+
+    # chunks max length, with a long command
+    maxLength = 1024
+    # chunks max length with a regular command
+    maxShortLength = 32
+
+    # list of chunks (address, command, length), take at each address the chunk
+    # saving the most bytes
+    def _greedyParse(self, dataLength):
+        chunks = []
+        i = 0
+        uncompressedStart = 0
+        commands = self._getCommands()
+        compressible = self._getCompressible()
+        while i < dataLength:
+            if not compressible[i]:
+                i += 1
+                continue
+            saved = 0
+            for command, lengths, argumentSize in commands:
+                if lengths[i] - argumentSize > saved:
+                    saved = lengths[i] - argumentSize
+                    (chunkCommand, length) = (command, lengths[i])
+            # the chunk header and arguments have to be smaller than the chunk
+            if saved < 2:
+                i += 1
+                continue
+            self._addUncompressed(chunks, uncompressedStart, i)
+            length = min(length, Compressor.maxLength)
+            chunks.append((i, chunkCommand, length))
+            i += length
+            uncompressedStart = i
+        self._addUncompressed(chunks, uncompressedStart, dataLength)
+        return chunks
+
+    # list of chunks (address, command, length) with the smallest compressed size,
+    # computed from the end of the data with the size of the compressed data from
+    # each address:
+    #  - in an uncompressed chunk: the min of one byte plus the size from the next
+    #    address in the uncompressed chunk, and the size without uncompressed chunk
+    #  - without uncompressed chunk: the min of the chunks starting at the address
+    #    size plus the size after them, and the size of an uncompressed chunk header
+    #    plus the size from the address in an uncompressed chunk.
+    # the uncompressed chunks header is counted as a regular command one.
+    def _optimalParse(self, dataLength):
+        sizes = [0] * (dataLength + 1)
+        uncompressedSizes = [0] * (dataLength + 1)
+        # first chunk (command, min length, max length) of the compressed data from each
+        # address without uncompressed chunk, the length of the chunk is the one with
+        # the smallest size after it
+        firstChunks = [None] * dataLength
+        commands = self._getCommands()
+        compressible = self._getCompressible()
+        for i in range(dataLength-1, -1, -1):
+            size = 2 + uncompressedSizes[i+1]
+            firstChunk = None
+            if compressible[i]:
+                for command, lengths, argumentSize in commands:
+                    length = lengths[i]
+                    if length < 2:
+                        continue
+                    # regular command
+                    end = i + (length if length < Compressor.maxShortLength else Compressor.maxShortLength)
+                    chunkSize = 1 + argumentSize + min(sizes[i+2:end+1])
+                    if chunkSize < size:
+                        size = chunkSize
+                        firstChunk = (command, 2, end - i)
+                    # long command
+                    if length > Compressor.maxShortLength:
+                        end = i + (length if length < Compressor.maxLength else Compressor.maxLength)
+                        chunkSize = 2 + argumentSize + min(sizes[i+Compressor.maxShortLength+1:end+1])
+                        if chunkSize < size:
+                            size = chunkSize
+                            firstChunk = (command, Compressor.maxShortLength+1, end - i)
+            sizes[i] = size
+            firstChunks[i] = firstChunk
+            uncompressedSizes[i] = min(1 + uncompressedSizes[i+1], size)
+
+        chunks = []
+        i = 0
+        uncompressedStart = 0
+        while i < dataLength:
+            if uncompressedStart < i and uncompressedSizes[i] == 1 + uncompressedSizes[i+1]:
+                # continue the uncompressed chunk
+                i += 1
+                continue
+            if firstChunks[i] is None:
+                # start an uncompressed chunk
+                self._addUncompressed(chunks, uncompressedStart, i)
+                uncompressedStart = i
+                i += 1
+                continue
+            (command, minLength, maxLength) = firstChunks[i]
+            length = sizes.index(min(sizes[i+minLength:i+maxLength+1]), i+minLength, i+maxLength+1) - i
+            self._addUncompressed(chunks, uncompressedStart, i)
+            chunks.append((i, command, length))
+            i += length
+            uncompressedStart = i
+        self._addUncompressed(chunks, uncompressedStart, dataLength)
+        return chunks
+
+    # (command, max lengths of the chunks at each address, argument size)
+    def _getCommands(self):
+        return [(Compressor.ByteFill, self.byteFillLengths, 1),
+                (Compressor.WordFill, self.wordFillLengths, 2),
+                (Compressor.ByteIncrement, self.byteIncrementLengths, 1),
+                (Compressor.NegativeCopy, self.negativeCopyLengths, 1),
+                (Compressor.Copy, self.copyLengths, 2)]
+
+    # addresses with a chunk which can be smaller than an uncompressed one
+    def _getCompressible(self):
+        return [byteFill > 1 or wordFill > 2 or increment > 1 or negativeCopy > 1 or copy > 2
+                for byteFill, wordFill, increment, negativeCopy, copy
+                in zip(self.byteFillLengths, self.wordFillLengths, self.byteIncrementLengths,
+                       self.negativeCopyLengths, self.copyLengths)]
+
+    def _addUncompressed(self, chunks, start, end):
+        for i in range(start, end, Compressor.maxLength):
+            chunks.append((i, Compressor.Uncompressed, min(end - i, Compressor.maxLength)))
+
     def _writeChunkHeader(self, type, length):
         length -= 1
         if length < 32:
@@ -223,78 +331,71 @@ class Compressor:
         self.output.append(address)
         self.log.debug("_writeNegativeCopy: len: {} address: {}: {}".format(length, address, self.inputData[i-address:i-address+length]))
 
-    def _computeByteFill(self, inputData):
-        self.byteFillLengths = []
-        carry = 0
-        for i in range(len(inputData)):
-            if carry == 0:
-                value = inputData[i]
-                # count how many repeating value we have
-                while i + carry < len(inputData) and inputData[i + carry] == value:
-                    carry += 1
-            self.byteFillLengths.append(carry)
-            carry -= 1
-
-    def _computeWordFill(self, inputData):
-        self.wordFillLengths = []
-        carry = 1
-        for i in range(len(inputData)-1):
-            if carry == 1:
-                value = (inputData[i], inputData[i+1])
-                while i + carry < len(inputData) and inputData[i + carry] == value[carry & 1]:
-                    carry += 1
-            if carry < 4:
-                # no compression when replacing [b0, b1, b0] with [cmd, b0, b1]
-                self.wordFillLengths.append(2)
-            else:
-                self.wordFillLengths.append(carry)
-            carry -= 1
-        # missing last value
-        self.wordFillLengths.append(carry)
-
-    def _computeByteIncrement(self, inputData):
-        self.byteIncrementLengths = []
-        carry = 0
-        for i in range(len(inputData)):
-            if carry == 0:
-                value = inputData[i]
-                while i + carry < len(inputData) and inputData[i + carry] == value:
-                    carry += 1
-                    value += 1
-            self.byteIncrementLengths.append(carry)
-            carry -= 1
-
-    class _Interval:
-        def __init__(self, address, length):
-            self.address = address
-            self.length = length
-
-        def __repr__(self):
-            return "({},{})".format(self.address, self.length)
-
-    def _computeCopy(self, inputData):
-        self.copyLengths = []
-
-        # for each possible value store the positions of the value in the input data
-        start = [[] for i in range(len(inputData))]
-        for i in range(len(inputData)-1):
-            start[inputData[i]].append(i)
-
-        for i, value in enumerate(inputData, start=0):
-            maxLength = 0
-            maxAddress = -1
-            for j, address in enumerate(start[inputData[i]], start=0):
-                # for performance reasons limit the number of addresses
-                if j >= self.computeLimit:
-                    break
-                # only in previous addresses
-                if address >= i:
-                    break
-                length = self._matchSubSequences(address, i, inputData)
-                if length > maxLength:
-                    maxLength = length
-                    maxAddress = address
-            self.copyLengths.append(Compressor._Interval(maxAddress, maxLength))
+    def _computeByteFill(self, data):
+        self.byteFillLengths = [1] * len(data)
+        for i in range(len(data)-2, -1, -1):
+            if data[i] == data[i+1]:
+                self.byteFillLengths[i] = self.byteFillLengths[i+1] + 1
+
+    def _computeWordFill(self, data):
+        self.wordFillLengths = [2] * len(data)
+        if len(data) > 0:
+            self.wordFillLengths[-1] = 1
+        for i in range(len(data)-3, -1, -1):
+            if data[i] == data[i+2]:
+                self.wordFillLengths[i] = self.wordFillLengths[i+1] + 1
+
+    def _computeByteIncrement(self, data):
+        self.byteIncrementLengths = [1] * len(data)
+        for i in range(len(data)-2, -1, -1):
+            if data[i+1] == data[i] + 1:
+                self.byteIncrementLengths[i] = self.byteIncrementLengths[i+1] + 1
+
+    # for each address the longest copy of previous data (at an address < 0x10000),
+    # and the longest copy of data at most 0xFF bytes before the address.
+    # the previous addresses of each three bytes sequence are kept in a hash chain,
+    # only the computeLimit last ones are checked.
+    def _computeCopy(self, data):
+        dataLength = len(data)
+        self.copyLengths = [0] * dataLength
+        self.copyAddresses = [-1] * dataLength
+        self.negativeCopyLengths = [0] * dataLength
+        self.negativeCopyAddresses = [-1] * dataLength
+
+        # the copies of two bytes are not smaller than an uncompressed chunk
+        chains = {}
+        for i in range(dataLength-2):
+            key = data[i:i+3]
+            chain = chains.get(key)
+            if chain is None:
+                chains[key] = [i]
+                continue
+            copyLength = 0
+            negativeLength = 0
+            for address in reversed(chain[-self.computeLimit:]):
+                isNegative = i - address <= 0xFF
+                if isNegative:
+                    if address >= 0x10000:
+                        minLength = negativeLength
+                    else:
+                        minLength = min(negativeLength, copyLength)
+                elif address < 0x10000:
+                    minLength = copyLength
+                else:
+                    continue
+                # can't be longer than the current ones
+                if i + minLength >= dataLength or data[address+minLength] != data[i+minLength]:
+                    continue
+                length = self._matchSubSequences(address, i, data)
+                if address < 0x10000 and length > copyLength:
+                    copyLength = length
+                    self.copyAddresses[i] = address
+                if isNegative and length > negativeLength:
+                    negativeLength = length
+                    self.negativeCopyAddresses[i] = address
+            self.copyLengths[i] = copyLength
+            self.negativeCopyLengths[i] = negativeLength
+            chain.append(i)
 
     # Find the max length of two matching sequences starting at a and b in Input array.
     # Make sure that 0 <= a < b, otherwise bad stuff will happen.
@@ -6,6 +6,9 @@ from utils.utils import range_union
 class IPS_Patch(object):
     def __init__(self, patchDict=None):
         self.records = []
+        # records encoded when they are added, to encode a merge of patches
+        # without encoding again the records of each patch
+        self.encoded = bytearray()
         self.truncate_length = None
         self.max_size = 0
         if patchDict is not None:
@@ -177,6 +180,13 @@ class IPS_Patch(object):
         if sz > self.max_size:
             self.max_size = sz
         self.records.append(record)
+        self.encoded += record['address'].to_bytes(3, byteorder='big')
+        if 'rle_count' in record:
+            self.encoded += (0).to_bytes(2, byteorder='big')
+            self.encoded += record['rle_count'].to_bytes(2, byteorder='big')
+        else:
+            self.encoded += len(record['data']).to_bytes(2, byteorder='big')
+        self.encoded += record['data']
 
     def set_truncate_length(self, truncate_length):
         self.truncate_length = truncate_length
@@ -185,16 +195,7 @@ class IPS_Patch(object):
         encoded_bytes = bytearray()
 
         encoded_bytes += 'PATCH'.encode('ascii')
-
-        for record in self.records:
-            encoded_bytes += record['address'].to_bytes(3, byteorder='big')
-            if 'rle_count' in record:
-                encoded_bytes += (0).to_bytes(2, byteorder='big')
-                encoded_bytes += record['rle_count'].to_bytes(2, byteorder='big')
-            else:
-                encoded_bytes += len(record['data']).to_bytes(2, byteorder='big')
-            encoded_bytes += record['data']
-
+        encoded_bytes += self.encoded
         encoded_bytes += 'EOF'.encode('ascii')
 
         if self.truncate_length is not None:
@@ -238,8 +239,15 @@ class IPS_Patch(object):
     def append(self, patch):
         if patch.truncate_length is not None and (self.truncate_length is None or patch.truncate_length > self.truncate_length):
             self.set_truncate_length(patch.truncate_length)
-        for record in patch.records:
-            if record['size'] > 0: # ignore empty records
+        records = [record for record in patch.records if record['size'] > 0] # ignore empty records
+        if len(records) == len(patch.records):
+            # reuse the encoded records of the patch
+            self.records += records
+            self.encoded += patch.encoded
+            if patch.max_size > self.max_size:
+                self.max_size = patch.max_size
+        else:
+            for record in records:
                 self.appendRecord(record)
 
     # gets address ranges written to by this patch
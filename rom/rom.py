@@ -1,4 +1,5 @@
-import base64
+import base64, mmap, bisect
+from collections.abc import Mapping
 
 from rom.ips import IPS_Patch
 
@@ -88,46 +89,97 @@ class ROM(object):
         assert (self.maxAddress % BANK_SIZE) == 0
 
 class FakeROM(ROM):
-    # to have the same code for real ROM and the webservice
-    def __init__(self, data={}):
+    # to have the same code for real ROM and the webservice.
+    # data is a sparse dict of address: value of the rom to read (can be empty when
+    # only writing), the written bytes are stored in pages of bytes with a mask of
+    # the written addresses to generate the ips from the contiguous written ranges.
+    pageBits = 12
+    pageSize = 1 << pageBits
+
+    def __init__(self, data=None):
         super(FakeROM, self).__init__()
-        self.data = data
+        self.data = data if data is not None else {}
+        # page number: (bytes, written mask)
+        self.pages = {}
         self.ipsPatches = []
 
+    def getPage(self, page):
+        ret = self.pages.get(page)
+        if ret is None:
+            ret = self.pages[page] = (bytearray(FakeROM.pageSize), bytearray(FakeROM.pageSize))
+        return ret
+
     def write(self, bytes):
-        for byte in bytes:
-            self.data[self.address] = byte
-            self.inc()
+        page = self.address >> FakeROM.pageBits
+        offset = self.address & (FakeROM.pageSize - 1)
+        n = len(bytes)
+        if offset + n <= FakeROM.pageSize:
+            (buffer, written) = self.pages[page] if page in self.pages else self.getPage(page)
+            buffer[offset:offset+n] = bytes
+            written[offset:offset+n] = b'\x01' * n
+        else:
+            pos = 0
+            while pos < len(bytes):
+                n = min(len(bytes) - pos, FakeROM.pageSize - offset)
+                (buffer, written) = self.getPage(page)
+                buffer[offset:offset+n] = bytes[pos:pos+n]
+                written[offset:offset+n] = b'\x01' * n
+                pos += n
+                page += 1
+                offset = 0
+        self.address += len(bytes)
+        if self.address > self.maxAddress:
+            self.maxAddress = self.address
 
     def read(self, byteCount):
-        bytes = []
-        for i in range(byteCount):
-            bytes.append(self.data[self.address])
-            self.inc()
+        start = self.address
+        end = start + byteCount
+        if len(self.pages) == 0:
+            bytes = [self.data[address] for address in range(start, end)]
+        else:
+            bytes = []
+            for address in range(start, end):
+                (page, offset) = divmod(address, FakeROM.pageSize)
+                if page in self.pages and self.pages[page][1][offset]:
+                    bytes.append(self.pages[page][0][offset])
+                else:
+                    bytes.append(self.data[address])
+        self.address = end
+        if end > self.maxAddress:
+            self.maxAddress = end
 
         return bytes
 
+    # ROM.writeBytes without the seek call, for the many words written by the palettes rando
+    def writeBytes(self, value, size, address=None):
+        if address != None:
+            self.address = address
+        self.write(value.to_bytes(size, byteorder='little'))
+
     def ipsPatch(self, ipsPatches):
         self.ipsPatches += ipsPatches
 
-    # generate ips from self data
+    # generate ips from the written data
     def ips(self):
         groupedData = {}
-        startAddress = -1
-        prevAddress = -1
-        curData = []
-        for address in sorted(self.data):
-            if address == prevAddress + 1:
-                curData.append(self.data[address])
-                prevAddress = address
-            else:
-                if len(curData) > 0:
-                    groupedData[startAddress] = curData
-                startAddress = address
-                prevAddress = address
-                curData = [self.data[startAddress]]
-        if startAddress != -1:
-            groupedData[startAddress] = curData
+        curData = None
+        curEnd = -1
+        for page in sorted(self.pages):
+            (buffer, written) = self.pages[page]
+            base = page * FakeROM.pageSize
+            start = written.find(1)
+            while start != -1:
+                end = written.find(0, start)
+                if end == -1:
+                    end = FakeROM.pageSize
+                if base + start == curEnd:
+                    # range continued from the previous page
+                    curData += buffer[start:end]
+                else:
+                    curData = buffer[start:end]
+                    groupedData[base + start] = curData
+                curEnd = base + end
+                start = written.find(1, end)
 
         return IPS_Patch(groupedData)
 
@@ -144,6 +196,47 @@ class FakeROM(ROM):
             self.data["truncate_length"] = mergedIPS.truncate_length
         self.data["max_size"] = mergedIPS.max_size
 
+# read only dict of address: value of the records of an ips file, used as the data
+# of a FakeROM. the file is memory-mapped, so it is shared by the forked processes.
+class IPSData(Mapping):
+    def __init__(self, fileName):
+        with open(fileName, 'rb') as ipsFile:
+            self.data = mmap.mmap(ipsFile.fileno(), 0, access=mmap.ACCESS_READ)
+        if self.data[:5] != b'PATCH':
+            raise Exception('Not a valid IPS patch file!')
+        # (start address, end address, offset in the file) of the records, which must not overlap
+        records = []
+        offset = 5
+        while self.data[offset:offset+3] != b'EOF':
+            address = int.from_bytes(self.data[offset:offset+3], byteorder='big')
+            length = int.from_bytes(self.data[offset+3:offset+5], byteorder='big')
+            if length == 0:
+                raise Exception('RLE records are not supported')
+            records.append((address, address+length, offset+5))
+            offset += 5 + length
+        records.sort()
+        self.starts = [record[0] for record in records]
+        self.ends = [record[1] for record in records]
+        self.offsets = [record[2] for record in records]
+        # record of the last read, the reads are mostly sequential
+        self.last = 0
+
+    def __getitem__(self, address):
+        i = self.last
+        if i >= len(self.starts) or address < self.starts[i] or address >= self.ends[i]:
+            i = bisect.bisect_right(self.starts, address) - 1
+            if i < 0 or address >= self.ends[i]:
+                raise KeyError(address)
+            self.last = i
+        return self.data[self.offsets[i] + address - self.starts[i]]
+
+    def __iter__(self):
+        for start, end in zip(self.starts, self.ends):
+            yield from range(start, end)
+
+    def __len__(self):
+        return sum(end - start for start, end in zip(self.starts, self.ends))
+
 class RealROM(ROM):
     def __init__(self, name):
         super(RealROM, self).__init__()
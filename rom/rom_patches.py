@@ -1,7 +1,60 @@
 from logic.smbool import SMBool
+from logic.cache import VersionedCache
+
+# the active patches list, the logic caches are reset when it's changed
+class PatchesList(list):
+    def _changed(self):
+        VersionedCache.resetAll()
+
+    def append(self, patch):
+        super(PatchesList, self).append(patch)
+        self._changed()
+
+    def extend(self, patches):
+        super(PatchesList, self).extend(patches)
+        self._changed()
+
+    def insert(self, i, patch):
+        super(PatchesList, self).insert(i, patch)
+        self._changed()
+
+    def remove(self, patch):
+        super(PatchesList, self).remove(patch)
+        self._changed()
+
+    def pop(self, *args):
+        ret = super(PatchesList, self).pop(*args)
+        self._changed()
+        return ret
+
+    def clear(self):
+        super(PatchesList, self).clear()
+        self._changed()
+
+    def __iadd__(self, patches):
+        super(PatchesList, self).__iadd__(patches)
+        self._changed()
+        return self
+
+    def __setitem__(self, i, value):
+        super(PatchesList, self).__setitem__(i, value)
+        self._changed()
+
+    def __delitem__(self, i):
+        super(PatchesList, self).__delitem__(i)
+        self._changed()
+
+# a new active patches list is copied in a PatchesList, the logic caches are reset
+class RomPatchesType(type):
+    def __setattr__(cls, name, value):
+        if name == 'ActivePatches':
+            if not isinstance(value, PatchesList):
+                value = PatchesList(value)
+            VersionedCache.resetAll()
+        super(RomPatchesType, cls).__setattr__(name, value)
 
 # layout patches added by randomizers
-class RomPatches:
+class RomPatches(metaclass=RomPatchesType):
     #### Patches definitions
 
     ### Layout
@@ -120,7 +173,7 @@ class RomPatches:
     Dessy = []
 
     ### Active patches
-    ActivePatches = []
+    ActivePatches = PatchesList()
 
     @staticmethod
     def has(patch):
@@ -1,4 +1,5 @@
 import os, json
+from collections.abc import Mapping
 
 from rom.rom_patches import RomPatches
 from rom.rom import RealROM, FakeROM
@@ -19,7 +20,7 @@ class RomLoader(object):
                 return RomLoaderJson(rom, magic)
             else:
                 raise Exception("wrong rom file type: {}".format(ext[1]))
-        elif type(rom) is dict:
+        elif isinstance(rom, Mapping):
             return RomLoaderDict(rom, magic)
 
     def assignItems(self, locations):
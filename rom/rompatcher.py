@@ -388,9 +388,13 @@ class RomPatcher:
             raise Exception("Error patching {}. ({})".format(self.romFileName, e))
 
     def applyIPSPatch(self, patchName, patchDict=None, ipsDir=None):
+        print("Apply patch {}".format(patchName))
+        if patchDict is None and ipsDir is None:
+            # dict patch or ips file, the shipped ones are parsed once by process
+            self.ipsPatches.append(self.patchAccess.getPatch(patchName))
+            return
         if patchDict is None:
             patchDict = self.patchAccess.getDictPatches()
-        print("Apply patch {}".format(patchName))
         if patchName in patchDict:
             patch = IPS_Patch(patchDict[patchName])
         else:
@@ -1061,11 +1065,11 @@ class RomPatcher:
         # data: [] of 256 int
         # address: the address where the compressed bytes will be written
         # return the size of the compressed data
-        compressedData = Compressor().compress(data)
+        # called for each palette by the palettes rando
+        compressedData = Compressor(optimal=False).compress(data)
 
         self.romFile.seek(address)
-        for byte in compressedData:
-            self.romFile.writeByte(byte)
+        self.romFile.write(bytes(compressedData))
 
         return len(compressedData)
 
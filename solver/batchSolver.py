@@ -0,0 +1,105 @@
+import os, io, time, tempfile, contextlib, multiprocessing, utils.log
+
+from solver.standardSolver import StandardSolver
+from solver.conf import Conf
+from rom.ips import IPS_Patch
+from logic.logicstate import LogicState
+
+# solve a batch of roms with a pool of worker processes.
+#
+# the logic state (patches, doors, objectives, knows, locations) is global and
+# set by the solver when it loads a rom and a preset, so it is restored after
+# each rom. the workers are forked from the parent, which has already imported
+# the logic modules.
+class BatchSolver(object):
+    romExtensions = ['.sfc', '.smc', '.json', '.ips']
+
+    def __init__(self, presetFileName, difficultyTarget=None, pickupStrategy=None, itemsForbidden=[],
+                 vanillaRom=None, extStatsStep=None, runtimeLimit_s=0):
+        self.log = utils.log.get('BatchSolver')
+        self.presetFileName = presetFileName
+        self.difficultyTarget = difficultyTarget if difficultyTarget is not None else Conf.difficultyTarget
+        self.pickupStrategy = pickupStrategy if pickupStrategy is not None else Conf.itemsPickup
+        self.itemsForbidden = itemsForbidden
+        self.extStatsStep = extStatsStep
+        self.runtimeLimit_s = runtimeLimit_s
+        # read once in the parent, ips are applied on it in the workers
+        self.vanillaRom = None
+        if vanillaRom is not None:
+            with open(vanillaRom, 'rb') as romFile:
+                self.vanillaRom = romFile.read()
+
+    # roms to solve from files and directories
+    @staticmethod
+    def getRoms(paths):
+        roms = []
+        for path in paths:
+            if os.path.isdir(path):
+                roms += sorted(os.path.join(path, f) for f in os.listdir(path)
+                               if os.path.splitext(f)[1].lower() in BatchSolver.romExtensions)
+            else:
+                roms.append(path)
+        return roms
+
+    # solve one rom, return a dict with the solver results
+    def solve(self, rom, extStats=False):
+        start = time.process_time()
+        ret = {'rom': rom, 'preset': os.path.splitext(os.path.basename(self.presetFileName))[0]}
+        tmpFiles = []
+        try:
+            romFileName = rom
+            if os.path.splitext(rom)[1].lower() == '.ips':
+                if self.vanillaRom is None:
+                    raise Exception("a vanilla rom is required to solve ips")
+                romFileName = self.getTmpFile('.sfc', tmpFiles)
+                with open(romFileName, 'wb') as romFile:
+                    romFile.write(IPS_Patch.load(rom).apply(self.vanillaRom))
+            extStatsFilename = self.getTmpFile('.sql', tmpFiles) if extStats == True else None
+            # the solver prints the rom infos
+            with contextlib.redirect_stdout(io.StringIO()):
+                solver = StandardSolver(romFileName, self.presetFileName, self.difficultyTarget,
+                                        self.pickupStrategy, self.itemsForbidden, type='rando',
+                                        extStatsFilename=extStatsFilename, extStatsStep=self.extStatsStep,
+                                        runtimeLimit_s=self.runtimeLimit_s)
+                solver.solveRom()
+            ret['difficulty'] = solver.difficulty
+            ret['itemsOk'] = solver.itemsOk
+            ret['knowsUsed'] = solver.knowsUsed
+            ret['knowsKnown'] = solver.knowsKnown
+            ret['generatedPath'] = [(loc.Name, loc.itemName) for loc in solver.visitedLocations]
+            if extStatsFilename is not None:
+                # aggregated in the parent
+                ret['extStats'] = solver.extStats
+        except Exception as e:
+            self.log.debug("rom {}: {}".format(rom, e))
+            ret['difficulty'] = -1
+            ret['errorMsg'] = "Error: {}".format(e)
+        finally:
+            for tmpFile in tmpFiles:
+                os.remove(tmpFile)
+        ret['duration'] = time.process_time() - start
+        return ret
+
+    def getTmpFile(self, suffix, tmpFiles):
+        (fd, fileName) = tempfile.mkstemp(suffix=suffix)
+        os.close(fd)
+        tmpFiles.append(fileName)
+        return fileName
+
+    # solve the roms in a pool of workers, yield the results in completion order.
+    # if extStats is True the solver extended stats (difficulty, techniques, solverStats, locsItems)
+    # are in the 'extStats' key of the results.
+    def run(self, roms, workers, extStats=False):
+        global currentBatch
+        currentBatch = (self, extStats)
+        with multiprocessing.get_context('fork').Pool(workers) as pool:
+            for ret in pool.imap_unordered(solveRom, roms):
+                yield ret
+
+currentBatch = None
+
+# pool job, the batch is inherited from the parent process
+def solveRom(rom):
+    (batch, extStats) = currentBatch
+    with LogicState():
+        return batch.solve(rom, extStats)
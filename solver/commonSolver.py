@@ -153,33 +153,37 @@ class CommonSolver(object):
         difficultyTarget = Conf.difficultyTarget
         nextLocations = locations
 
-        # before looping on all diff targets, get only the available locations with diff target infinity
-        if difficultyTarget != infinity:
-            self.areaGraph.getAvailableLocations(nextLocations, self.smbm, infinity, self.lastAP)
-            nextLocations = [loc for loc in nextLocations if loc.difficulty]
-
-        while True:
-            self.areaGraph.getAvailableLocations(nextLocations, self.smbm, difficultyTarget, self.lastAP)
-            # check post available functions too
-            for loc in nextLocations:
-                loc.evalPostAvailable(self.smbm)
-
-            self.areaGraph.useCache(True)
-            # also check if we can come back to current AP from the location
-            for loc in nextLocations:
-                loc.evalComeBack(self.smbm, self.areaGraph, self.lastAP)
-            self.areaGraph.useCache(False)
-
-            nextLocations = [loc for loc in nextLocations if not loc.difficulty]
-            if not nextLocations:
-                break
+        # the items don't change during the computation, so keep the transitions
+        # difficulties for all the graph traversals
+        self.areaGraph.useCache(True)
+        try:
+            # before looping on all diff targets, get only the available locations with diff target infinity
+            if difficultyTarget != infinity:
+                self.areaGraph.getAvailableLocations(nextLocations, self.smbm, infinity, self.lastAP)
+                nextLocations = [loc for loc in nextLocations if loc.difficulty]
+
+            while True:
+                self.areaGraph.getAvailableLocations(nextLocations, self.smbm, difficultyTarget, self.lastAP)
+                # check post available functions too
+                for loc in nextLocations:
+                    loc.evalPostAvailable(self.smbm)
+
+                # also check if we can come back to current AP from the location
+                for loc in nextLocations:
+                    loc.evalComeBack(self.smbm, self.areaGraph, self.lastAP)
+
+                nextLocations = [loc for loc in nextLocations if not loc.difficulty]
+                if not nextLocations:
+                    break
 
-            if difficultyTarget == infinity:
-                # we've tested all the difficulties
-                break
+                if difficultyTarget == infinity:
+                    # we've tested all the difficulties
+                    break
 
-            # start a new loop with next difficulty
-            difficultyTarget = self.getNextDifficulty(difficultyTarget)
+                # start a new loop with next difficulty
+                difficultyTarget = self.getNextDifficulty(difficultyTarget)
+        finally:
+            self.areaGraph.useCache(False)
 
         if self.log.getEffectiveLevel() == logging.DEBUG:
             self.log.debug("available {} locs:".format(phase))
@@ -63,11 +63,13 @@ class InteractiveSolver(CommonSolver):
                 web2Internal[self.apNameInternal2Web(point)] = point
         return web2Internal
 
-    def dumpState(self):
+    def getState(self):
         state = SolverState(self.debug)
         state.fromSolver(self)
+        return state
 
-        state.toJson(self.outputFileName)
+    def dumpState(self):
+        self.getState().toJson(self.outputFileName)
 
     def initialize(self, mode, rom, presetFileName, magic, fill, startLocation):
         # load rom and preset, return first state
@@ -115,21 +117,35 @@ class InteractiveSolver(CommonSolver):
         self.dumpState()
 
     def iterate(self, stateJson, scope, action, params):
-        self.debug = params["debug"]
-        self.smbm = SMBoolManager()
-
         state = SolverState()
         state.fromJson(stateJson)
-        state.toSolver(self)
+        self.loadState(state, params["debug"])
 
-        # save current AP
-        previousAP = self.lastAP
+        if self.applyAction(scope, action, params):
+            # return them
+            self.dumpState()
+
+    def loadState(self, state, debug):
+        self.debug = debug
+        self.smbm = SMBoolManager()
+
+        state.toSolver(self)
 
         self.loadPreset(self.presetFileName)
 
         # add already collected items to smbm
         self.smbm.addItems(self.collectedItems)
 
+    # apply an action on the loaded state (with loadState, or the state left by the previous action).
+    # return False if there's no new state (plando saved)
+    def applyAction(self, scope, action, params):
+        self.debug = params["debug"]
+        self.errorMsg = ""
+        self.locDelta = 0
+
+        # save current AP
+        previousAP = self.lastAP
+
         if scope == 'item':
             if action == 'clear':
                 self.clearItems(True)
@@ -195,7 +211,8 @@ class InteractiveSolver(CommonSolver):
 
         if scope == 'common':
             if action == 'save':
-                return self.savePlando(params['lock'], params['escapeTimer'])
+                self.savePlando(params['lock'], params['escapeTimer'])
+                return False
             elif action == 'randomize':
                 self.randoPlando(params)
 
@@ -255,8 +272,7 @@ class InteractiveSolver(CommonSolver):
             self.clearLocs(self.majorLocations)
             self.computeLocationsDifficulty(self.majorLocations)
 
-        # return them
-        self.dumpState()
+        return True
 
     def getLocNameFromAddress(self, address):
         return self.locsAddressName[address]
@@ -0,0 +1,139 @@
+import copy, os, time, json, threading
+
+from solver.interactiveSolver import InteractiveSolver
+from solver.solverState import SolverState
+from logic.logicstate import LogicState
+import utils.log
+
+# keeps the interactive solver of the last tracker/plando session alive in the
+# web process, so that an action doesn't require to start a solver process
+# and reload the whole state.
+#
+# the logic state (locations, patches, doors) is global, so only one session
+# can have its state loaded in the process. for the other ones, or when the
+# state given by the web session is not the one we returned last time (another
+# web worker handled a request in between), the solver is reloaded from the
+# json state, starting from the logic state of the process when the engine was
+# created.
+#
+# the other requests of the web process can also change the logic state
+# (patches, skill preset, doors) without using the engine, so the logic state
+# of the live solver is saved after each action and restored before the next one.
+class SessionEngine(object):
+    # key added in the returned state to check that it's the one of the live solver
+    stepKey = "sessionEngineStep"
+
+    def __init__(self, idleTimeout=1800, lockTimeout=5):
+        self.idleTimeout = idleTimeout
+        # max time to wait for the action of another session
+        self.lockTimeout = lockTimeout
+        # logic state to start from when a solver is loaded from a json state
+        self.pristineState = LogicState()
+        # live session: {'id': sessionId, 'solver': InteractiveSolver, 'step': str, 'lastUsed': time, 'logicState': LogicState}
+        self.session = None
+        self.nextStep = 0
+        self.lock = threading.Lock()
+        self.log = utils.log.get('SessionEngine')
+
+    # apply the action on the session solver, return the new state dict.
+    # state: the current state of the session, as returned by the previous action,
+    #        with the values set by the web session (see loadSessionValues)
+    # raise SessionEngineBusy if the engine is used by another request for too long,
+    # the action can then be done in a solver process.
+    def iterate(self, sessionId, state, scope, action, params, logic='vanilla'):
+        if not self.lock.acquire(timeout=self.lockTimeout):
+            raise SessionEngineBusy("session engine still used after {}s".format(self.lockTimeout))
+        try:
+            self.evictIdle()
+            session = self.session
+            try:
+                if (session is None
+                    or session['id'] != sessionId
+                    or session['step'] != state.get(self.stepKey, None)):
+                    self.log.debug("reload session {} from state".format(sessionId))
+                    # the previous live solver is dropped before its state is
+                    # replaced, the new one is loaded on the pristine logic
+                    self.session = None
+                    self.pristineState.restore()
+                    session = {'id': sessionId, 'solver': InteractiveSolver(None, logic)}
+                    solverState = SolverState()
+                    solverState.fromDict(copy.deepcopy(state))
+                    session['solver'].loadState(solverState, params["debug"])
+                    self.session = session
+                else:
+                    session['logicState'].restore()
+                session['lastUsed'] = time.time()
+                solver = session['solver']
+                self.loadSessionValues(solver, state)
+                solver.applyAction(scope, action, params)
+                session['logicState'] = LogicState()
+            except:
+                # the live solver is in an unknown state
+                self.session = None
+                raise
+            # same state as the one loaded from the json output of the solver process
+            newState = json.loads(json.dumps(solver.getState().state))
+            session['step'] = '{}-{}'.format(os.getpid(), self.nextStep)
+            self.nextStep += 1
+            newState[self.stepKey] = session['step']
+            return newState
+        finally:
+            self.lock.release()
+
+    # the web session can change some values of the state between two actions,
+    # they're set in the live solver like when it's loaded from the state
+    def loadSessionValues(self, solver, state):
+        solver.escapeTimer = state["escapeTimer"]
+
+    # free the live solver memory when it's not used anymore
+    def evictIdle(self):
+        if self.session is not None and time.time() - self.session['lastUsed'] > self.idleTimeout:
+            self.session = None
+
+    # convert the web service parameters to the interactive solver ones,
+    # like solver.py does with its command line parameters.
+    # return None for actions which are not handled in process.
+    @staticmethod
+    def getSolverParams(scope, action, mode, parameters):
+        params = {}
+        if scope == 'common':
+            # plando save and rando are done in their own process
+            return None
+        elif scope == 'item':
+            if action in ['add', 'replace']:
+                params = {'loc': parameters.get('loc', None), 'item': None, 'hide': False}
+                if mode != 'standard':
+                    params['item'] = parameters['item']
+                    params['hide'] = parameters['hide'] == True
+            elif action == 'remove':
+                if 'loc' in parameters:
+                    params = {'loc': parameters['loc']}
+                elif 'count' in parameters:
+                    params = {'count': int(parameters['count'])}
+                else:
+                    params = {'item': str(parameters['item'])}
+            elif action == 'toggle':
+                params = {'item': parameters['item']}
+            elif action == 'upload_scav':
+                params = {'plandoScavengerOrder': parameters.get('plandoScavengerOrder', [])}
+        elif scope == 'area':
+            if action == 'add':
+                params = {'startPoint': parameters['startPoint'], 'endPoint': parameters['endPoint']}
+            elif action == 'remove' and 'startPoint' in parameters:
+                params = {'startPoint': parameters['startPoint']}
+        elif scope == 'door':
+            if action == 'replace':
+                params = {'doorName': parameters['doorName'], 'newColor': parameters['newColor']}
+            elif action == 'toggle':
+                params = {'doorName': parameters['doorName']}
+        elif scope == 'dump':
+            if action == 'import':
+                params = {'dump': parameters['dump']}
+        params["debug"] = mode == 'debug'
+        return params
+
+# the action can't be done in process for now, but can be done in a solver process
+class SessionEngineBusy(Exception):
+    pass
+
+sessionEngine = SessionEngine()
@@ -312,6 +312,10 @@ class SolverState(object):
 #                print("{}: {}".format(key, self.state[key]))
 #        print("")
 
+    def fromDict(self, state):
+        # the state is modified by the solver, give it a copy if you need to keep it
+        self.state = state
+
     def toJson(self, outputFileName):
         with open(outputFileName, 'w') as jsonFile:
             json.dump(self.state, jsonFile)
@@ -39,6 +39,8 @@ class StandardSolver(CommonSolver):
 
         self.extStatsFilename = extStatsFilename
         self.extStatsStep = extStatsStep
+        # (difficulty, techniques, solverStats, locsItems) when extStatsFilename is set
+        self.extStats = None
 
         # can be called from command line (console) or from web site (web)
         self.type = type
@@ -92,9 +94,11 @@ class StandardSolver(CommonSolver):
                     locsItems[loc.Name] = loc.itemName
                     firstMinor[loc.itemName] = True
 
+            self.extStats = (self.difficulty, knowsUsedList, self.solverStats, locsItems)
+
             import utils.db as db
             with open(self.extStatsFilename, 'a') as extStatsFile:
-                db.DB.dumpExtStatsSolver(self.difficulty, knowsUsedList, self.solverStats, locsItems, self.extStatsStep, extStatsFile)
+                db.DB.dumpExtStatsSolver(*self.extStats, self.extStatsStep, extStatsFile)
 
         self.output.out()
 
@@ -0,0 +1,86 @@
+#!/usr/bin/python3
+# solve a batch of roms with a pool of processes,
+# used to compute the solver extended stats without a solver process for each rom.
+
+import argparse, os, sys, json
+
+from logic.logic import Logic
+import utils.log
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Random Metroid Solver batch solving")
+    parser.add_argument('roms', help="roms (sfc/smc/json/ips) or directories of roms to solve", nargs='*')
+    parser.add_argument('--manifest', help="file with a rom path on each line, - for stdin", dest='manifest', nargs='?', default=None)
+    parser.add_argument('--preset', '-p', help="the preset file", dest='presetFileName', nargs='?', default='standard_presets/regular.json')
+    parser.add_argument('--difficultyTarget', '-t', help="the difficulty target that the solver will aim for",
+                        dest='difficultyTarget', nargs='?', default=None, type=int)
+    parser.add_argument('--pickupStrategy', '-s', help="Pickup strategy for the Solver",
+                        dest='pickupStrategy', nargs='?', default=None, choices=['all', 'any'])
+    parser.add_argument('--itemsForbidden', '-f', help="Item not picked up during solving",
+                        dest='itemsForbidden', nargs='+', default=[], action='append')
+    parser.add_argument('--vanillaRom', help="vanilla rom to apply the ips on", dest='vanillaRom', nargs='?', default=None)
+    parser.add_argument('--workers', help="number of worker processes", dest='workers', nargs='?', default=2, type=int)
+    parser.add_argument('--runtime', help="maximum runtime limit in seconds for each rom. If 0 or negative, no runtime limit.",
+                        dest='runtimeLimit_s', nargs='?', default=0, type=int)
+    parser.add_argument('--output', '-o', help="json lines output file, stdout if not set", dest='output', nargs='?', default=None)
+    parser.add_argument('--ext_stats', help="extended stats output: aggregated SQL, or a local .sqlite database",
+                        nargs='?', default=None, dest='extStatsFilename')
+    parser.add_argument('--ext_stats_flush', help="number of roms aggregated before writing the extended stats",
+                        dest='extStatsFlush', nargs='?', default=1000, type=int)
+    parser.add_argument('--randoPreset', help="rando preset name of the roms in the extended stats",
+                        dest='randoPreset', nargs='?', default=None)
+    parser.add_argument('--ext_stats_count', help="count the solved roms as seeds in the extended stats, when they are not added by the randomizer",
+                        dest='extStatsCount', action='store_true')
+    parser.add_argument('--ext_stats_step', help="what extended stats to generate",
+                        nargs='?', default=None, dest='extStatsStep', type=int)
+    parser.add_argument('--debug', '-d', help="activate debug logging", dest='debug', action='store_true')
+    args = parser.parse_args()
+
+    utils.log.init(args.debug)
+    logger = utils.log.get('BatchSolver')
+
+    # import the logic modules before forking the workers
+    Logic.factory('vanilla')
+    from solver.batchSolver import BatchSolver
+    from utils.extstats import ExtStatsAggregator
+
+    roms = BatchSolver.getRoms(args.roms)
+    if args.manifest is not None:
+        manifest = open(args.manifest, 'r') if args.manifest != '-' else sys.stdin
+        roms += BatchSolver.getRoms([line.strip() for line in manifest if len(line.strip()) > 0])
+        if manifest != sys.stdin:
+            manifest.close()
+    if len(roms) == 0:
+        print("No rom to solve")
+        sys.exit(1)
+
+    # itemsForbidden is like that: [['Varia'], ['Reserve'], ['Gravity']], fix it
+    itemsForbidden = [item[0] for item in args.itemsForbidden]
+
+    batch = BatchSolver(args.presetFileName, args.difficultyTarget, args.pickupStrategy, itemsForbidden,
+                        args.vanillaRom, args.extStatsStep, args.runtimeLimit_s)
+
+    output = open(args.output, 'a') if args.output is not None else sys.stdout
+    extStats = None
+    if args.extStatsFilename is not None:
+        if args.randoPreset is None:
+            print("The rando preset is required for the extended stats")
+            sys.exit(1)
+        skillPreset = os.path.splitext(os.path.basename(args.presetFileName))[0]
+        extStats = ExtStatsAggregator(skillPreset, args.randoPreset, args.extStatsFilename, args.extStatsFlush)
+    failed = 0
+    try:
+        for ret in batch.run(roms, args.workers, extStats is not None):
+            romExtStats = ret.pop('extStats', None)
+            output.write(json.dumps(ret)+'\n')
+            output.flush()
+            if ret['difficulty'] < 0:
+                failed += 1
+            if romExtStats is not None:
+                extStats.addSolver(*romExtStats, args.extStatsStep, args.extStatsCount)
+    finally:
+        if output != sys.stdout:
+            output.close()
+        if extStats is not None:
+            extStats.close()
+    logger.debug("roms: {} not solved: {}".format(len(roms), failed))
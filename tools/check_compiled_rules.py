@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+
+# differential check of the compiled logic rules (logic/rulecompiler.py)
+# against the reference logic functions, on random items states.
+
+import sys, os, random, time, argparse
+
+# now that we're in directory 'tools/' we have to update sys.path
+sys.path.append(os.path.dirname(sys.path[0]))
+
+from logic.logic import Logic
+from utils.utils import PresetLoader
+from utils.objectives import Objectives
+from utils.doorsmanager import DoorsManager
+from rom.rom_patches import RomPatches
+from graph.graph_utils import GraphUtils
+import utils.log
+
+majors = ['Bomb', 'Charge', 'Ice', 'HiJump', 'SpeedBooster', 'Wave', 'Spazer', 'SpringBall', 'Varia', 'Plasma', 'Grapple', 'Morph', 'Gravity', 'XRayScope', 'SpaceJump', 'ScrewAttack']
+ammo = {'Missile': 46, 'Super': 10, 'PowerBomb': 10, 'ETank': 14, 'Reserve': 4}
+bosses = ['Kraid', 'Phantoon', 'Draygon', 'Ridley', 'SporeSpawn', 'Crocomire', 'Botwoon', 'GoldenTorizo']
+
+def randomItems(rnd):
+    items = [item for item in majors + bosses if rnd.random() < 0.5]
+    for (item, maxCount) in ammo.items():
+        items += [item] * rnd.randint(0, maxCount)
+    return items
+
+def getRules():
+    # (name, function)
+    rules = []
+    for ap in Logic.accessPoints:
+        rules.append(('{} traverse'.format(ap.Name), ap.traverse))
+        for (dst, func) in ap.intraTransitions.items():
+            rules.append(('{} -> {}'.format(ap.Name, dst), func))
+    for loc in Logic.locations:
+        for (ap, func) in (loc.AccessFrom or {}).items():
+            rules.append(('{} from {}'.format(loc.Name, ap), func))
+        if loc.Available is not None:
+            rules.append(('{} available'.format(loc.Name), loc.Available))
+        if loc.PostAvailable is not None:
+            rules.append(('{} post available'.format(loc.Name), loc.PostAvailable))
+    return rules
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Check the compiled logic rules against the logic functions")
+    parser.add_argument('--logic', help='logic to use', dest='logic', nargs='?', default="vanilla", choices=["vanilla", "rotation"])
+    parser.add_argument('--preset', help="preset to use", dest='preset', nargs='?', default='standard_presets/regular.json')
+    parser.add_argument('--states', help="number of random items states", dest='states', nargs='?', default=500, type=int)
+    parser.add_argument('--passes', help="number of evaluations of each state", dest='passes', nargs='?', default=3, type=int)
+    parser.add_argument('--seed', help="random seed", dest='seed', nargs='?', default=0, type=int)
+    args = parser.parse_args()
+
+    utils.log.init(False)
+    Logic.factory(args.logic)
+    from logic.smboolmanager import SMBoolManager
+    from logic.rulecompiler import RuleCompiler
+
+    PresetLoader.factory(args.preset).load()
+    Objectives(True).setVanilla()
+    RomPatches.ActivePatches = RomPatches.Total[:] + GraphUtils.getGraphPatches('Landing Site')
+    DoorsManager.setDoorsColor()
+
+    sm = SMBoolManager()
+    compiler = RuleCompiler(sm)
+    rules = [(name, func, compiler.compile(func)) for (name, func) in getRules()]
+    rnd = random.Random(args.seed)
+    states = [randomItems(rnd) for i in range(args.states)]
+
+    errors = 0
+    for p in range(args.passes):
+        refDuration = 0
+        compiledDuration = 0
+        for items in states:
+            sm.resetItems()
+            sm.addItems(items)
+            for (name, func, rule) in rules:
+                start = time.perf_counter()
+                ref = func(sm)
+                refDuration += time.perf_counter() - start
+                start = time.perf_counter()
+                (boolean, difficulty) = compiler.evaluate(rule)
+                compiledDuration += time.perf_counter() - start
+                smb = compiler.evaluateSMBool(rule)
+                if (ref.bool != boolean or (ref.bool and ref.difficulty != difficulty)
+                    or (ref.bool and (sorted(ref.knows) != sorted(smb.knows) or sorted(ref.items) != sorted(smb.items)))):
+                    errors += 1
+                    print("mismatch for {} with {}: reference: {} compiled: {}".format(name, sorted(items), ref, smb))
+        print("pass {}: reference: {:.3f}s compiled: {:.3f}s".format(p, refDuration, compiledDuration))
+
+    print("rules: {} states: {} passes: {} mismatches: {}".format(len(rules), len(states), args.passes, errors))
+    print("compiler stats: {}".format(compiler.getStats()))
+    sys.exit(1 if errors > 0 else 0)
@@ -0,0 +1,48 @@
+#!/usr/bin/env python3
+
+# check that the random fill gives the same seed whatever the number of
+# fill workers (randomizer.py --fillWorkers). without workers (1), the fill
+# uses the rando random state and gives another seed.
+
+import sys, os, subprocess, tempfile, hashlib, argparse
+
+# randomizer.py is in the parent directory of 'tools/'
+rootDir = os.path.dirname(os.path.abspath(sys.path[0]))
+
+def generate(preset, seed, workers, tmpDir):
+    outDir = os.path.join(tmpDir, str(workers))
+    os.makedirs(outDir)
+    params = [sys.executable, os.path.join(rootDir, 'randomizer.py'),
+              '--randoPreset', preset, '--seed', str(seed),
+              '--fillWorkers', str(workers), '--output', 'out.sfc']
+    with open(os.path.join(outDir, 'log.txt'), 'w') as log:
+        ret = subprocess.call(params, cwd=outDir, stdout=log, stderr=subprocess.STDOUT)
+    outFile = os.path.join(outDir, 'out.sfc')
+    if ret != 0 or not os.path.exists(outFile):
+        return None
+    with open(outFile, 'rb') as f:
+        return hashlib.md5(f.read()).hexdigest()
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="compare the seeds generated with several numbers of fill workers")
+    parser.add_argument('--randoPreset', help="rando preset file", dest="randoPreset",
+                        default=os.path.join(rootDir, 'rando_presets', 'Chozo_Speedrun.json'))
+    parser.add_argument('--seed', help="seeds to generate", dest="seeds", type=int, nargs='+', default=[99])
+    parser.add_argument('--fillWorkers', help="numbers of fill workers to compare", dest="fillWorkers",
+                        type=int, nargs='+', default=[2, 3, 4])
+    args = parser.parse_args()
+
+    preset = os.path.abspath(args.randoPreset)
+    ok = True
+    for seed in args.seeds:
+        with tempfile.TemporaryDirectory() as tmpDir:
+            hashes = {workers: generate(preset, seed, workers, tmpDir) for workers in args.fillWorkers}
+            same = None not in hashes.values() and len(set(hashes.values())) == 1
+            print("seed {}: {} {}".format(seed, "OK" if same else "KO", hashes))
+            if not same:
+                ok = False
+                for workers in args.fillWorkers:
+                    if hashes[workers] is None:
+                        with open(os.path.join(tmpDir, str(workers), 'log.txt')) as log:
+                            print("fillWorkers {} failed:\n{}".format(workers, log.read()))
+    sys.exit(0 if ok else 1)
@@ -647,11 +647,30 @@ order by init_time;"""
         header = ["initTime", "returnCode", "duration", "errorMsg"]
         return (header, self.execSelect(sql, (weeks,)))
 
+    # we can't have special chars in columns names
+    @staticmethod
+    def getLocationColumn(location):
+        return removeChars(location, " ,()-")
+
+    @staticmethod
+    def getDifficultyColumn(difficulty):
+        if difficulty < medium:
+            return "easy"
+        elif difficulty < hard:
+            return "medium"
+        elif difficulty < harder:
+            return "hard"
+        elif difficulty < hardcore:
+            return "harder"
+        elif difficulty < mania:
+            return "hardcore"
+        else:
+            return "mania"
+
     @staticmethod
     def dumpItemLocs(locsItems, sqlFile):
         for (location, item) in locsItems.items():
-            # we can't have special chars in columns names
-            location = removeChars(location, " ,()-")
+            location = DB.getLocationColumn(location)
             sql = "insert into item_locs (ext_id, item, {}) values (@last_id, '%s', 1) on duplicate key update {} = {} + 1;\n".format(location, location, location)
 
             sqlFile.write(sql % (item,))
@@ -676,19 +695,7 @@ set @last_id = last_insert_id();
         if step == 1:
             DB.dumpItemLocs(locsItems, sqlFile)
 
-            # get difficulty column
-            if difficulty < medium:
-                column = "easy"
-            elif difficulty < hard:
-                column = "medium"
-            elif difficulty < harder:
-                column = "hard"
-            elif difficulty < hardcore:
-                column = "harder"
-            elif difficulty < mania:
-                column = "hardcore"
-            else:
-                column = "mania"
+            column = DB.getDifficultyColumn(difficulty)
 
             sql = "insert into difficulties (ext_id, {}) values (@last_id, 1) on duplicate key update {} = {} + 1;\n".format(column, column, column)
             sqlFile.write(sql)
@@ -728,7 +735,7 @@ from extended_stats e
 where e.skillPreset = %s and e.randoPreset = %s;"""
 
         sqlSolverStats = """
-select s.name, s.value, round(count(*) * 100 / e.count, 1)
+select s.name, s.value, round(sum(s.count) * 100 / e.count, 1)
 from extended_stats e
   join solver_stats s on e.id = s.ext_id
 where e.skillPreset = %s and e.randoPreset = %s
@@ -768,7 +775,7 @@ order by 1,2;"""
             return None
 
         sqlSolverStats = """
-select s.name, s.value, round(count(*) * 100 / e.count, 1)
+select s.name, s.value, round(sum(s.count) * 100 / e.count, 1)
 from extended_stats e
   join solver_stats s on e.id = s.ext_id
 where e.skillPreset = %s and e.randoPreset = %s
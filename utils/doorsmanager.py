@@ -2,6 +2,7 @@ import random
 from enum import IntEnum,IntFlag
 from logic.smbool import SMBool
 from rom.rom_patches import RomPatches
+from logic.cache import VersionedCache
 import utils.log, logging
 
 LOG = utils.log.get('DoorsManager')
@@ -97,8 +98,10 @@ class Door(object):
         self.setColor('blue')
         self.forced = True
 
+    # the logic caches depend on the doors colors
     def setColor(self, color):
         self.color = color
+        VersionedCache.resetAll()
 
     def getColor(self):
         if self.hidden:
@@ -203,9 +206,11 @@ class Door(object):
     def hide(self):
         if self.canHide():
             self.hidden = True
+            VersionedCache.resetAll()
 
     def reveal(self):
         self.hidden = False
+        VersionedCache.resetAll()
 
     def switch(self):
         if self.hidden:
@@ -221,6 +226,7 @@ class Door(object):
         self.setColor(data[0])
         self.facing = data[1]
         self.hidden = data[2]
+        VersionedCache.resetAll()
 
 class DoorsManager():
     doors = {
@@ -0,0 +1,272 @@
+import os, sqlite3
+
+import utils.log
+from utils.db import DB
+
+# in process aggregation of the extended stats of a stream of seeds for a
+# skill preset/rando preset pair, instead of appending sql for each seed.
+#
+# the counts are accumulated in memory and flushed in the extended stats file
+# every flushCount seeds and at close:
+# - .sqlite file: the counts are added to a local sqlite database with the same
+#   tables as the stats database (with an item_locs row for each item/location),
+#   getExtStat reads it and returns the same values as DB.getExtStat.
+# - other files: compact sql for the stats database is appended, with one insert
+#   for each item/technique/solver stat value holding the counts of all the seeds.
+class ExtStatsAggregator(object):
+    sqliteExtensions = ['.sqlite', '.sqlite3', '.db']
+    difficultiesColumns = ['easy', 'medium', 'hard', 'harder', 'hardcore', 'mania']
+    # items not displayed in the stats, like in DB.getExtStat
+    excludedItems = ['Nothing', 'NoEnergy', 'ETank', 'Reserve', 'Kraid', 'Phantoon', 'Draygon',
+                     'Ridley', 'MotherBrain', 'SporeSpawn', 'Botwoon', 'Crocomire', 'GoldenTorizo']
+
+    sqliteSchema = """
+create table if not exists extended_stats (
+  id integer primary key,
+  skillPreset text not null,
+  randoPreset text not null,
+  count integer default 0,
+  unique(skillPreset, randoPreset)
+);
+create table if not exists item_locs (
+  ext_id integer not null,
+  item text not null,
+  location text not null,
+  count integer default 0,
+  primary key(ext_id, item, location)
+);
+create table if not exists techniques (
+  ext_id integer not null,
+  technique text not null,
+  count integer default 0,
+  primary key(ext_id, technique)
+);
+create table if not exists difficulties (
+  ext_id integer not null primary key,
+  easy integer default 0,
+  medium integer default 0,
+  hard integer default 0,
+  harder integer default 0,
+  hardcore integer default 0,
+  mania integer default 0
+);
+create table if not exists solver_stats (
+  ext_id integer not null,
+  name text not null,
+  value integer not null,
+  count integer default 0,
+  primary key(ext_id, name, value)
+);
+"""
+
+    def __init__(self, skillPreset, randoPreset, fileName, flushCount=1000):
+        self.log = utils.log.get('ExtStats')
+        self.skillPreset = skillPreset
+        self.randoPreset = randoPreset
+        self.fileName = fileName
+        self.flushCount = flushCount
+        self.reset()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+        return False
+
+    @staticmethod
+    def isSqlite(fileName):
+        return os.path.splitext(fileName)[1].lower() in ExtStatsAggregator.sqliteExtensions
+
+    def reset(self):
+        # seeds counted in extended_stats
+        self.count = 0
+        # seeds added since the last flush, from the randomizer or the solver
+        self.seeds = 0
+        # (item, location): count
+        self.itemLocs = {}
+        # technique: count
+        self.techniques = {}
+        # difficulty column: count
+        self.difficulties = {}
+        # (name, value): count
+        self.solverStats = {}
+
+    def addLocsItems(self, locsItems):
+        for (location, item) in locsItems.items():
+            key = (item, location)
+            self.itemLocs[key] = self.itemLocs.get(key, 0) + 1
+
+    # same parameters as DB.dumpExtStatsItems
+    def addItems(self, locsItems):
+        self.count += 1
+        self.addLocsItems(locsItems)
+        self.added()
+
+    # same parameters as DB.dumpExtStatsSolver, count is True when the seeds
+    # are not added by the randomizer
+    def addSolver(self, difficulty, techniques, solverStats, locsItems, step, count=False):
+        if count == True:
+            self.count += 1
+        if step == 1:
+            self.addLocsItems(locsItems)
+            column = DB.getDifficultyColumn(difficulty)
+            self.difficulties[column] = self.difficulties.get(column, 0) + 1
+            for technique in techniques:
+                self.techniques[technique] = self.techniques.get(technique, 0) + 1
+        else:
+            for (stat, value) in solverStats.items():
+                key = (stat, value)
+                self.solverStats[key] = self.solverStats.get(key, 0) + 1
+        self.added()
+
+    def added(self):
+        self.seeds += 1
+        if self.flushCount > 0 and self.seeds >= self.flushCount:
+            self.flush()
+
+    def flush(self):
+        if self.seeds == 0:
+            return
+        if ExtStatsAggregator.isSqlite(self.fileName):
+            self.flushSqlite()
+        else:
+            self.flushSql()
+        self.log.debug("flushed {} seeds in {}".format(self.seeds, self.fileName))
+        self.reset()
+
+    def close(self):
+        self.flush()
+
+    def getItems(self):
+        # item: [(location, count)]
+        items = {}
+        for ((item, location), count) in self.itemLocs.items():
+            if item not in items:
+                items[item] = []
+            items[item].append((location, count))
+        return items
+
+    def flushSql(self):
+        sql = """insert into extended_stats (skillPreset, randoPreset, count)
+values
+('%s', '%s', %d)
+on duplicate key update id=LAST_INSERT_ID(id), count = count + %d;
+set @last_id = last_insert_id();
+"""
+        with open(self.fileName, 'a') as sqlFile:
+            sqlFile.write(sql % (self.skillPreset, self.randoPreset, self.count, self.count))
+
+            for (item, locs) in sorted(self.getItems().items()):
+                columns = [DB.getLocationColumn(location) for (location, count) in locs]
+                sql = "insert into item_locs (ext_id, item, {}) values (@last_id, '%s', {}) on duplicate key update {};\n".format(
+                    ', '.join(columns), ', '.join(str(count) for (location, count) in locs),
+                    ', '.join('{} = {} + values({})'.format(column, column, column) for column in columns))
+                sqlFile.write(sql % (item,))
+
+            if len(self.difficulties) > 0:
+                columns = sorted(self.difficulties)
+                sql = "insert into difficulties (ext_id, {}) values (@last_id, {}) on duplicate key update {};\n".format(
+                    ', '.join(columns), ', '.join(str(self.difficulties[column]) for column in columns),
+                    ', '.join('{} = {} + values({})'.format(column, column, column) for column in columns))
+                sqlFile.write(sql)
+
+            for (technique, count) in sorted(self.techniques.items()):
+                sql = "insert into techniques (ext_id, technique, count) values (@last_id, '%s', %d) on duplicate key update count = count + %d;\n"
+                sqlFile.write(sql % (technique, count, count))
+
+            if len(self.solverStats) > 0:
+                values = ', '.join("(@last_id, '%s', %d, %d)" % (stat, value, count)
+                                   for ((stat, value), count) in sorted(self.solverStats.items()))
+                sqlFile.write("insert into solver_stats (ext_id, name, value, count) values {};\n".format(values))
+
+            sqlFile.write("commit;\n")
+
+    @staticmethod
+    def connect(fileName):
+        # several processes can flush in the same database
+        conn = sqlite3.connect(fileName, timeout=60)
+        conn.executescript(ExtStatsAggregator.sqliteSchema)
+        return conn
+
+    def flushSqlite(self):
+        conn = ExtStatsAggregator.connect(self.fileName)
+        try:
+            with conn:
+                conn.execute("""insert into extended_stats (skillPreset, randoPreset, count) values (?, ?, ?)
+on conflict(skillPreset, randoPreset) do update set count = count + excluded.count""",
+                             (self.skillPreset, self.randoPreset, self.count))
+                (extId,) = conn.execute("select id from extended_stats where skillPreset = ? and randoPreset = ?",
+                                        (self.skillPreset, self.randoPreset)).fetchone()
+
+                conn.executemany("""insert into item_locs (ext_id, item, location, count) values (?, ?, ?, ?)
+on conflict(ext_id, item, location) do update set count = count + excluded.count""",
+                                 [(extId, item, location, count) for ((item, location), count) in self.itemLocs.items()])
+
+                if len(self.difficulties) > 0:
+                    conn.execute("insert into difficulties (ext_id) values (?) on conflict(ext_id) do nothing", (extId,))
+                    columns = sorted(self.difficulties)
+                    conn.execute("update difficulties set {} where ext_id = ?".format(
+                        ', '.join('{} = {} + ?'.format(column, column) for column in columns)),
+                                 [self.difficulties[column] for column in columns] + [extId])
+
+                conn.executemany("""insert into techniques (ext_id, technique, count) values (?, ?, ?)
+on conflict(ext_id, technique) do update set count = count + excluded.count""",
+                                 [(extId, technique, count) for (technique, count) in self.techniques.items()])
+
+                conn.executemany("""insert into solver_stats (ext_id, name, value, count) values (?, ?, ?, ?)
+on conflict(ext_id, name, value) do update set count = count + excluded.count""",
+                                 [(extId, stat, value, count) for ((stat, value), count) in self.solverStats.items()])
+        finally:
+            conn.close()
+
+    @staticmethod
+    def percent(count, total):
+        if total == 0:
+            return None
+        return round(100*count/total, 1)
+
+    # read a sqlite extended stats database, return the same values as DB.getExtStat
+    @staticmethod
+    def getExtStat(fileName, skillPreset, randoPreset):
+        from graph.vanilla.graph_locations import locations
+
+        conn = ExtStatsAggregator.connect(fileName)
+        try:
+            row = conn.execute("select id, count from extended_stats where skillPreset = ? and randoPreset = ?",
+                               (skillPreset, randoPreset)).fetchone()
+            if row is None:
+                return ([], {}, [], {})
+            (extId, total) = row
+
+            # for each item: seeds count, item, then the percentage for each location
+            # in the graph_locations order
+            locsIndex = {loc.Name: i for (i, loc) in enumerate(locations, start=2)}
+            items = {}
+            for (item, location, count) in conn.execute("select item, location, count from item_locs where ext_id = ?", (extId,)):
+                if item in ExtStatsAggregator.excludedItems:
+                    continue
+                if item not in items:
+                    items[item] = [total, item] + [ExtStatsAggregator.percent(0, total)]*len(locations)
+                if location in locsIndex:
+                    items[item][locsIndex[location]] = ExtStatsAggregator.percent(count, total)
+            items = [items[item] for item in sorted(items, key=str.lower)]
+
+            techniques = {}
+            for (technique, count) in conn.execute("select technique, count from techniques where ext_id = ?", (extId,)):
+                techniques[technique] = ExtStatsAggregator.percent(count, total)
+
+            difficulties = conn.execute("select {} from difficulties where ext_id = ?".format(
+                ', '.join(ExtStatsAggregator.difficultiesColumns)), (extId,)).fetchone()
+            if difficulties is None:
+                difficulties = []
+
+            solverStats = {}
+            for (name, value, count) in conn.execute("select name, value, count from solver_stats where ext_id = ? order by name, value", (extId,)):
+                if name not in solverStats:
+                    solverStats[name] = []
+                solverStats[name].append((value, ExtStatsAggregator.percent(count, total)))
+
+            return (items, techniques, difficulties, solverStats)
+        finally:
+            conn.close()
@@ -4,6 +4,7 @@ from rom.rom import pc_to_snes
 from logic.helpers import Bosses
 from logic.smbool import SMBool
 from logic.logic import Logic
+from logic.cache import VersionedCache
 from graph.location import locationsDict
 import utils.log, logging
 
@@ -311,6 +312,7 @@ def completeGoalData():
 
 completeGoalData()
 
+# the logic caches depend on the objectives, they're reset when they change
 class Objectives(object):
     activeGoals = []
     nbActiveGoals = 0
@@ -323,6 +325,7 @@ class Objectives(object):
     def __init__(self, tourianRequired=True):
         if Objectives._tourianRequired is None:
             Objectives._tourianRequired = tourianRequired
+            VersionedCache.resetAll()
 
     @property
     def tourianRequired(self):
@@ -332,6 +335,7 @@ class Objectives(object):
     def resetGoals(self):
         Objectives.activeGoals = []
         Objectives.nbActiveGoals = 0
+        VersionedCache.resetAll()
 
     def conflict(self, newGoal):
         LOG.debug("check if new goal {} conflicts with existing active goals".format(newGoal.name))
@@ -376,10 +380,12 @@ class Objectives(object):
         assert Objectives.nbActiveGoals <= Objectives.maxActiveGoals, "Too many active goals"
         goal.setRank(Objectives.nbActiveGoals)
         Objectives.activeGoals.append(goal)
+        VersionedCache.resetAll()
 
     def removeGoal(self, goal):
         Objectives.nbActiveGoals -= 1
         Objectives.activeGoals.remove(goal)
+        VersionedCache.resetAll()
 
     @staticmethod
     def isGoalActive(goalName):
@@ -394,6 +400,7 @@ class Objectives(object):
         for goalName, goal in Objectives.goals.items():
             if goal.area is not None:
                 goal.escapeAccessPoints = getAreaEscapeAccessPoints(goal.area)
+        VersionedCache.resetAll()
 
     @staticmethod
     def canAccess(sm, src, dst):
@@ -418,11 +425,13 @@ class Objectives(object):
         assert Objectives.isGoalActive("finish scavenger hunt")
         (_, apList) = Objectives.goals['finish scavenger hunt'].escapeAccessPoints
         apList.append(ap)
+        VersionedCache.resetAll()
 
     def _replaceEscapeAccessPoints(self, goal, aps):
         (_, apList) = Objectives.goals[goal].escapeAccessPoints
         apList.clear()
         apList += aps
+        VersionedCache.resetAll()
 
     def updateItemPercentEscapeAccess(self, collectedLocsAccessPoints):
         for pct in [25,50,75,100]:
@@ -433,6 +442,7 @@ class Objectives(object):
 
     def setScavengerHuntFunc(self, scavClearFunc):
         Objectives.goals["finish scavenger hunt"].clearFunc = scavClearFunc
+        VersionedCache.resetAll()
 
     def setItemPercentFuncs(self, totalItemsCount=None, allUpgradeTypes=None):
         for pct in [25,50,75,100]:
@@ -440,12 +450,14 @@ class Objectives(object):
             Objectives.goals[goal].clearFunc = lambda sm, ap: sm.hasItemsPercent(pct, totalItemsCount)
         if allUpgradeTypes is not None:
             Objectives.goals["collect all upgrades"].clearFunc = lambda sm, ap: sm.haveItems(allUpgradeTypes)
+        VersionedCache.resetAll()
 
     def setAreaFuncs(self, funcsByArea):
         goalsByArea = {goal.area:goal for goalName, goal in Objectives.goals.items()}
         for area, func in funcsByArea.items():
             if area in goalsByArea:
                 goalsByArea[area].clearFunc = func
+        VersionedCache.resetAll()
 
     def setSolverMode(self, scavClearFunc, majorUpgrades):
         self.setScavengerHuntFunc(scavClearFunc)
@@ -476,6 +488,7 @@ class Objectives(object):
         # rebuild ranks
         for i, goal in enumerate(Objectives.activeGoals, 1):
             goal.rank = i
+        VersionedCache.resetAll()
 
     # call from logic
     @staticmethod
@@ -579,6 +592,7 @@ class Objectives(object):
 
         Objectives._tourianRequired = not romReader.patchPresent('Escape_Trigger')
         LOG.debug("tourianRequired: {}".format(self.tourianRequired))
+        VersionedCache.resetAll()
 
     # call from rando
     def writeGoals(self, romFile):
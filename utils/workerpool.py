@@ -0,0 +1,307 @@
+import sys, os, stat, socket, struct, json, time, signal, runpy, tempfile, traceback, subprocess
+import utils.log
+
+# pool of warm worker processes running a python script (randomizer.py, solver.py)
+# without paying the interpreter startup and modules import at each call.
+#
+# the master process imports the script modules once, then forks the workers
+# which wait for jobs on a local unix socket. each job is run in a child forked
+# from its worker, so the global state (patches, doors, objectives, locations)
+# is the pristine one after import and never leaks from a job to another.
+# workers are recycled after maxJobs jobs.
+#
+# protocol: json lines, one connection per job.
+# the worker taking the connection sends {"ready": true}, the client then sends the
+# request: {"params": [script parameters], "cwd": working directory, "timeout": seconds}
+# and the worker sends the answer when the job is done:
+# answer: {"ret": script return code (-9 if killed on timeout), "duration": seconds,
+#          "output": content of the script --output file, null if not written}
+# the --output parameter of the script is replaced with a file private to the job.
+# the job is killed if the client closes the connection before the answer.
+#
+# the jobs run with the pool user rights: the socket is in a directory only
+# readable by the pool user, the connections from other users are rejected,
+# and the jobs working directory has to be in baseDir.
+
+defaultSocketPath = os.path.join(tempfile.gettempdir(), 'varia_randomizer_pool-{}'.format(os.getuid()), 'pool.sock')
+defaultTimeoutMargin = 30
+# max seconds to wait for a free worker before running the job in a new process
+defaultReadyTimeout = 2
+
+class WorkerPool(object):
+    def __init__(self, script, socketPath=defaultSocketPath, nbWorkers=2, maxJobs=100, timeoutMargin=defaultTimeoutMargin, baseDir=None):
+        self.script = os.path.abspath(script)
+        self.socketPath = socketPath
+        # the jobs working directory must be in it, the user home by default
+        self.baseDir = os.path.realpath(baseDir if baseDir is not None else os.path.expanduser('~'))
+        self.nbWorkers = nbWorkers
+        self.maxJobs = maxJobs
+        # added to the --runtime parameter to kill stuck jobs
+        self.timeoutMargin = timeoutMargin
+        self.workers = set()
+        self.running = True
+        self.log = utils.log.get('WorkerPool')
+
+    def preload(self):
+        # run the script without its main to import all its modules once
+        scriptDir = os.path.dirname(self.script)
+        if scriptDir not in sys.path:
+            sys.path.insert(0, scriptDir)
+        argv = sys.argv
+        sys.argv = [self.script]
+        try:
+            runpy.run_path(self.script, run_name='__workerpool_preload__')
+        finally:
+            sys.argv = argv
+
+    def serve(self):
+        self.preload()
+        self.checkSocketDir()
+        if os.path.exists(self.socketPath):
+            os.remove(self.socketPath)
+        self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.sock.bind(self.socketPath)
+        os.chmod(self.socketPath, 0o600)
+        self.sock.listen(64)
+        signal.signal(signal.SIGTERM, self.stop)
+        signal.signal(signal.SIGINT, self.stop)
+        self.log.info("pool for {} listening on {} with {} workers".format(self.script, self.socketPath, self.nbWorkers))
+        try:
+            while self.running:
+                while len(self.workers) < self.nbWorkers:
+                    self.spawnWorker()
+                try:
+                    (pid, status) = os.wait()
+                except ChildProcessError:
+                    continue
+                except InterruptedError:
+                    continue
+                self.workers.discard(pid)
+        finally:
+            for pid in self.workers:
+                try:
+                    os.kill(pid, signal.SIGTERM)
+                except ProcessLookupError:
+                    pass
+            self.sock.close()
+            if os.path.exists(self.socketPath):
+                os.remove(self.socketPath)
+
+    # create the socket directory, or check that it's only accessible by us
+    def checkSocketDir(self):
+        socketDir = os.path.dirname(os.path.abspath(self.socketPath))
+        os.makedirs(socketDir, mode=0o700, exist_ok=True)
+        st = os.lstat(socketDir)
+        if not stat.S_ISDIR(st.st_mode) or st.st_uid != os.getuid() or st.st_mode & 0o077 != 0:
+            raise PermissionError("socket directory {} must be a directory only accessible by its owner".format(socketDir))
+
+    # the peer user is only known on linux, elsewhere the socket directory rights are used
+    def isPeerAllowed(self, conn):
+        if not hasattr(socket, 'SO_PEERCRED'):
+            return True
+        creds = conn.getsockopt(socket.SOL_SOCKET, socket.SO_PEERCRED, struct.calcsize('3i'))
+        (pid, uid, gid) = struct.unpack('3i', creds)
+        return uid == os.getuid()
+
+    def isCwdAllowed(self, cwd):
+        if cwd is None:
+            return True
+        cwd = os.path.realpath(cwd)
+        return cwd == self.baseDir or cwd.startswith(os.path.join(self.baseDir, ''))
+
+    def stop(self, signum, frame):
+        self.running = False
+        for pid in self.workers:
+            try:
+                os.kill(pid, signal.SIGTERM)
+            except ProcessLookupError:
+                pass
+
+    def spawnWorker(self):
+        pid = os.fork()
+        if pid == 0:
+            signal.signal(signal.SIGTERM, signal.SIG_DFL)
+            signal.signal(signal.SIGINT, signal.SIG_DFL)
+            try:
+                self.workerLoop()
+            finally:
+                os._exit(0)
+        self.workers.add(pid)
+
+    def workerLoop(self):
+        for i in range(self.maxJobs):
+            (conn, addr) = self.sock.accept()
+            with conn:
+                if not self.isPeerAllowed(conn):
+                    self.log.error("connection from another user rejected")
+                    continue
+                try:
+                    conn.sendall(b'{"ready": true}\n')
+                    line = readLine(conn)
+                except OSError:
+                    continue
+                if len(line) == 0:
+                    # the client stopped waiting for a worker and runs the job itself
+                    continue
+                try:
+                    request = json.loads(line)
+                    answer = self.runJob(request, conn)
+                except Exception as e:
+                    traceback.print_exc(file=sys.stdout)
+                    answer = {"ret": -1, "errorMsg": str(e)}
+                try:
+                    conn.sendall((json.dumps(answer)+'\n').encode('utf-8'))
+                except OSError:
+                    pass
+
+    def getTimeout(self, request):
+        timeout = request.get("timeout", None)
+        if timeout is not None:
+            return timeout
+        i = getParamIndex(request["params"], '--runtime')
+        if i is not None:
+            return int(request["params"][i]) + self.timeoutMargin
+        return None
+
+    def runJob(self, request, conn):
+        params = request["params"]
+        if not self.isCwdAllowed(request.get("cwd", None)):
+            raise ValueError("job working directory {} not in {}".format(request["cwd"], self.baseDir))
+        outputFile = None
+        i = getParamIndex(params, '--output')
+        if i is not None:
+            (fd, outputFile) = tempfile.mkstemp(suffix='.json', prefix='varia_job_')
+            os.close(fd)
+            params = params[:i] + [outputFile] + params[i+1:]
+        try:
+            answer = self.runJobProcess(request, params, conn)
+            answer["output"] = readOutput(outputFile)
+            return answer
+        finally:
+            if outputFile is not None:
+                os.remove(outputFile)
+
+    def runJobProcess(self, request, params, conn):
+        timeout = self.getTimeout(request)
+        start = time.time()
+        pid = os.fork()
+        if pid == 0:
+            self.sock.close()
+            os._exit(self.runScript(params, request.get("cwd", None)))
+        while True:
+            (wpid, status) = os.waitpid(pid, os.WNOHANG)
+            if wpid != 0:
+                break
+            if timeout is not None and time.time() - start > timeout:
+                os.kill(pid, signal.SIGKILL)
+                os.waitpid(pid, 0)
+                self.log.info("job killed after {}s: {}".format(timeout, params))
+                return {"ret": -signal.SIGKILL, "duration": time.time() - start}
+            if isClosed(conn):
+                # the client gave up on the answer and runs the job itself
+                os.kill(pid, signal.SIGKILL)
+                os.waitpid(pid, 0)
+                self.log.info("job killed, client gone: {}".format(params))
+                return {"ret": -signal.SIGKILL, "duration": time.time() - start}
+            time.sleep(0.005)
+        if os.WIFSIGNALED(status):
+            ret = -os.WTERMSIG(status)
+        else:
+            ret = os.WEXITSTATUS(status)
+        return {"ret": ret, "duration": time.time() - start}
+
+    def runScript(self, params, cwd):
+        # executed in the job process, return exit code
+        if cwd is not None:
+            os.chdir(cwd)
+        sys.argv = [self.script] + params
+        try:
+            runpy.run_path(self.script, run_name='__main__')
+            ret = 0
+        except SystemExit as e:
+            if e.code is None:
+                ret = 0
+            elif isinstance(e.code, int):
+                ret = e.code & 0xff
+            else:
+                print(e.code)
+                ret = 1
+        except BaseException:
+            traceback.print_exc(file=sys.stdout)
+            ret = 1
+        sys.stdout.flush()
+        sys.stderr.flush()
+        return ret
+
+def readLine(conn):
+    data = b''
+    while not data.endswith(b'\n'):
+        chunk = conn.recv(65536)
+        if not chunk:
+            break
+        data += chunk
+    return data.decode('utf-8')
+
+# the client closed its side of the connection
+def isClosed(conn):
+    try:
+        return len(conn.recv(1, socket.MSG_PEEK | socket.MSG_DONTWAIT)) == 0
+    except BlockingIOError:
+        return False
+    except OSError:
+        return True
+
+# index of the value of a script parameter, None if it's not set
+def getParamIndex(params, name):
+    if name in params:
+        i = params.index(name) + 1
+        if i < len(params):
+            return i
+    return None
+
+# content of the script output file, None if it was not written
+def readOutput(outputFile):
+    if outputFile is None or not os.path.exists(outputFile):
+        return None
+    with open(outputFile) as f:
+        output = f.read()
+    return output if len(output) > 0 else None
+
+# run the script through the pool, return (exit code, content of its --output file or None).
+# params: full command line ([python, script, args...]), like for subprocess.call.
+# falls back to a new process when the pool is not running or when no worker is
+# free after readyTimeout, the job is then not sent to the pool.
+# with a --runtime parameter, the answer is waited for until the pool has killed
+# the job (runtime + timeoutMargin) plus timeoutMargin. if the pool fails to answer,
+# the connection is closed so that the worker kills the job (its output goes to a
+# file private to the job), and the job is run in a new process.
+def callScript(params, socketPath=defaultSocketPath, timeoutMargin=defaultTimeoutMargin, readyTimeout=defaultReadyTimeout):
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    sock.settimeout(readyTimeout)
+    try:
+        sock.connect(socketPath)
+        json.loads(readLine(sock))
+    except (OSError, ValueError) as e:
+        sock.close()
+        utils.log.get('WorkerPool').debug("pool not available, run the job in a new process: {}".format(e))
+        return callScriptProcess(params)
+    with sock:
+        i = getParamIndex(params, '--runtime')
+        sock.settimeout(int(params[i]) + 2*timeoutMargin if i is not None else None)
+        try:
+            request = {"params": params[2:], "cwd": os.getcwd()}
+            sock.sendall((json.dumps(request)+'\n').encode('utf-8'))
+            answer = json.loads(readLine(sock))
+        except (OSError, ValueError) as e:
+            answer = None
+            utils.log.get('WorkerPool').error("no answer from the pool, run the job in a new process: {}".format(e))
+    if answer is None:
+        return callScriptProcess(params)
+    if "errorMsg" in answer:
+        utils.log.get('WorkerPool').error("job failed in the pool: {}".format(answer["errorMsg"]))
+    return (answer["ret"], answer.get("output", None))
+
+def callScriptProcess(params):
+    ret = subprocess.call(params)
+    i = getParamIndex(params, '--output')
+    return (ret, readOutput(params[i] if i is not None else None))
@@ -1,4 +1,4 @@
-import sys, os, urllib, tempfile, random, subprocess, base64, json, uuid
+import sys, os, urllib, tempfile, random, base64, json, uuid
 from datetime import datetime
 
 from web.backend.utils import loadPresetsList, loadRandoPresetsList, displayNames
@@ -6,6 +6,7 @@ from web.backend.utils import validateWebServiceParams, getCustomMapping, localI
 from utils.utils import getRandomizerDefaultParameters, getDefaultMultiValues, PresetLoader, getPresetDir, getPythonExec
 from graph.graph_utils import GraphUtils
 from utils.db import DB
+from utils.workerpool import callScript
 from logic.logic import Logic
 from utils.objectives import Objectives
 
@@ -272,14 +273,16 @@ class Randomizer(object):
 
         print("before calling: {}".format(' '.join(params)))
         start = datetime.now()
-        ret = subprocess.call(params)
+        # use the warm randomizer pool if it's running (randomizer_pool.py),
+        # the json output is returned by the pool
+        (ret, output) = callScript(params)
         end = datetime.now()
         duration = (end - start).total_seconds()
         print("ret: {}, duration: {}s".format(ret, duration))
 
-        if ret == 0:
-            with open(jsonFileName) as jsonFile:
-                locsItems = json.load(jsonFile)
+        # a job can exit without writing its output
+        if ret == 0 and output is not None:
+            locsItems = json.loads(output)
 
             # check if an info message has been returned
             msg = ''
@@ -313,11 +316,10 @@ class Randomizer(object):
         else:
             # extract error from json
             try:
-                with open(jsonFileName) as jsonFile:
-                    msg = json.load(jsonFile)['errorMsg']
-                    if msg[0] == '\n':
-                        msg = msg[1:]
-                        msg = msg.replace('\n', '<br/>')
+                msg = json.loads(output)['errorMsg']
+                if msg[0] == '\n':
+                    msg = msg[1:]
+                    msg = msg.replace('\n', '<br/>')
             except:
                 msg = "randomizerWebService: something wrong happened"
 
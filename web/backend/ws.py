@@ -1,4 +1,4 @@
-import os, uuid, json, subprocess, tempfile, re
+import os, uuid, json, subprocess, tempfile, re, traceback
 from datetime import datetime
 
 from web.backend.utils import raiseHttp, locName4isolver, generateJsonROM, getInt
@@ -7,6 +7,7 @@ from graph.graph_utils import GraphUtils
 from utils.utils import removeChars, getPresetDir, getPythonExec
 from utils.doorsmanager import DoorsManager
 from utils.db import DB
+from solver.sessionEngine import sessionEngine, SessionEngine, SessionEngineBusy
 
 from gluon.validators import IS_ALPHANUMERIC, IS_LENGTH, IS_NOT_EMPTY
 
@@ -133,6 +134,12 @@ class WS(object):
         if "state" not in self.session:
             raiseHttp(400, "Missing Solver state in the session", True)
 
+        # first try with the in process session engine
+        state = self.callSolverActionInProcess(scope, action, parameters)
+        if state is not None:
+            self.session["state"] = state
+            return self.returnState()
+
         (fd1, jsonInFileName) = tempfile.mkstemp()
         (fd2, jsonOutFileName) = tempfile.mkstemp()
         (fd3, errFile) = tempfile.mkstemp()
@@ -246,6 +253,30 @@ class WS(object):
             os.remove(errFile)
             raiseHttp(400, msg, True)
 
+    # return the new state, or None if the action has to be done in a solver process
+    def callSolverActionInProcess(self, scope, action, parameters):
+        params = SessionEngine.getSolverParams(scope, action, self.mode, parameters)
+        if params is None:
+            return None
+        sessionId = (self.caller.response.session_id, 'plando' if self.mode in ["plando", "debug"] else 'tracker')
+        # save the escape timer at every step to avoid loosing its value,
+        # the live solver gets it from the state
+        if self.vars.escapeTimer != None:
+            self.session["state"]["escapeTimer"] = self.vars.escapeTimer
+        start = datetime.now()
+        try:
+            state = sessionEngine.iterate(sessionId, self.session["state"], scope, action, params)
+        except SessionEngineBusy as e:
+            print("in process isolver busy, fallback to solver process: {}".format(e))
+            return None
+        except Exception as e:
+            # same error as when the solver process fails, the action is not done again
+            print("in process isolver failed: {}".format(traceback.format_exc()))
+            raiseHttp(400, "Something wrong happened while iteratively solving the ROM", True)
+        duration = (datetime.now() - start).total_seconds()
+        print("in process isolver {} {}: duration: {}s".format(scope, action, duration))
+        return state
+
     def addError(self, state, params, tmpErr):
         errDir = os.path.expanduser("~/web2py/applications/solver/errors")
         if os.path.isdir(errDir):
@@ -159,6 +159,9 @@ create table if not exists solver_stats (
   -- to join with extend_stats
   ext_id int unsigned not null,
   name varchar(8) not null,
-  value int unsigned default 0
+  value int unsigned default 0,
+  -- how many seeds have this value (aggregated stats insert one row for several seeds)
+  count int unsigned default 1
 );
+-- alter table solver_stats add count int unsigned default 1;
 create index solver_stats_idx01 on solver_stats(ext_id, name);